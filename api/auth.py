@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, TypeVar
 
 import jwt
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from jwt import ExpiredSignatureError, InvalidTokenError
 from passlib.context import CryptContext
@@ -28,6 +34,85 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# Worker threads that verify passwords off the event loop
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+_password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+
+# Lifetime (seconds) and capacity of the user record and token claim caches
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "1024"))
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Thread-safe LRU cache whose entries expire after a time to live.
+
+    Once `maxsize` entries are stored, setting a new key evicts the least
+    recently used one. Expired entries are dropped when they are read.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic):
+        """
+        Create an empty cache.
+
+        Parameters:
+            maxsize (int): Maximum number of entries kept.
+            ttl (float): Default lifetime of an entry in seconds.
+            timer (Callable[[], float]): Clock returning seconds; replaceable in tests.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Return the live value stored for `key`, or `None` if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._timer():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Store `value` for `key` for `ttl` seconds (the cache default when omitted).
+        """
+        expires_at = self._timer() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """
+        Remove the entry for `key`, if any.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+
 
 # Models
 class Token(BaseModel):
@@ -62,6 +147,12 @@ def _is_truthy(value: str | None) -> bool:
     return False if not value else value.lower() in ("true", "1", "yes", "on")
 
 
+# User records by username; invalidated by UserRepository.create_or_update_user
+user_cache: TTLCache[str, UserInDB] = TTLCache(AUTH_CACHE_MAX_ENTRIES, AUTH_CACHE_TTL_SECONDS)
+# Verified claims by encoded token; entries never outlive the token's `exp`
+token_claims_cache: TTLCache[str, Dict[str, Any]] = TTLCache(AUTH_CACHE_MAX_ENTRIES, AUTH_CACHE_TTL_SECONDS)
+
+
 class UserRepository:
     """Repository for accessing user credential records."""
 
@@ -148,6 +239,7 @@ class UserRepository:
                 1 if is_disabled else 0,
             ),
         )
+        user_cache.invalidate(username)
 
 
 initialize_schema()
@@ -164,6 +256,21 @@ def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def verify_password_async(plain_password, hashed_password) -> bool:
+    """
+    Verify a password like `verify_password` on the password hashing thread pool.
+
+    The key derivation takes tens of milliseconds; running it on
+    `_password_executor` keeps the event loop serving other requests
+    meanwhile, and the bounded pool caps the CPU spent on concurrent logins.
+
+    Returns:
+        `True` if the plaintext password matches the hashed password, `False` otherwise.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, verify_password, plain_password, hashed_password)
+
+
 def get_password_hash(password):
     """
     Hash a plaintext password using the configured password-hashing context.
@@ -200,9 +307,9 @@ def _seed_credentials_from_env(repository: UserRepository) -> None:
     repository.create_or_update_user(
         username=username,
         hashed_password=hashed_password,
-        email=admin_email,
-        full_name=admin_full_name,
-        disabled=admin_disabled,
+        user_email=admin_email,
+        user_full_name=admin_full_name,
+        is_disabled=admin_disabled,
     )
 
 
@@ -221,6 +328,10 @@ def get_user(
     """
     Retrieve a user by username.
 
+    Lookups through the module-level `user_repository` are served from
+    `user_cache` for up to `AUTH_CACHE_TTL_SECONDS`; the returned instance is
+    shared and must not be modified.
+
     Parameters:
         repository (Optional[UserRepository]): Repository to query;
             if omitted the module-level `user_repository` is used.
@@ -229,8 +340,39 @@ def get_user(
         Optional[UserInDB]: The matching UserInDB instance, or `None` if no
             user exists with that username.
     """
-    repo = repository or user_repository
-    return repo.get_user(username)
+    if repository is not None and repository is not user_repository:
+        return repository.get_user(username)
+    user = user_cache.get(username)
+    if user is None:
+        user = user_repository.get_user(username)
+        if user is not None:
+            user_cache.set(username, user)
+    return user
+
+
+async def get_user_async(
+    username: str,
+    repository: Optional[UserRepository] = None,
+) -> Optional[UserInDB]:
+    """
+    Retrieve a user like `get_user` without blocking the event loop.
+
+    Cached users are returned directly; a repository lookup runs on the
+    threadpool, so a slow credential store does not stall other requests.
+
+    Parameters:
+        repository (Optional[UserRepository]): Repository to query;
+            if omitted the module-level `user_repository` is used.
+
+    Returns:
+        Optional[UserInDB]: The matching UserInDB instance, or `None` if no
+            user exists with that username.
+    """
+    if repository is None or repository is user_repository:
+        user = user_cache.get(username)
+        if user is not None:
+            return user
+    return await run_in_threadpool(get_user, username, repository)
 
 
 def authenticate_user(
@@ -258,6 +400,32 @@ def authenticate_user(
     return user
 
 
+async def authenticate_user_async(
+    username: str,
+    password: str,
+    repository: Optional[UserRepository] = None,
+) -> UserInDB | bool:
+    """
+    Authenticate a username and password like `authenticate_user`, verifying
+    the password off the event loop.
+
+    Parameters:
+        username (str): Username to authenticate.
+        password (str): Plaintext password to verify.
+        repository (Optional[UserRepository]): Repository to query for the user; if
+            omitted the module-level repository is used.
+
+    Returns:
+        UserInDB when authentication succeeds, `False` otherwise.
+    """
+    user = await get_user_async(username, repository=repository)
+    if not user:
+        return False
+    if not await verify_password_async(password, user.hashed_password):
+        return False
+    return user
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """
     Create a JWT access token that includes an expiry (`exp`) claim.
@@ -283,6 +451,33 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 
+def decode_token(token: str) -> Dict[str, Any]:
+    """
+    Verify a JWT and return its claims, caching them in `token_claims_cache`.
+
+    Repeated requests with the same token skip the signature check. A cached
+    entry expires no later than the token's `exp` claim, so expired tokens
+    are decoded (and rejected) again.
+
+    Returns:
+        Dict[str, Any]: The token's claims.
+
+    Raises:
+        ExpiredSignatureError: If the token has expired.
+        InvalidTokenError: If the token is invalid.
+    """
+    payload = token_claims_cache.get(token)
+    if payload is None:
+        # Explicitly specify algorithms parameter to prevent algorithm confusion attacks
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        lifetime = AUTH_CACHE_TTL_SECONDS
+        if "exp" in payload:
+            lifetime = min(lifetime, payload["exp"] - time.time())
+        if lifetime > 0:
+            token_claims_cache.set(token, payload, ttl=lifetime)
+    return payload
+
+
 async def get_current_user(token: str = Depends(oauth2_scheme)):
     """
     Return the user represented by the provided JWT.
@@ -308,8 +503,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        # Explicitly specify algorithms parameter to prevent algorithm confusion attacks
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_token(token)
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
@@ -318,7 +512,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         raise expired_exception from e
     except InvalidTokenError as e:
         raise credentials_exception from e
-    user = get_user(token_data.username)
+    user = await get_user_async(token_data.username)
     if user is None:
         raise credentials_exception
     return user
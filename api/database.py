@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import atexit
 import os
+import queue
 import sqlite3
 import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Dict, Iterator
 from urllib.parse import unquote, urlparse
 
+from src.data.database import sqlite_pragma_statements, sqlite_pragmas_from_env
+
 
 def _get_database_url() -> str:
     """
@@ -85,11 +88,113 @@ def _resolve_sqlite_path(url: str) -> str:
 DATABASE_URL = _get_database_url()
 DATABASE_PATH = _resolve_sqlite_path(DATABASE_URL)
 
+# Upper bound on open connections to a file-backed database, and how long a
+# caller waits for one when all are checked out
+POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "8"))
+POOL_TIMEOUT = float(os.getenv("DATABASE_POOL_TIMEOUT", "30"))
+
+# Connection profile of the credential store, kept apart from the asset graph
+# store. Each pragma can be overridden with DATABASE_SQLITE_<NAME> (for example
+# DATABASE_SQLITE_SYNCHRONOUS=NORMAL); an empty value leaves the SQLite default.
+CREDENTIAL_STORE_SQLITE_PRAGMAS: Dict[str, str] = {
+    # Set first so that switching the journal mode waits for locks too
+    "busy_timeout": "5000",
+    # Pooled readers do not block a credential update (and vice versa)
+    "journal_mode": "WAL",
+    # Credential writes are rare; keep each one durable
+    "synchronous": "FULL",
+}
+_PRAGMA_STATEMENTS = sqlite_pragma_statements(
+    sqlite_pragmas_from_env(CREDENTIAL_STORE_SQLITE_PRAGMAS, prefix="DATABASE_SQLITE_")
+)
+
 # Module-level shared in-memory connection
 _MEMORY_CONNECTION: sqlite3.Connection | None = None
 _MEMORY_CONNECTION_LOCK = threading.Lock()
 
 
+class ConnectionPool:
+    """
+    Bounded, thread-safe pool of SQLite connections.
+
+    At most ``max_size`` connections are checked out at once; further callers
+    block for up to ``timeout`` seconds. Idle connections are reused most
+    recently released first and checked with ``SELECT 1`` on checkout, so a
+    broken connection is replaced instead of handed out.
+    """
+
+    def __init__(self, factory: Callable[[], sqlite3.Connection], max_size: int, timeout: float) -> None:
+        if max_size < 1:
+            raise ValueError("Connection pool size must be a positive integer")
+        self._factory = factory
+        self._timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._closed = False
+
+    def acquire(self) -> sqlite3.Connection:
+        """
+        Check out a healthy connection, opening a new one if none is idle.
+
+        Raises:
+            TimeoutError: If no connection becomes available within the timeout.
+        """
+        if not self._slots.acquire(timeout=self._timeout):
+            raise TimeoutError(f"No database connection available after {self._timeout} seconds")
+        try:
+            while True:
+                try:
+                    connection = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._factory()
+                if self._is_healthy(connection):
+                    return connection
+                self._discard(connection)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection: sqlite3.Connection) -> None:
+        """Return a checked-out connection, rolling back any open transaction."""
+        try:
+            if self._closed:
+                self._discard(connection)
+                return
+            try:
+                if connection.in_transaction:
+                    connection.rollback()
+            except sqlite3.Error:
+                self._discard(connection)
+                return
+            self._idle.put(connection)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Close every idle connection; connections released later are closed too."""
+        self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+    @staticmethod
+    def _is_healthy(connection: sqlite3.Connection) -> bool:
+        try:
+            connection.execute("SELECT 1").fetchone()
+        except sqlite3.Error:
+            return False
+        return True
+
+    @staticmethod
+    def _discard(connection: sqlite3.Connection) -> None:
+        try:
+            connection.close()
+        except sqlite3.Error:
+            pass
+
+
 def _is_memory_db(path: str | None = None) -> bool:
     """
     Determine whether the given or configured database refers to an in-memory
@@ -114,17 +219,35 @@ def _is_memory_db(path: str | None = None) -> bool:
     return False
 
 
-def _connect() -> sqlite3.Connection:
+def _open_connection() -> sqlite3.Connection:
     """
-    Open a configured SQLite connection for the module's database path.
-
+    Open a new SQLite connection to DATABASE_PATH and apply the pragmas once.
 
-    Returns a persistent shared connection when the configured database is
-    in-memory; for file-backed databases, returns a new connection instance.
     The connection has type detection enabled (PARSE_DECLTYPES), allows use from
     multiple threads (check_same_thread=False) and uses sqlite3.Row for rows.
     When the database path is a URI beginning with "file:" the connection is
     opened with URI handling enabled.
+    """
+    connection = sqlite3.connect(
+        DATABASE_PATH,
+        detect_types=sqlite3.PARSE_DECLTYPES,
+        check_same_thread=False,
+        uri=DATABASE_PATH.startswith("file:"),
+    )
+    connection.row_factory = sqlite3.Row
+    for statement in _PRAGMA_STATEMENTS:
+        connection.execute(statement)
+    return connection
+
+
+def _connect() -> sqlite3.Connection:
+    """
+    Open a configured SQLite connection for the module's database path.
+
+    Returns a persistent shared connection when the configured database is
+    in-memory; for file-backed databases, returns a new connection instance
+    that the caller must close. ``get_connection`` borrows from the pool
+    instead.
 
     Returns:
         sqlite3.Connection: A sqlite3 connection to the configured
@@ -135,24 +258,13 @@ def _connect() -> sqlite3.Connection:
     if _is_memory_db():
         with _MEMORY_CONNECTION_LOCK:
             if _MEMORY_CONNECTION is None:
-                _MEMORY_CONNECTION = sqlite3.connect(
-                    DATABASE_PATH,
-                    detect_types=sqlite3.PARSE_DECLTYPES,
-                    check_same_thread=False,
-                    uri=DATABASE_PATH.startswith("file:"),
-                )
-                _MEMORY_CONNECTION.row_factory = sqlite3.Row
+                _MEMORY_CONNECTION = _open_connection()
         return _MEMORY_CONNECTION
 
-    # For file-backed databases, create a new connection each time
-    connection = sqlite3.connect(
-        DATABASE_PATH,
-        detect_types=sqlite3.PARSE_DECLTYPES,
-        check_same_thread=False,
-        uri=DATABASE_PATH.startswith("file:"),
-    )
-    connection.row_factory = sqlite3.Row
-    return connection
+    return _open_connection()
+
+
+_POOL = ConnectionPool(_open_connection, POOL_SIZE, POOL_TIMEOUT)
 
 
 @contextmanager
@@ -160,27 +272,36 @@ def get_connection() -> Iterator[sqlite3.Connection]:
     """
     Provide a context-managed SQLite connection for the configured database.
 
-    For file-backed databases the connection is closed when the context exits;
-    for in-memory databases the shared connection is kept open.
+    For file-backed databases the connection is borrowed from the pool and
+    returned to it, with any uncommitted transaction rolled back, when the
+    context exits; for in-memory databases the shared connection is used.
 
     Returns:
-        sqlite3.Connection: The SQLite connection — closed on context exit for
-            file-backed databases, kept open for in-memory databases.
+        sqlite3.Connection: The SQLite connection — pooled for file-backed
+            databases, shared for in-memory databases.
+
+    Raises:
+        TimeoutError: If every pooled connection stays checked out for
+            POOL_TIMEOUT seconds.
     """
-    connection = _connect()
+    if _is_memory_db():
+        yield _connect()
+        return
+
+    connection = _POOL.acquire()
     try:
         yield connection
     finally:
-        if not _is_memory_db():
-            connection.close()
+        _POOL.release(connection)
 
 
 def _cleanup_memory_connection():
-    """Clean up the global memory connection when the program exits."""
+    """Clean up the global memory connection and pooled connections when the program exits."""
     global _MEMORY_CONNECTION
     if _MEMORY_CONNECTION is not None:
         _MEMORY_CONNECTION.close()
         _MEMORY_CONNECTION = None
+    _POOL.close()
 
 
 atexit.register(_cleanup_memory_connection)
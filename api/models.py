@@ -0,0 +1,15 @@
+"""Persistence models for the API package."""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class UserInDB(BaseModel):
+    """User credential record as stored in the ``user_credentials`` table."""
+
+    username: str
+    email: Optional[str] = None
+    full_name: Optional[str] = None
+    disabled: Optional[bool] = None
+    hashed_password: str
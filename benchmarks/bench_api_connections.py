@@ -0,0 +1,79 @@
+"""Benchmark credential lookups through the api.database connection pool.
+
+Compares a user lookup on a fresh connection per call (the previous
+behaviour, still available as ``_connect``) with the pooled
+``fetch_one``, from several threads, and puts both next to one bcrypt
+verification so the share of connection overhead in a login is visible.
+
+Usage:
+    python benchmarks/bench_api_connections.py [--threads 8] [--lookups 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+QUERY = "SELECT username, hashed_password FROM user_credentials WHERE username = ?"
+
+
+def timed(threads: int, lookups: int, lookup) -> float:
+    """Return the mean latency in microseconds of ``lookup`` run from ``threads`` threads."""
+
+    def worker() -> None:
+        for i in range(lookups):
+            lookup(f"user{i % 100}")
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return (time.perf_counter() - start) / (threads * lookups) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--lookups", type=int, default=2_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{Path(tmp) / 'credentials.db'}"
+        import bcrypt
+
+        from api import database
+
+        database.initialize_schema()
+        for i in range(100):
+            database.execute(
+                "INSERT INTO user_credentials (username, hashed_password) VALUES (?, ?)", (f"user{i}", "x")
+            )
+
+        def per_call(username: str):
+            connection = database._connect()
+            try:
+                return connection.execute(QUERY, (username,)).fetchone()
+            finally:
+                connection.close()
+
+        def pooled(username: str):
+            return database.fetch_one(QUERY, (username,))
+
+        print(f"connect per call: {timed(args.threads, args.lookups, per_call):.0f} us/lookup")
+        print(f"pooled:           {timed(args.threads, args.lookups, pooled):.0f} us/lookup")
+
+        hashed = bcrypt.hashpw(b"secret", bcrypt.gensalt())
+        start = time.perf_counter()
+        bcrypt.checkpw(b"secret", hashed)
+        print(f"bcrypt verify:    {(time.perf_counter() - start) * 1e6:.0f} us")
+        database._POOL.close()
+
+
+if __name__ == "__main__":
+    main()
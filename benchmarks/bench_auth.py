@@ -0,0 +1,80 @@
+"""Benchmark the per-request cost of authentication in api.auth.
+
+Measures ``get_current_user`` with the user and token claim caches cleared
+before every call (a JWT signature check plus a credential lookup) and with
+warm caches, then times a burst of concurrent logins through
+``authenticate_user_async`` while a ticker coroutine measures how late the
+event loop runs it.
+
+Usage:
+    python benchmarks/bench_auth.py [--requests 5000] [--logins 16]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+
+async def loop_lag(stop: asyncio.Event, interval: float = 0.001) -> float:
+    """Return the worst delay in milliseconds of a ``interval``-second sleep until ``stop`` is set."""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - start - interval)
+    return worst * 1e3
+
+
+async def logins(count: int, login) -> tuple[float, float]:
+    """Run ``count`` concurrent logins; return the total seconds and the worst loop lag in ms."""
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(loop_lag(stop))
+    start = time.perf_counter()
+    results = await asyncio.gather(*(login("bench", "secret") for _ in range(count)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    assert all(results)
+    return elapsed, await ticker
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--logins", type=int, default=16)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{Path(tmp) / 'credentials.db'}"
+        os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-of-at-least-32-bytes")
+        os.environ.update(ADMIN_USERNAME="bench", ADMIN_PASSWORD="secret")
+        from api import auth
+
+        token = auth.create_access_token({"sub": "bench"})
+
+        async def per_request(cold: bool) -> float:
+            start = time.perf_counter()
+            for _ in range(args.requests):
+                if cold:
+                    auth.user_cache.clear()
+                    auth.token_claims_cache.clear()
+                await auth.get_current_user(token)
+            return (time.perf_counter() - start) / args.requests * 1e6
+
+        print(f"get_current_user, cold caches: {asyncio.run(per_request(cold=True)):.1f} us/request")
+        print(f"get_current_user, warm caches: {asyncio.run(per_request(cold=False)):.1f} us/request")
+
+        async def sync_login(username: str, password: str):
+            return auth.authenticate_user(username, password)
+
+        for name, login in (("on event loop", sync_login), ("on hash pool", auth.authenticate_user_async)):
+            elapsed, lag = asyncio.run(logins(args.logins, login))
+            print(f"{args.logins} logins {name}: {elapsed * 1e3:.0f} ms, worst event loop lag {lag:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
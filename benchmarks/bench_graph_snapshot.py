@@ -0,0 +1,88 @@
+"""Benchmark the graph cache formats of ``RealDataFetcher``: indented JSON vs. binary snapshot.
+
+Builds a random graph, then writes and reads it back through
+``_save_to_cache``/``_load_from_cache`` with a ``.json`` and a ``.graphsnap``
+path, reporting file size and timings for each.
+
+Usage:
+    python benchmarks/bench_graph_snapshot.py [--assets 20000] [--relationships 500000] [--events 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from src.data.graph_snapshot import SNAPSHOT_SUFFIX
+from src.data.real_data_fetcher import _load_from_cache, _save_to_cache
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import AssetClass, Equity, RegulatoryActivity, RegulatoryEvent
+
+
+def build_graph(num_assets: int, num_relationships: int, num_events: int) -> AssetRelationshipGraph:
+    """Return a graph of random assets, relationships and events, built without the add methods."""
+    rng = random.Random(0)
+    graph = AssetRelationshipGraph()
+    graph.assets = {
+        f"A{i}": Equity(
+            id=f"A{i}",
+            symbol=f"S{i}",
+            name=f"Asset {i}",
+            asset_class=AssetClass.EQUITY,
+            sector=f"Sector {i % 11}",
+            price=100.0 + i,
+            pe_ratio=rng.random() * 30 if i % 2 else None,
+        )
+        for i in range(num_assets)
+    }
+    for _ in range(num_relationships):
+        rel_type = rng.choice(("same_sector", "correlation", "corporate_link"))
+        graph.relationships.setdefault(f"A{rng.randrange(num_assets)}", []).append(
+            (f"A{rng.randrange(num_assets)}", rel_type, rng.random())
+        )
+    graph.regulatory_events = [
+        RegulatoryEvent(
+            id=f"E{i}",
+            asset_id=f"A{rng.randrange(num_assets)}",
+            event_type=RegulatoryActivity.EARNINGS_REPORT,
+            date="2024-01-15",
+            description=f"Event {i}",
+            impact_score=rng.random(),
+            related_assets=[f"A{rng.randrange(num_assets)}" for _ in range(3)],
+        )
+        for i in range(num_events)
+    ]
+    return graph
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets", type=int, default=20_000)
+    parser.add_argument("--relationships", type=int, default=500_000)
+    parser.add_argument("--events", type=int, default=5_000)
+    args = parser.parse_args()
+
+    graph = build_graph(args.assets, args.relationships, args.events)
+    with tempfile.TemporaryDirectory() as tmp:
+        for suffix in (".json", SNAPSHOT_SUFFIX):
+            path = Path(tmp) / f"graph{suffix}"
+            start = time.perf_counter()
+            _save_to_cache(graph, path)
+            saved = time.perf_counter() - start
+
+            start = time.perf_counter()
+            loaded = _load_from_cache(path)
+            elapsed = time.perf_counter() - start
+
+            assert len(loaded.assets) == len(graph.assets)
+            print(
+                f"{suffix:<10} {path.stat().st_size / 2**20:8.1f} MiB  "
+                f"save {saved:6.2f} s  load {elapsed:6.2f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Benchmark graph hydration: ``AssetGraphRepository.load_graph`` vs. the naive ORM path.
+
+The naive path lists assets and relationships as ORM entities and lazy loads
+``RegulatoryEventORM.related_assets`` once per event before feeding everything
+through the ``AssetRelationshipGraph`` add methods.
+
+Usage:
+    python benchmarks/bench_load_graph.py [--relationships 1000000] [--assets 50000] [--events 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import lazyload
+
+from src.data.database import create_session_factory, init_db
+from src.data.db_models import EventTypeORM, RegulatoryEventAssetORM, RegulatoryEventORM, lookup_ids
+from src.data.repository import AssetGraphRepository, RelationshipRecord
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import AssetClass, Equity, RegulatoryActivity
+
+
+def seed(repository: AssetGraphRepository, num_assets: int, num_relationships: int, num_events: int) -> None:
+    """Populate the database with random assets, relationships and events."""
+    rng = random.Random(0)
+    repository.upsert_assets(
+        Equity(
+            id=f"A{i}",
+            symbol=f"S{i}",
+            name=f"Asset {i}",
+            asset_class=AssetClass.EQUITY,
+            sector=f"Sector {i % 11}",
+            price=100.0,
+        )
+        for i in range(num_assets)
+    )
+    repository.upsert_relationships(
+        RelationshipRecord(
+            f"A{rng.randrange(num_assets)}",
+            f"A{rng.randrange(num_assets)}",
+            rng.choice(("same_sector", "correlation", "corporate_link")),
+            rng.random(),
+            rng.random() < 0.3,
+        )
+        for _ in range(num_relationships)
+    )
+    session = repository.session
+    earnings_type_id = lookup_ids(session, EventTypeORM, [RegulatoryActivity.EARNINGS_REPORT.value])[
+        RegulatoryActivity.EARNINGS_REPORT.value
+    ]
+    session.execute(
+        RegulatoryEventORM.__table__.insert(),
+        [
+            {
+                "id": f"E{i}",
+                "asset_id": f"A{rng.randrange(num_assets)}",
+                "event_type_id": earnings_type_id,
+                "date": "2024-01-15",
+                "description": "Earnings",
+                "impact_score": 0.5,
+            }
+            for i in range(num_events)
+        ],
+    )
+    session.execute(
+        RegulatoryEventAssetORM.__table__.insert(),
+        [
+            {"event_id": f"E{i}", "asset_id": f"A{j}"}
+            for i in range(num_events)
+            for j in rng.sample(range(num_assets), 3)
+        ],
+    )
+    session.commit()
+
+
+def load_naive(repository: AssetGraphRepository) -> AssetRelationshipGraph:
+    """Hydrate a graph through ORM entities and the graph add methods."""
+    graph = AssetRelationshipGraph()
+    for asset in repository.list_assets():
+        graph.add_asset(asset)
+    for record in repository.list_relationships():
+        graph.add_relationship(
+            record.source_id,
+            record.target_id,
+            record.relationship_type,
+            record.strength,
+            bidirectional=record.bidirectional,
+        )
+    events = repository.session.execute(
+        select(RegulatoryEventORM).options(lazyload(RegulatoryEventORM.related_assets))
+    ).scalars()
+    for record in events:
+        graph.add_regulatory_event(repository._to_regulatory_event_model(record))
+    return graph
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets", type=int, default=50_000)
+    parser.add_argument("--relationships", type=int, default=1_000_000)
+    parser.add_argument("--events", type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        init_db(engine)
+        factory = create_session_factory(engine)
+
+        with factory() as session:
+            start = time.perf_counter()
+            seed(AssetGraphRepository(session), args.assets, args.relationships, args.events)
+            print(f"seed: {time.perf_counter() - start:.2f}s")
+
+        for name, loader in (("naive", load_naive), ("load_graph", AssetGraphRepository.load_graph)):
+            with factory() as session:
+                start = time.perf_counter()
+                graph = loader(AssetGraphRepository(session))
+                elapsed = time.perf_counter() - start
+            edges = sum(len(rels) for rels in graph.relationships.values())
+            print(f"{name}: {elapsed:.2f}s ({len(graph.assets)} assets, {edges} edges)")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
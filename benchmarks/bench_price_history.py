@@ -0,0 +1,69 @@
+"""Benchmark price history ingestion from a DataFrame and per-asset range reads.
+
+Usage:
+    python benchmarks/bench_price_history.py [--assets 1000] [--days 2520]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+
+from src.data.database import create_session_factory, init_db, session_scope
+from src.data.repository import AssetGraphRepository
+from src.models.financial_models import AssetClass, Equity
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets", type=int, default=1_000)
+    parser.add_argument("--days", type=int, default=2_520)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    asset_ids = [f"A{i}" for i in range(args.assets)]
+    days = pd.bdate_range("2015-01-01", periods=args.days)
+    frame = pd.DataFrame(
+        {
+            "asset_id": np.repeat(asset_ids, args.days),
+            "date": np.tile(days, args.assets),
+            "close": rng.lognormal(size=args.assets * args.days),
+            "volume": rng.integers(1_000, 1_000_000, size=args.assets * args.days).astype(float),
+        }
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        engine = create_engine(f"sqlite:///{db_path}")
+        init_db(engine)
+        factory = create_session_factory(engine)
+        with session_scope(factory) as session:
+            repository = AssetGraphRepository(session)
+            repository.upsert_assets(
+                Equity(id=asset_id, symbol=asset_id, name=asset_id, asset_class=AssetClass.EQUITY, sector="X", price=1)
+                for asset_id in asset_ids
+            )
+            start = time.perf_counter()
+            written = repository.upsert_price_frame(frame)
+            print(f"ingest: {time.perf_counter() - start:.2f}s ({written} bars)")
+        print(f"database size: {db_path.stat().st_size / 1e6:.1f} MB")
+
+        with session_scope(factory) as session:
+            repository = AssetGraphRepository(session)
+            start = time.perf_counter()
+            history = repository.price_history(fields=("close", "volume"))
+            print(f"read all: {time.perf_counter() - start:.2f}s ({len(history)} assets)")
+            start = time.perf_counter()
+            history = repository.price_history(asset_ids[::10], start=days[-252].date(), end=days[-1].date())
+            print(f"read last year of 10%: {time.perf_counter() - start:.2f}s ({len(history)} assets)")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark per-call overhead of the single-relationship repository methods.
+
+Compares the pre-built bound statements used by ``AssetGraphRepository``
+with building a fresh ``select(...).where(...)`` on every call, as the
+methods did before.
+
+Usage:
+    python benchmarks/bench_relationship_lookups.py [--calls 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.pool import StaticPool
+
+from src.data.database import create_session_factory, init_db
+from src.data.db_models import AssetRelationshipORM
+from src.data.repository import AssetGraphRepository, RelationshipRecord
+from src.models.financial_models import AssetClass, Equity
+
+NUM_ASSETS = 1_000
+
+
+class PerCallStatementRepository(AssetGraphRepository):
+    """Repository that builds the relationship lookup statement on every call."""
+
+    def _find_relationship(self, source_id, target_id, rel_type):
+        stmt = select(AssetRelationshipORM).where(
+            AssetRelationshipORM.source_asset_id == source_id,
+            AssetRelationshipORM.target_asset_id == target_id,
+            AssetRelationshipORM.relationship_type == rel_type,
+        )
+        return self.session.execute(stmt).scalar_one_or_none()
+
+
+def _keys(calls: int):
+    return [(f"A{i % NUM_ASSETS}", f"A{(i + 1) % NUM_ASSETS}", "same_sector") for i in range(calls)]
+
+
+def run(repository: AssetGraphRepository, calls: int) -> dict:
+    """Return microseconds per call of each single-relationship method."""
+    keys = _keys(calls)
+    timings = {}
+
+    start = time.perf_counter()
+    for source_id, target_id, rel_type in keys:
+        repository.get_relationship(source_id, target_id, rel_type)
+    timings["get_relationship"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for index, (source_id, target_id, rel_type) in enumerate(keys):
+        repository.add_or_update_relationship(source_id, target_id, rel_type, index / calls, bidirectional=False)
+    repository.session.flush()
+    timings["add_or_update_relationship"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for source_id, target_id, rel_type in keys[:NUM_ASSETS]:
+        repository.delete_relationship(source_id, target_id, rel_type)
+    repository.session.flush()
+    timings["delete_relationship"] = (time.perf_counter() - start) * calls / NUM_ASSETS
+
+    repository.session.rollback()
+    return {name: seconds / calls * 1e6 for name, seconds in timings.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    init_db(engine)
+    session = create_session_factory(engine)()
+    repository = AssetGraphRepository(session)
+    repository.upsert_assets(
+        Equity(id=f"A{i}", symbol=f"S{i}", name=f"Asset {i}", asset_class=AssetClass.EQUITY, sector="X", price=1)
+        for i in range(NUM_ASSETS)
+    )
+    repository.upsert_relationships(
+        RelationshipRecord(source_id, target_id, rel_type, 0.5, False)
+        for source_id, target_id, rel_type in _keys(NUM_ASSETS)
+    )
+    session.commit()
+
+    before = run(PerCallStatementRepository(session), args.calls)
+    after = run(repository, args.calls)
+    print(f"{'method':<28}{'per-call stmt':>16}{'pre-built':>12}{'speed-up':>10}  (us/call, {args.calls} calls)")
+    for name in before:
+        print(f"{name:<28}{before[name]:>16.1f}{after[name]:>12.1f}{before[name] / after[name]:>9.1f}x")
+    session.close()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark per-worker memory of a loaded vs. a memory-mapped graph snapshot.
+
+Writes a random graph as a ``.graphsnap`` snapshot, then starts ``--workers``
+processes that each open it with ``load_snapshot`` or ``open_shared_snapshot``,
+count the relationships (touching every edge page) and report their open
+time and private memory from ``/proc/self/smaps_rollup`` (Linux only).
+Pages of the mapped file are shared between the workers and do not count
+as private.
+
+Usage:
+    python benchmarks/bench_shared_snapshot.py [--workers 4] [--assets 20000] [--relationships 1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_graph_snapshot import build_graph
+from src.data.graph_snapshot import SNAPSHOT_SUFFIX, load_snapshot, open_shared_snapshot, save_snapshot
+
+
+def private_mib() -> float:
+    """Return the private (unshared) memory of this process in MiB."""
+    total_kib = 0
+    for line in Path("/proc/self/smaps_rollup").read_text().splitlines():
+        if line.startswith(("Private_Clean:", "Private_Dirty:")):
+            total_kib += int(line.split()[1])
+    return total_kib / 1024
+
+
+def worker(path: str, shared: bool, results) -> None:
+    baseline = private_mib()
+    start = time.perf_counter()
+    graph = open_shared_snapshot(path) if shared else load_snapshot(path)
+    opened = time.perf_counter() - start
+    edges = sum(len(rels) for rels in graph.relationships.values())
+    results.put((opened, private_mib() - baseline, edges))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--assets", type=int, default=20_000)
+    parser.add_argument("--relationships", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / f"graph{SNAPSHOT_SUFFIX}"
+        save_snapshot(build_graph(args.assets, args.relationships, 0), path)
+        print(f"snapshot: {path.stat().st_size / 2**20:.1f} MiB")
+
+        for shared in (False, True):
+            results = context.Queue()
+            processes = [
+                context.Process(target=worker, args=(str(path), shared, results)) for _ in range(args.workers)
+            ]
+            for process in processes:
+                process.start()
+            reports = [results.get() for _ in processes]
+            for process in processes:
+                process.join()
+
+            opened = max(report[0] for report in reports)
+            private = sum(report[1] for report in reports)
+            label = "open_shared_snapshot" if shared else "load_snapshot"
+            print(
+                f"{label:<21} open {opened * 1e3:8.1f} ms  "
+                f"private memory of {args.workers} workers {private:7.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Benchmark concurrent read/write throughput with and without the SQLite profile.
+
+Writer threads upsert relationships in small transactions while reader threads
+look up incoming edges of random assets, all through one engine from
+``create_engine_from_url``. The "default" run passes ``sqlite_pragmas={}``
+(rollback journal, ``synchronous=FULL``); the "profile" run uses the pragmas
+from ``sqlite_pragmas_from_env``.
+
+Usage:
+    python benchmarks/bench_sqlite_profile.py [--readers 8] [--writers 2] [--seconds 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+
+from src.data.database import create_engine_from_url, create_session_factory, init_db
+from src.data.db_models import AssetRelationshipORM
+from src.data.repository import AssetGraphRepository, RelationshipRecord
+from src.models.financial_models import AssetClass, Equity
+
+NUM_ASSETS = 2_000
+
+
+def seed(factory) -> None:
+    """Create the assets and an initial set of relationships."""
+    rng = random.Random(0)
+    with factory() as session:
+        repository = AssetGraphRepository(session)
+        repository.upsert_assets(
+            Equity(
+                id=f"A{i}",
+                symbol=f"S{i}",
+                name=f"Asset {i}",
+                asset_class=AssetClass.EQUITY,
+                sector="Technology",
+                price=1.0,
+            )
+            for i in range(NUM_ASSETS)
+        )
+        repository.upsert_relationships(
+            RelationshipRecord(
+                f"A{rng.randrange(NUM_ASSETS)}", f"A{rng.randrange(NUM_ASSETS)}", "correlation", 0.5, False
+            )
+            for _ in range(50_000)
+        )
+        session.commit()
+
+
+def run(url: str, pragmas, readers: int, writers: int, seconds: float) -> dict:
+    engine = create_engine_from_url(url, sqlite_pragmas=pragmas)
+    init_db(engine)
+    factory = create_session_factory(engine)
+    seed(factory)
+
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def reader(seed_value: int) -> None:
+        rng = random.Random(seed_value)
+        done = 0
+        with factory() as session:
+            while time.perf_counter() < deadline:
+                stmt = select(AssetRelationshipORM.source_asset_id).where(
+                    AssetRelationshipORM.target_asset_id == f"A{rng.randrange(NUM_ASSETS)}"
+                )
+                session.execute(stmt).all()
+                session.rollback()
+                done += 1
+        with lock:
+            counts["reads"] += done
+
+    def writer(seed_value: int) -> None:
+        rng = random.Random(seed_value)
+        done = errors = 0
+        while time.perf_counter() < deadline:
+            records = [
+                RelationshipRecord(
+                    f"A{rng.randrange(NUM_ASSETS)}", f"A{rng.randrange(NUM_ASSETS)}", "same_sector", rng.random(), False
+                )
+                for _ in range(20)
+            ]
+            try:
+                with factory() as session:
+                    AssetGraphRepository(session).upsert_relationships(records)
+                    session.commit()
+                done += 1
+            except OperationalError:
+                errors += 1
+        with lock:
+            counts["writes"] += done
+            counts["errors"] += errors
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads += [threading.Thread(target=writer, args=(1000 + i,)) for i in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+    return {key: value / seconds if key != "errors" else value for key, value in counts.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    for name, pragmas in (("default", {}), ("profile", None)):
+        with tempfile.TemporaryDirectory() as tmp:
+            url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+            result = run(url, pragmas, args.readers, args.writers, args.seconds)
+        print(
+            f"{name}: {result['reads']:.0f} reads/s, {result['writes']:.0f} write txns/s "
+            f"({result['errors']} lock errors)"
+        )
+
+
+if __name__ == "__main__":
+    main()
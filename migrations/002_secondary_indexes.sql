@@ -0,0 +1,26 @@
+-- Secondary indexes for lookups that are not served by a primary key or unique constraint.
+-- Keep in sync with the Index declarations in src/data/db_models.py.
+
+-- Incoming edges of an asset (reverse traversal, cascades on target delete).
+-- Covers the type filter and the neighbour/strength columns so no table lookup is needed.
+CREATE INDEX IF NOT EXISTS ix_asset_relationships_target
+    ON asset_relationships (target_asset_id, relationship_type, source_asset_id, strength);
+
+-- Events of an asset in date order (cascades on asset delete).
+CREATE INDEX IF NOT EXISTS ix_regulatory_events_asset
+    ON regulatory_events (asset_id, date);
+
+-- Events an asset is related to; covering, so the event ids come straight from the index.
+CREATE INDEX IF NOT EXISTS ix_regulatory_event_assets_asset
+    ON regulatory_event_assets (asset_id, event_id);
+
+-- Asset filters by sector and/or asset class, distinct sectors and class distributions.
+CREATE INDEX IF NOT EXISTS ix_assets_sector
+    ON assets (sector, asset_class);
+CREATE INDEX IF NOT EXISTS ix_assets_asset_class
+    ON assets (asset_class, sector);
+
+-- Bonds of an issuer; partial because issuer_id is NULL for every non-bond asset.
+CREATE INDEX IF NOT EXISTS ix_assets_issuer_id
+    ON assets (issuer_id)
+    WHERE issuer_id IS NOT NULL;
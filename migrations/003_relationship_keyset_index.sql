@@ -0,0 +1,4 @@
+-- Keyset pagination over relationships in (source_asset_id, id) order.
+-- Keep in sync with the Index declarations in src/data/db_models.py.
+CREATE INDEX IF NOT EXISTS ix_asset_relationships_source
+    ON asset_relationships (source_asset_id, id);
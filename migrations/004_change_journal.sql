@@ -0,0 +1,10 @@
+-- Append-only change journal written alongside every repository mutation.
+-- Keep in sync with ChangeJournalORM in src/data/db_models.py.
+-- On PostgreSQL use: seq BIGSERIAL PRIMARY KEY
+CREATE TABLE IF NOT EXISTS change_journal (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    entity TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    entity_key TEXT NOT NULL,
+    data TEXT
+);
@@ -0,0 +1,76 @@
+-- Dictionary-encode relationship and event types: rows store a small-integer id into a lookup table
+-- instead of repeating the type name, which shrinks the tables, uq_relationship and ix_asset_relationships_target.
+-- Keep in sync with RelationshipTypeORM, EventTypeORM and the *_type_id columns in src/data/db_models.py.
+--
+-- SQLite cannot change a column inside a constraint, so both tables are rebuilt; apply this script once.
+-- Foreign keys are switched off so that dropping the old tables does not cascade.
+-- SQLite only: on PostgreSQL apply migrations/postgresql/005_type_lookup_tables.sql instead.
+PRAGMA foreign_keys = OFF;
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS relationship_types (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS event_types (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+INSERT OR IGNORE INTO relationship_types (name)
+    SELECT DISTINCT relationship_type FROM asset_relationships ORDER BY relationship_type;
+
+INSERT OR IGNORE INTO event_types (name)
+    SELECT DISTINCT event_type FROM regulatory_events ORDER BY event_type;
+
+CREATE TABLE asset_relationships_new (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source_asset_id TEXT NOT NULL,
+    target_asset_id TEXT NOT NULL,
+    relationship_type_id INTEGER NOT NULL,
+    strength REAL NOT NULL,
+    bidirectional INTEGER NOT NULL DEFAULT 0,
+    CONSTRAINT fk_relationship_source FOREIGN KEY (source_asset_id) REFERENCES assets(id) ON DELETE CASCADE,
+    CONSTRAINT fk_relationship_target FOREIGN KEY (target_asset_id) REFERENCES assets(id) ON DELETE CASCADE,
+    CONSTRAINT fk_relationship_type FOREIGN KEY (relationship_type_id) REFERENCES relationship_types(id),
+    CONSTRAINT uq_relationship UNIQUE (source_asset_id, target_asset_id, relationship_type_id)
+);
+
+INSERT INTO asset_relationships_new (id, source_asset_id, target_asset_id, relationship_type_id, strength, bidirectional)
+    SELECT r.id, r.source_asset_id, r.target_asset_id, t.id, r.strength, r.bidirectional
+    FROM asset_relationships AS r
+    JOIN relationship_types AS t ON t.name = r.relationship_type;
+
+DROP TABLE asset_relationships;
+ALTER TABLE asset_relationships_new RENAME TO asset_relationships;
+
+CREATE INDEX IF NOT EXISTS ix_asset_relationships_source
+    ON asset_relationships (source_asset_id, id);
+CREATE INDEX IF NOT EXISTS ix_asset_relationships_target
+    ON asset_relationships (target_asset_id, relationship_type_id, source_asset_id, strength);
+
+CREATE TABLE regulatory_events_new (
+    id TEXT PRIMARY KEY,
+    asset_id TEXT NOT NULL,
+    event_type_id INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    description TEXT NOT NULL,
+    impact_score REAL NOT NULL,
+    CONSTRAINT fk_event_asset FOREIGN KEY (asset_id) REFERENCES assets(id) ON DELETE CASCADE,
+    CONSTRAINT fk_event_type FOREIGN KEY (event_type_id) REFERENCES event_types(id)
+);
+
+INSERT INTO regulatory_events_new (id, asset_id, event_type_id, date, description, impact_score)
+    SELECT e.id, e.asset_id, t.id, e.date, e.description, e.impact_score
+    FROM regulatory_events AS e
+    JOIN event_types AS t ON t.name = e.event_type;
+
+DROP TABLE regulatory_events;
+ALTER TABLE regulatory_events_new RENAME TO regulatory_events;
+
+CREATE INDEX IF NOT EXISTS ix_regulatory_events_asset
+    ON regulatory_events (asset_id, date);
+
+COMMIT;
+PRAGMA foreign_keys = ON;
@@ -0,0 +1,14 @@
+-- Daily price bars keyed by (asset_id, date); WITHOUT ROWID clusters each asset's history on consecutive pages.
+-- Keep in sync with PriceHistoryORM in src/data/db_models.py.
+-- On PostgreSQL drop the WITHOUT ROWID clause (the primary key index serves the range reads).
+CREATE TABLE IF NOT EXISTS price_history (
+    asset_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL NOT NULL,
+    volume REAL,
+    PRIMARY KEY (asset_id, date),
+    CONSTRAINT fk_price_history_asset FOREIGN KEY (asset_id) REFERENCES assets(id) ON DELETE CASCADE
+) WITHOUT ROWID;
@@ -0,0 +1,50 @@
+-- PostgreSQL variant of migrations/005_type_lookup_tables.sql: dictionary-encode relationship and event types.
+-- Keep in sync with RelationshipTypeORM, EventTypeORM and the *_type_id columns in src/data/db_models.py.
+--
+-- PostgreSQL alters the columns in place instead of rebuilding the tables; the script runs in one transaction
+-- and can be applied again after a failure.
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS relationship_types (
+    id SMALLSERIAL PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS event_types (
+    id SMALLSERIAL PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+INSERT INTO relationship_types (name)
+    SELECT DISTINCT relationship_type FROM asset_relationships ORDER BY relationship_type
+    ON CONFLICT (name) DO NOTHING;
+
+INSERT INTO event_types (name)
+    SELECT DISTINCT event_type FROM regulatory_events ORDER BY event_type
+    ON CONFLICT (name) DO NOTHING;
+
+ALTER TABLE asset_relationships
+    ADD COLUMN relationship_type_id SMALLINT REFERENCES relationship_types(id);
+UPDATE asset_relationships AS r
+    SET relationship_type_id = t.id
+    FROM relationship_types AS t
+    WHERE t.name = r.relationship_type;
+ALTER TABLE asset_relationships ALTER COLUMN relationship_type_id SET NOT NULL;
+
+-- Dropping the column also drops uq_relationship and ix_asset_relationships_target, which include it
+ALTER TABLE asset_relationships DROP COLUMN relationship_type;
+ALTER TABLE asset_relationships
+    ADD CONSTRAINT uq_relationship UNIQUE (source_asset_id, target_asset_id, relationship_type_id);
+CREATE INDEX IF NOT EXISTS ix_asset_relationships_target
+    ON asset_relationships (target_asset_id, relationship_type_id, source_asset_id, strength);
+
+ALTER TABLE regulatory_events
+    ADD COLUMN event_type_id SMALLINT REFERENCES event_types(id);
+UPDATE regulatory_events AS e
+    SET event_type_id = t.id
+    FROM event_types AS t
+    WHERE t.name = e.event_type;
+ALTER TABLE regulatory_events ALTER COLUMN event_type_id SET NOT NULL;
+ALTER TABLE regulatory_events DROP COLUMN event_type;
+
+COMMIT;
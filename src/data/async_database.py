@@ -0,0 +1,85 @@
+"""Asyncio counterparts of the database helpers in :mod:`src.data.database`.
+
+Requires the ``sqlalchemy[asyncio]`` extra plus ``aiosqlite`` for SQLite or
+``asyncpg`` for PostgreSQL.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Mapping, Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from .database import DEFAULT_DATABASE_URL, Base, _apply_sqlite_pragmas, sqlite_pragmas_from_env
+
+# Async driver used for each backend when the URL names none (or a sync one)
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def to_async_url(url: str) -> str:
+    """Return ``url`` with the async driver of its backend.
+
+    ``sqlite:///x.db`` becomes ``sqlite+aiosqlite:///x.db`` and
+    ``postgresql+psycopg2://...`` becomes ``postgresql+asyncpg://...``.
+    URLs of other backends are returned unchanged.
+    """
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None or parsed.get_driver_name() == driver:
+        return url
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+
+def create_async_engine_from_url(
+    url: Optional[str] = None, sqlite_pragmas: Optional[Mapping[str, str]] = None
+) -> AsyncEngine:
+    """Create an async SQLAlchemy engine for the configured database URL.
+
+    Synchronous URLs are switched to the async driver of their backend.
+    SQLite engines get the same pragma profile as ``create_engine_from_url``.
+    """
+    resolved_url = make_url(to_async_url(url or DEFAULT_DATABASE_URL))
+    if resolved_url.get_backend_name() != "sqlite":
+        return create_async_engine(resolved_url)
+
+    if resolved_url.database in (None, "", ":memory:"):
+        engine = create_async_engine(resolved_url, poolclass=StaticPool)
+    else:
+        engine = create_async_engine(resolved_url)
+    _apply_sqlite_pragmas(engine.sync_engine, sqlite_pragmas_from_env() if sqlite_pragmas is None else sqlite_pragmas)
+    return engine
+
+
+def create_async_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Create an async session factory bound to the supplied engine.
+
+    Instances are not expired on commit, so reading attributes after a commit
+    does not trigger implicit (and in async code, illegal) refresh queries.
+    """
+    return async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+async def init_async_db(engine: AsyncEngine) -> None:
+    """Initialise database schema if it has not been created."""
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+
+@asynccontextmanager
+async def async_session_scope(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncIterator[AsyncSession]:
+    """Provide a transactional scope around a series of async operations."""
+
+    session = session_factory()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
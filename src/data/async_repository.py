@@ -0,0 +1,270 @@
+"""Asyncio data access layer for the asset relationship graph.
+
+Requires the ``sqlalchemy[asyncio]`` extra plus ``aiosqlite`` or ``asyncpg``.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from numpy.typing import ArrayLike
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import Asset, RegulatoryEvent
+
+from .repository import (
+    STREAM_BATCH_SIZE,
+    UPSERT_BATCH_SIZE,
+    AssetGraphRepository,
+    ChangeRecord,
+    DateLike,
+    Page,
+    PriceSeries,
+    RelationshipRecord,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+T = TypeVar("T")
+
+
+class AsyncAssetGraphRepository:
+    """Async version of :class:`AssetGraphRepository` for use from event loops.
+
+    Every operation runs the synchronous repository method through
+    ``AsyncSession.run_sync``: its SQL goes through the async driver, so the
+    event loop is free while the database works, and both repositories share
+    one implementation. ``journal_changes`` is passed on to that repository.
+    """
+
+    def __init__(self, session: AsyncSession, journal_changes: bool = False):
+        self.session = session
+        self.journal_changes = journal_changes
+
+    async def _run(self, operation: Callable[[AssetGraphRepository], T]) -> T:
+        """Run ``operation`` against a sync repository bound to this session."""
+
+        def call(sync_session: Session) -> T:
+            return operation(AssetGraphRepository(sync_session, self.journal_changes))
+
+        return await self.session.run_sync(call)
+
+    # ------------------------------------------------------------------
+    # Asset helpers
+    # ------------------------------------------------------------------
+    async def upsert_asset(self, asset: Asset) -> None:
+        """Create or update an asset record."""
+        await self._run(lambda repository: repository.upsert_asset(asset))
+
+    async def upsert_assets(self, assets: Iterable[Asset], batch_size: int = UPSERT_BATCH_SIZE) -> int:
+        """Create or update many assets in batches; see ``AssetGraphRepository.upsert_assets``."""
+        return await self._run(lambda repository: repository.upsert_assets(assets, batch_size))
+
+    async def list_assets(self) -> List[Asset]:
+        """Return all assets as dataclass instances ordered by id."""
+        return await self._run(AssetGraphRepository.list_assets)
+
+    async def get_assets_map(self) -> Dict[str, Asset]:
+        """Return mapping of asset id to asset dataclass."""
+        return await self._run(AssetGraphRepository.get_assets_map)
+
+    async def delete_asset(self, asset_id: str) -> None:
+        """Delete an asset and cascading relationships/events."""
+        await self._run(lambda repository: repository.delete_asset(asset_id))
+
+    # ------------------------------------------------------------------
+    # Relationship helpers
+    # ------------------------------------------------------------------
+    async def add_or_update_relationship(
+        self,
+        source_id: str,
+        target_id: str,
+        rel_type: str,
+        strength: float,
+        *,
+        bidirectional: bool,
+    ) -> None:
+        """Insert or update a relationship between two assets."""
+        await self._run(
+            lambda repository: repository.add_or_update_relationship(
+                source_id, target_id, rel_type, strength, bidirectional=bidirectional
+            )
+        )
+
+    async def upsert_relationships(
+        self, relationships: Iterable[RelationshipRecord], batch_size: int = UPSERT_BATCH_SIZE
+    ) -> int:
+        """Insert or update many relationships; see ``AssetGraphRepository.upsert_relationships``."""
+        return await self._run(lambda repository: repository.upsert_relationships(relationships, batch_size))
+
+    async def list_relationships(self) -> List[RelationshipRecord]:
+        """Return all relationships from the database."""
+        return await self._run(AssetGraphRepository.list_relationships)
+
+    async def get_relationship(self, source_id: str, target_id: str, rel_type: str) -> Optional[RelationshipRecord]:
+        """Fetch a single relationship if it exists."""
+        return await self._run(lambda repository: repository.get_relationship(source_id, target_id, rel_type))
+
+    async def delete_relationship(self, source_id: str, target_id: str, rel_type: str) -> None:
+        """Remove a relationship."""
+        await self._run(lambda repository: repository.delete_relationship(source_id, target_id, rel_type))
+
+    # ------------------------------------------------------------------
+    # Regulatory events
+    # ------------------------------------------------------------------
+    async def upsert_regulatory_event(self, event: RegulatoryEvent) -> None:
+        """Create or update a regulatory event record."""
+        await self._run(lambda repository: repository.upsert_regulatory_event(event))
+
+    async def list_regulatory_events(self) -> List[RegulatoryEvent]:
+        """Return all regulatory events."""
+        return await self._run(AssetGraphRepository.list_regulatory_events)
+
+    async def delete_regulatory_event(self, event_id: str) -> None:
+        """Delete a regulatory event."""
+        await self._run(lambda repository: repository.delete_regulatory_event(event_id))
+
+    # ------------------------------------------------------------------
+    # Streaming and keyset pagination
+    # ------------------------------------------------------------------
+    async def iter_assets(self, batch_size: int = STREAM_BATCH_SIZE) -> AsyncIterator[Asset]:
+        """Yield all assets ordered by id, reading one keyset page of ``batch_size`` at a time.
+
+        Each page is its own round trip, so the event loop runs between pages
+        and at most one page is held in memory.
+        """
+        async for asset in self._iter_pages(self.page_assets, batch_size):
+            yield asset
+
+    async def iter_relationships(self, batch_size: int = STREAM_BATCH_SIZE) -> AsyncIterator[RelationshipRecord]:
+        """Yield all relationships ordered by source asset, one keyset page of ``batch_size`` at a time."""
+        async for relationship in self._iter_pages(self.page_relationships, batch_size):
+            yield relationship
+
+    async def iter_regulatory_events(self, batch_size: int = STREAM_BATCH_SIZE) -> AsyncIterator[RegulatoryEvent]:
+        """Yield all regulatory events ordered by id, one keyset page of ``batch_size`` at a time."""
+        async for event in self._iter_pages(self.page_regulatory_events, batch_size):
+            yield event
+
+    @staticmethod
+    async def _iter_pages(page: Callable[[Any, int], Awaitable[Page[T]]], batch_size: int) -> AsyncIterator[T]:
+        """Yield the items of ``page`` calls, following ``next_cursor`` until the last page."""
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        after = None
+        while True:
+            result = await page(after, batch_size)
+            for item in result.items:
+                yield item
+            if result.next_cursor is None:
+                return
+            after = result.next_cursor
+
+    async def page_assets(self, after: Optional[str] = None, limit: int = 100) -> Page[Asset]:
+        """Return up to ``limit`` assets with an id greater than ``after``."""
+        return await self._run(lambda repository: repository.page_assets(after, limit))
+
+    async def page_relationships(
+        self, after: Optional[Tuple[str, int]] = None, limit: int = 100
+    ) -> Page[RelationshipRecord]:
+        """Return up to ``limit`` relationships after the ``(source_id, row id)`` cursor."""
+        return await self._run(lambda repository: repository.page_relationships(after, limit))
+
+    async def page_regulatory_events(self, after: Optional[str] = None, limit: int = 100) -> Page[RegulatoryEvent]:
+        """Return up to ``limit`` regulatory events with an id greater than ``after``."""
+        return await self._run(lambda repository: repository.page_regulatory_events(after, limit))
+
+    # ------------------------------------------------------------------
+    # Traversal
+    # ------------------------------------------------------------------
+    async def neighbourhood(
+        self,
+        asset_id: str,
+        depth: int = 1,
+        rel_types: Optional[Iterable[str]] = None,
+        min_strength: float = 0.0,
+    ) -> List[RelationshipRecord]:
+        """Return the relationships near ``asset_id``; see ``AssetGraphRepository.neighbourhood``."""
+        return await self._run(lambda repository: repository.neighbourhood(asset_id, depth, rel_types, min_strength))
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+    async def calculate_metrics(self) -> Dict[str, Any]:
+        """Compute graph metrics in the database; see ``AssetGraphRepository.calculate_metrics``."""
+        return await self._run(AssetGraphRepository.calculate_metrics)
+
+    async def degree_statistics(self) -> Dict[str, float]:
+        """Return the average and maximum node degree; see ``AssetGraphRepository.degree_statistics``."""
+        return await self._run(AssetGraphRepository.degree_statistics)
+
+    # ------------------------------------------------------------------
+    # Change journal
+    # ------------------------------------------------------------------
+    async def changes_since(self, seq: int = 0, limit: int = 1000) -> List[ChangeRecord]:
+        """Return journal entries after ``seq``; see ``AssetGraphRepository.changes_since``."""
+        return await self._run(lambda repository: repository.changes_since(seq, limit))
+
+    async def latest_change_seq(self) -> int:
+        """Return the highest journalled sequence number, or 0 for an empty journal."""
+        return await self._run(AssetGraphRepository.latest_change_seq)
+
+    # ------------------------------------------------------------------
+    # Price history
+    # ------------------------------------------------------------------
+    async def upsert_price_history(
+        self,
+        asset_id: Union[str, ArrayLike],
+        dates: ArrayLike,
+        *,
+        close: ArrayLike,
+        open: Optional[ArrayLike] = None,
+        high: Optional[ArrayLike] = None,
+        low: Optional[ArrayLike] = None,
+        volume: Optional[ArrayLike] = None,
+        batch_size: int = UPSERT_BATCH_SIZE,
+    ) -> int:
+        """Insert or update daily bars from arrays; see ``AssetGraphRepository.upsert_price_history``."""
+        return await self._run(
+            lambda repository: repository.upsert_price_history(
+                asset_id, dates, close=close, open=open, high=high, low=low, volume=volume, batch_size=batch_size
+            )
+        )
+
+    async def upsert_price_frame(self, frame: pd.DataFrame, batch_size: int = UPSERT_BATCH_SIZE) -> int:
+        """Insert or update the bars of a long-format DataFrame; see ``AssetGraphRepository.upsert_price_frame``."""
+        return await self._run(lambda repository: repository.upsert_price_frame(frame, batch_size))
+
+    async def price_history(
+        self,
+        asset_ids: Optional[Iterable[str]] = None,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        fields: Sequence[str] = ("close",),
+    ) -> Dict[str, PriceSeries]:
+        """Return per-asset bar arrays in a date range; see ``AssetGraphRepository.price_history``."""
+        return await self._run(lambda repository: repository.price_history(asset_ids, start, end, fields))
+
+    # ------------------------------------------------------------------
+    # Graph hydration
+    # ------------------------------------------------------------------
+    async def load_graph(self) -> AssetRelationshipGraph:
+        """Build an AssetRelationshipGraph from the database; see ``AssetGraphRepository.load_graph``."""
+        return await self._run(AssetGraphRepository.load_graph)
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import itertools
 import os
+import re
 from contextlib import contextmanager
-from typing import Callable, Generator, Optional
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Generator, Iterator, List, Mapping, Optional, Sequence
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -16,26 +19,226 @@ Base = declarative_base()
 
 DEFAULT_DATABASE_URL = os.getenv("ASSET_GRAPH_DATABASE_URL", "sqlite:///./asset_graph.db")
 
+# Comma-separated URLs of read replicas of the database above; empty for none
+DEFAULT_REPLICA_URLS: List[str] = [
+    url.strip() for url in os.getenv("ASSET_GRAPH_REPLICA_URLS", "").split(",") if url.strip()
+]
 
-def create_engine_from_url(url: Optional[str] = None) -> Engine:
-    """Create a SQLAlchemy engine for the configured database URL."""
-    resolved_url = url or DEFAULT_DATABASE_URL
+# Performance profile applied to every new SQLite connection, in this order.
+# Each pragma can be overridden with ASSET_GRAPH_SQLITE_<NAME> (for example
+# ASSET_GRAPH_SQLITE_MMAP_SIZE=0); an empty value leaves the SQLite default.
+DEFAULT_SQLITE_PRAGMAS: Dict[str, str] = {
+    # Set first so that switching the journal mode waits for locks too
+    "busy_timeout": "5000",
+    # Readers no longer block the writer (and vice versa)
+    "journal_mode": "WAL",
+    # Durable at checkpoints; safe against corruption in WAL mode
+    "synchronous": "NORMAL",
+    "mmap_size": str(256 * 1024 * 1024),
+    # Negative values are KiB: 64 MiB page cache
+    "cache_size": "-65536",
+    "temp_store": "MEMORY",
+    "foreign_keys": "ON",
+}
+
+_PRAGMA_NAME_PATTERN = re.compile(r"^[A-Za-z_]+$")
+_PRAGMA_VALUE_PATTERN = re.compile(r"^-?\w+$")
+
+
+def sqlite_pragmas_from_env(
+    defaults: Mapping[str, str] = DEFAULT_SQLITE_PRAGMAS, prefix: str = "ASSET_GRAPH_SQLITE_"
+) -> Dict[str, str]:
+    """Return the SQLite pragmas to apply, with environment overrides.
+
+    Each pragma in ``defaults`` is overridden by ``<prefix><NAME>``; an empty
+    value leaves it out.
+    """
+    pragmas = {}
+    for name, default in defaults.items():
+        value = os.getenv(f"{prefix}{name.upper()}", default).strip()
+        if value:
+            pragmas[name] = value
+    return pragmas
+
+
+def sqlite_pragma_statements(pragmas: Mapping[str, str]) -> List[str]:
+    """Return ``PRAGMA name=value`` statements for ``pragmas``, in order.
+
+    Raises:
+        ValueError: If a name is not an identifier or a value is not a plain
+            number or keyword.
+    """
+    statements = []
+    for name, value in pragmas.items():
+        value = str(value)
+        if not _PRAGMA_NAME_PATTERN.match(name) or not _PRAGMA_VALUE_PATTERN.match(value):
+            raise ValueError(f"Invalid SQLite pragma {name}={value!r}")
+        statements.append(f"PRAGMA {name}={value}")
+    return statements
+
+
+def _apply_sqlite_pragmas(engine: Engine, pragmas: Mapping[str, str]) -> None:
+    """Run the ``pragmas`` on every new DBAPI connection of ``engine``."""
+    statements = sqlite_pragma_statements(pragmas)
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
 
-    #
 
-    if resolved_url.startswith("sqlite") and ":memory:" in resolved_url:
-        return create_engine(
+def create_engine_from_url(url: Optional[str] = None, sqlite_pragmas: Optional[Mapping[str, str]] = None) -> Engine:
+    """Create a SQLAlchemy engine for the configured database URL.
+
+    SQLite engines apply ``sqlite_pragmas`` to every new connection; when it
+    is None the profile from ``sqlite_pragmas_from_env`` is used. Pass an
+    empty mapping to keep the SQLite defaults.
+    """
+    resolved_url = url or DEFAULT_DATABASE_URL
+    if not resolved_url.startswith("sqlite"):
+        return create_engine(resolved_url, future=True)
+
+    if ":memory:" in resolved_url:
+        engine = create_engine(
             resolved_url,
             future=True,
             connect_args={"check_same_thread": False},
             poolclass=StaticPool,
         )
-    return create_engine(resolved_url, future=True)
+    else:
+        engine = create_engine(resolved_url, future=True)
+    _apply_sqlite_pragmas(engine, sqlite_pragmas_from_env() if sqlite_pragmas is None else sqlite_pragmas)
+    return engine
 
 
 def create_session_factory(engine: Engine) -> sessionmaker:
     """Create a configured session factory bound to the supplied engine."""
-    return sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    factory = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+    _reuse_lookup_rows_on_flush(factory)
+    return factory
+
+
+def _reuse_lookup_rows_on_flush(factory: sessionmaker) -> None:
+    """Resolve relationship and event type names to their lookup rows on flush; see ``db_models``."""
+    # Imported here: db_models imports Base from this module
+    from .db_models import reuse_lookup_rows_on_flush
+
+    reuse_lookup_rows_on_flush(factory)
+
+
+class _WriteScope:
+    """Read-your-writes state shared by the routing sessions of one ``read_your_writes()`` block."""
+
+    def __init__(self) -> None:
+        self.wrote = False
+
+
+_write_scope: ContextVar[Optional[_WriteScope]] = ContextVar("asset_graph_write_scope", default=None)
+
+
+@contextmanager
+def read_your_writes() -> Iterator[None]:
+    """Extend read-your-writes stickiness to every routing session opened inside the block.
+
+    Wrap a request in it: once any of its sessions has written, the sessions
+    that follow read from the primary too, not only the one that wrote.
+    """
+    token = _write_scope.set(_WriteScope())
+    try:
+        yield
+    finally:
+        _write_scope.reset(token)
+
+
+class RoutingSession(Session):
+    """Session that sends writes to a primary engine and reads to a replica.
+
+    SELECT statements run on a replica picked by ``replica_picker`` when the
+    session first reads, so one session reads from a single replica. Flushes
+    and any other statement run on the primary, and from then on the whole
+    session (or ``read_your_writes()`` block) reads from the primary too, so
+    it sees its own writes despite replication lag. ``SELECT ... FOR UPDATE``
+    and statements executed without a clause also go to the primary.
+
+    Core reads on ``Session.connection()`` opt in to a replica with
+    ``bind_arguments={"read": True}``; plain sessions ignore the argument.
+    """
+
+    def __init__(self, bind: Engine, *, replica_picker: Callable[[], Engine], **kwargs: Any):
+        super().__init__(bind=bind, **kwargs)
+        self.primary = bind
+        self._replica_picker = replica_picker
+        self._replica: Optional[Engine] = None
+        self._wrote = False
+        self._write_scope = _write_scope.get()
+
+    @property
+    def reads_from_primary(self) -> bool:
+        """Whether reads go to the primary because this session (or its request) has written."""
+        return self._wrote or (self._write_scope is not None and self._write_scope.wrote)
+
+    def stick_to_primary(self) -> None:
+        """Send every later statement of the session (and request) to the primary.
+
+        Call it before a read-modify-write so that the read is not served by
+        a lagging replica.
+        """
+        self._wrote = True
+        if self._write_scope is not None:
+            self._write_scope.wrote = True
+
+    def get_bind(self, mapper=None, *, clause=None, read: bool = False, **kw: Any):  # type: ignore[override]
+        reading = read or (
+            clause is not None and clause.is_select and getattr(clause, "_for_update_arg", None) is None
+        )
+        if reading and not self._flushing and not self.reads_from_primary:
+            if self._replica is None:
+                self._replica = self._replica_picker()
+            return self._replica
+        if clause is not None or self._flushing:
+            self.stick_to_primary()
+        return self.primary
+
+
+def create_routing_session_factory(primary: Engine, replicas: Sequence[Engine]) -> sessionmaker:
+    """Create a session factory that reads from ``replicas`` and writes to ``primary``.
+
+    Sessions take replicas in round-robin order; see :class:`RoutingSession`.
+    Without replicas this is ``create_session_factory(primary)``.
+    """
+    if not replicas:
+        return create_session_factory(primary)
+    # next() on a cycle is atomic under the GIL, so sessions may pick from any thread
+    replica_cycle = itertools.cycle(list(replicas))
+    factory = sessionmaker(
+        bind=primary,
+        class_=RoutingSession,
+        replica_picker=lambda: next(replica_cycle),
+        autocommit=False,
+        autoflush=False,
+        future=True,
+    )
+    _reuse_lookup_rows_on_flush(factory)
+    return factory
+
+
+def create_routing_session_factory_from_urls(
+    url: Optional[str] = None, replica_urls: Optional[Sequence[str]] = None
+) -> sessionmaker:
+    """Create a routing session factory for the primary ``url`` and its ``replica_urls``.
+
+    Defaults to ``ASSET_GRAPH_DATABASE_URL`` and ``ASSET_GRAPH_REPLICA_URLS``.
+    The schema is created on the primary if missing; replicas receive it
+    through replication.
+    """
+    primary = create_engine_from_url(url)
+    init_db(primary)
+    replicas = [create_engine_from_url(replica_url) for replica_url in (replica_urls or DEFAULT_REPLICA_URLS)]
+    return create_routing_session_factory(primary, replicas)
 
 
 def init_db(engine: Engine) -> None:
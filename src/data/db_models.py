@@ -2,18 +2,113 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, Iterable, List, Type, Union
 
-from sqlalchemy import Boolean, Float, ForeignKey, Integer, String, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    UniqueConstraint,
+    event,
+    select,
+    text,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.hybrid import Comparator, hybrid_property
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship, sessionmaker
 
 from .database import Base
 
+# Lookup ids: SMALLINT on PostgreSQL; SQLite needs INTEGER for the rowid alias
+_LOOKUP_ID = SmallInteger().with_variant(Integer, "sqlite")
+
+
+class RelationshipTypeORM(Base):
+    """Lookup table of relationship type names, referenced by small integer id."""
+
+    __tablename__ = "relationship_types"
+
+    id: Mapped[int] = mapped_column(_LOOKUP_ID, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String, nullable=False, unique=True)
+
+
+class EventTypeORM(Base):
+    """Lookup table of regulatory event type names, referenced by small integer id."""
+
+    __tablename__ = "event_types"
+
+    id: Mapped[int] = mapped_column(_LOOKUP_ID, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String, nullable=False, unique=True)
+
+
+class _LookupNameComparator(Comparator[str]):
+    """SQL behaviour of a type name stored as a lookup id.
+
+    Selecting the attribute reads the name through a correlated subquery.
+    ``==`` and ``in_`` resolve the name(s) to ids once and compare the id
+    column, so that they can use its indexes.
+    """
+
+    def __init__(self, id_column, lookup: Type[Any]):
+        super().__init__(select(lookup.name).where(lookup.id == id_column).scalar_subquery())
+        self.id_column = id_column
+        self.lookup = lookup
+
+    def __eq__(self, other):  # type: ignore[override]
+        return self.id_column == select(self.lookup.id).where(self.lookup.name == other).scalar_subquery()
+
+    def __ne__(self, other):  # type: ignore[override]
+        return self.id_column != select(self.lookup.id).where(self.lookup.name == other).scalar_subquery()
+
+    def in_(self, other):
+        return self.id_column.in_(select(self.lookup.id).where(self.lookup.name.in_(other)))
+
+
+def lookup_ids(session: Session, lookup: Type[Any], names: Iterable[str]) -> Dict[str, int]:
+    """Return the ids of ``names`` in the ``lookup`` table, inserting missing names.
+
+    Inserts use ``ON CONFLICT DO NOTHING`` where the dialect has it, so
+    concurrent writers adding the same name do not fail.
+    """
+    names = set(names)
+    if not names:
+        return {}
+    stmt = select(lookup.name, lookup.id).where(lookup.name.in_(names))
+    ids = dict(session.execute(stmt).all())
+    missing = names - ids.keys()
+    if missing:
+        table = lookup.__table__
+        insert = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}.get(session.get_bind().dialect.name)
+        if insert is None:
+            insert_stmt = table.insert()
+        else:
+            insert_stmt = insert(table).on_conflict_do_nothing(index_elements=["name"])
+        session.execute(insert_stmt, [{"name": name} for name in sorted(missing)])
+        ids.update(session.execute(stmt).all())
+    return ids
+
 
 class AssetORM(Base):
     """Persistent representation of an asset."""
 
     __tablename__ = "assets"
+    # Secondary indexes mirror the SQL scripts in migrations/
+    __table_args__ = (
+        Index("ix_assets_sector", "sector", "asset_class"),
+        Index("ix_assets_asset_class", "asset_class", "sector"),
+        Index(
+            "ix_assets_issuer_id",
+            "issuer_id",
+            sqlite_where=text("issuer_id IS NOT NULL"),
+            postgresql_where=text("issuer_id IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     symbol: Mapped[str] = mapped_column(String, nullable=False)
@@ -72,18 +167,45 @@ class AssetRelationshipORM(Base):
         UniqueConstraint(
             "source_asset_id",
             "target_asset_id",
-            "relationship_type",
+            "relationship_type_id",
             name="uq_relationship",
         ),
+        # Keyset pagination in (source, id) order
+        Index("ix_asset_relationships_source", "source_asset_id", "id"),
+        # Incoming edges; covering for reverse traversal filtered by type
+        Index(
+            "ix_asset_relationships_target",
+            "target_asset_id",
+            "relationship_type_id",
+            "source_asset_id",
+            "strength",
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     source_asset_id: Mapped[str] = mapped_column(ForeignKey("assets.id", ondelete="CASCADE"), nullable=False)
     target_asset_id: Mapped[str] = mapped_column(ForeignKey("assets.id", ondelete="CASCADE"), nullable=False)
-    relationship_type: Mapped[str] = mapped_column(String, nullable=False)
+    relationship_type_id: Mapped[int] = mapped_column(ForeignKey("relationship_types.id"), nullable=False)
     strength: Mapped[float] = mapped_column(Float, nullable=False)
     bidirectional: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
+    relationship_type_ref: Mapped[RelationshipTypeORM] = relationship("RelationshipTypeORM", lazy="joined")
+
+    @hybrid_property
+    def relationship_type(self) -> str | None:
+        """Relationship type name, stored as an id into ``relationship_types``."""
+        return None if self.relationship_type_ref is None else self.relationship_type_ref.name
+
+    @relationship_type.inplace.setter
+    def _relationship_type_setter(self, name: str) -> None:
+        # Swapped for the stored lookup row before flush; see _reuse_lookup_rows
+        self.relationship_type_ref = RelationshipTypeORM(name=name)
+
+    @relationship_type.inplace.comparator
+    @classmethod
+    def _relationship_type_comparator(cls) -> _LookupNameComparator:
+        return _LookupNameComparator(cls.relationship_type_id, RelationshipTypeORM)
+
     source: Mapped[AssetORM] = relationship(
         "AssetORM",
         foreign_keys=[source_asset_id],
@@ -100,25 +222,46 @@ class RegulatoryEventORM(Base):
     """Persistent regulatory event."""
 
     __tablename__ = "regulatory_events"
+    __table_args__ = (Index("ix_regulatory_events_asset", "asset_id", "date"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     asset_id: Mapped[str] = mapped_column(ForeignKey("assets.id", ondelete="CASCADE"), nullable=False)
-    event_type: Mapped[str] = mapped_column(String, nullable=False)
+    event_type_id: Mapped[int] = mapped_column(ForeignKey("event_types.id"), nullable=False)
     date: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str] = mapped_column(String, nullable=False)
     impact_score: Mapped[float] = mapped_column(Float, nullable=False)
 
+    event_type_ref: Mapped[EventTypeORM] = relationship("EventTypeORM", lazy="joined")
+
     asset: Mapped[AssetORM] = relationship("AssetORM", back_populates="regulatory_events")
     related_assets: Mapped[List["RegulatoryEventAssetORM"]] = relationship(
         "RegulatoryEventAssetORM", back_populates="event", cascade="all, delete-orphan"
     )
 
+    @hybrid_property
+    def event_type(self) -> str | None:
+        """Event type name, stored as an id into ``event_types``."""
+        return None if self.event_type_ref is None else self.event_type_ref.name
+
+    @event_type.inplace.setter
+    def _event_type_setter(self, name: str) -> None:
+        # Swapped for the stored lookup row before flush; see _reuse_lookup_rows
+        self.event_type_ref = EventTypeORM(name=name)
+
+    @event_type.inplace.comparator
+    @classmethod
+    def _event_type_comparator(cls) -> _LookupNameComparator:
+        return _LookupNameComparator(cls.event_type_id, EventTypeORM)
+
 
 class RegulatoryEventAssetORM(Base):
     """Join table linking regulatory events to related assets."""
 
     __tablename__ = "regulatory_event_assets"
-    __table_args__ = (UniqueConstraint("event_id", "asset_id", name="uq_event_asset"),)
+    __table_args__ = (
+        UniqueConstraint("event_id", "asset_id", name="uq_event_asset"),
+        Index("ix_regulatory_event_assets_asset", "asset_id", "event_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     event_id: Mapped[str] = mapped_column(ForeignKey("regulatory_events.id", ondelete="CASCADE"), nullable=False)
@@ -126,3 +269,90 @@ class RegulatoryEventAssetORM(Base):
 
     event: Mapped[RegulatoryEventORM] = relationship("RegulatoryEventORM", back_populates="related_assets")
     asset: Mapped[AssetORM] = relationship("AssetORM")
+
+
+class PriceHistoryORM(Base):
+    """Daily price bars of an asset.
+
+    Rows are clustered by ``(asset_id, date)``: SQLite stores the table
+    WITHOUT ROWID, so the primary key is the table and a range read for one
+    asset touches consecutive pages. ``date`` is an ISO ``YYYY-MM-DD``
+    string like the other dates in the schema.
+    """
+
+    __tablename__ = "price_history"
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    asset_id: Mapped[str] = mapped_column(ForeignKey("assets.id", ondelete="CASCADE"), primary_key=True)
+    date: Mapped[str] = mapped_column(String, primary_key=True)
+    open: Mapped[float | None] = mapped_column(Float, nullable=True)
+    high: Mapped[float | None] = mapped_column(Float, nullable=True)
+    low: Mapped[float | None] = mapped_column(Float, nullable=True)
+    close: Mapped[float] = mapped_column(Float, nullable=False)
+    volume: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+
+class ChangeJournalORM(Base):
+    """Append-only log of repository writes for incremental downstream sync.
+
+    Rows are written in the same transaction as the change they describe and
+    ``seq`` only ever grows, so consumers can tail the table from the last
+    sequence number they applied.
+    """
+
+    __tablename__ = "change_journal"
+    # AUTOINCREMENT stops SQLite from reusing the sequence numbers of pruned rows
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    # BIGINT on PostgreSQL; SQLite needs INTEGER for the rowid alias
+    seq: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    entity: Mapped[str] = mapped_column(String, nullable=False)
+    operation: Mapped[str] = mapped_column(String, nullable=False)
+    entity_key: Mapped[List[str]] = mapped_column(JSON, nullable=False)
+    data: Mapped[Dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+
+
+# (owner class, lookup reference attribute, lookup class) of the name-encoded columns
+_LOOKUP_REFERENCES = (
+    (AssetRelationshipORM, "relationship_type_ref", RelationshipTypeORM),
+    (RegulatoryEventORM, "event_type_ref", EventTypeORM),
+)
+
+
+def reuse_lookup_rows_on_flush(target: Union[Session, sessionmaker]) -> None:
+    """Run the lookup row hook before the flushes of ``target``.
+
+    The hook is registered on a session or session factory rather than on
+    the global Session class, so sessions of other code in the process do
+    not run it. Targets that already run it are left unchanged.
+    """
+    installed = (
+        _reuse_lookup_rows in target.dispatch.before_flush
+        if isinstance(target, Session)
+        else event.contains(target, "before_flush", _reuse_lookup_rows)
+    )
+    if not installed:
+        event.listen(target, "before_flush", _reuse_lookup_rows)
+
+
+def _reuse_lookup_rows(session: Session, _flush_context, _instances) -> None:
+    """Point lookup references assigned by name at the stored lookup rows.
+
+    Setting ``relationship_type`` or ``event_type`` attaches a new lookup
+    object. Before it would be inserted (and clash with the unique name), it
+    is replaced by the existing row for that name, which is created first if
+    needed.
+    """
+    for owner_class, attribute, lookup in _LOOKUP_REFERENCES:
+        pending = {instance for instance in session.new if isinstance(instance, lookup)}
+        if not pending:
+            continue
+        with session.no_autoflush:
+            ids = lookup_ids(session, lookup, (instance.name for instance in pending))
+            stored = {name: session.get(lookup, lookup_id) for name, lookup_id in ids.items()}
+        for owner in (*session.new, *session.dirty):
+            reference = owner.__dict__.get(attribute) if isinstance(owner, owner_class) else None
+            if reference is not None and reference in pending:
+                setattr(owner, attribute, stored[reference.name])
+        for instance in pending:
+            session.expunge(instance)
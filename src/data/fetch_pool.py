@@ -0,0 +1,190 @@
+"""Bounded, retrying fan-out of per-symbol market data requests.
+
+:class:`FetchPool` runs one fetch callable per symbol on a shared thread pool.
+Requests to the same host hold one of ``per_host_limit`` slots while they
+run, failed attempts are retried with jittered exponential backoff, and a
+symbol that has not produced a result ``timeout`` seconds after it was
+submitted is given up on. Results come back in symbol order, with
+failed and empty symbols left out, so callers see the same lists as from a
+plain loop that logs and skips failures.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class FetchPolicy:
+    """Limits, retries and timeouts of a :class:`FetchPool`.
+
+    Attributes:
+        max_workers: Threads shared by all hosts.
+        per_host_limit: Requests to one host that may run at the same time.
+        retries: Attempts after the first one for a symbol whose fetch raised.
+        backoff_base: Upper bound in seconds of the delay before the first retry;
+            it doubles with every further retry.
+        backoff_max: Cap in seconds of the delay bound.
+        timeout: Seconds after it was submitted, including the wait for a
+            worker, retries and waits for a host slot, after which a symbol is
+            given up on.
+    """
+
+    max_workers: int = 8
+    per_host_limit: int = 4
+    retries: int = 2
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    timeout: float = 30.0
+
+    def __post_init__(self):
+        if self.max_workers < 1 or self.per_host_limit < 1:
+            raise ValueError("max_workers and per_host_limit must be positive integers")
+        if self.retries < 0:
+            raise ValueError("retries must not be negative")
+        if self.backoff_base < 0 or self.backoff_max < 0:
+            raise ValueError("backoff_base and backoff_max must not be negative")
+        if self.timeout <= 0:
+            raise ValueError("timeout must be positive")
+
+    def backoff(self, attempt: int, rng: Optional[Callable[[], float]] = None) -> float:
+        """Return the delay before retry ``attempt + 1``, drawn uniformly up to the exponential bound."""
+        draw = rng() if rng is not None else random.random()
+        return draw * min(self.backoff_max, self.backoff_base * 2**attempt)
+
+
+class _SymbolTask:
+    """Progress of one symbol, shared between its worker and the collecting caller."""
+
+    def __init__(self, symbol: str, deadline: float):
+        self.symbol = symbol
+        # Monotonic time the symbol is given up at
+        self.deadline = deadline
+        self.abandoned = threading.Event()
+
+
+class FetchPool:
+    """Run per-symbol fetches concurrently under a :class:`FetchPolicy`.
+
+    The worker threads are started on first use and shared by all ``map``
+    calls, including concurrent ones, so ``max_workers`` and the per-host
+    limits hold across them. The timeout of a symbol starts when ``map``
+    submits it, so ``map`` returns within about ``timeout`` seconds even when
+    hung fetches hold every worker. Threads cannot be interrupted: a fetch
+    that hangs past its timeout is abandoned by the caller but keeps its
+    worker and host slot until it returns, and is not retried.
+    """
+
+    def __init__(self, policy: Optional[FetchPolicy] = None):
+        self.policy = policy or FetchPolicy()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def map(self, fetch: Callable[[str], Optional[T]], symbols: Iterable[str], host: str) -> List[T]:
+        """Fetch every symbol and return the results in symbol order.
+
+        Args:
+            fetch: Callable returning the result for a symbol, or None when the
+                symbol has no data; None is final and not retried.
+            symbols: Symbols to fetch.
+            host: Key of the per-host limit, normally the host serving ``fetch``.
+
+        Returns:
+            List of the results that were fetched. Symbols whose fetch kept
+            failing or timed out are logged and left out.
+        """
+        deadline = time.monotonic() + self.policy.timeout
+        tasks = [_SymbolTask(symbol, deadline) for symbol in symbols]
+        executor = self._get_executor()
+        slots = self._slots_for(host)
+        futures: Dict[Future, _SymbolTask] = {executor.submit(self._run, fetch, task, slots): task for task in tasks}
+
+        results: Dict[str, T] = {}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=self._wait_time(futures, pending), return_when=FIRST_COMPLETED)
+            for future in done:
+                task = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error("Failed to fetch data for %s: %s", task.symbol, e)
+                    continue
+                if result is not None:
+                    results[task.symbol] = result
+
+            now = time.monotonic()
+            for future in list(pending):
+                task = futures[future]
+                if now >= task.deadline:
+                    task.abandoned.set()
+                    # Drops the fetch if no worker has picked it up yet
+                    future.cancel()
+                    pending.discard(future)
+                    logger.error("Timed out fetching data for %s after %.1f s", task.symbol, self.policy.timeout)
+
+        return [results[task.symbol] for task in tasks if task.symbol in results]
+
+    def close(self) -> None:
+        """Stop the worker threads once their current fetches return; queued fetches are dropped."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.policy.max_workers, thread_name_prefix="market-data"
+                )
+            return self._executor
+
+    def _slots_for(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.policy.per_host_limit)
+            return self._host_slots[host]
+
+    @staticmethod
+    def _wait_time(futures: Dict[Future, _SymbolTask], pending) -> float:
+        return max(0.0, min(futures[future].deadline for future in pending) - time.monotonic())
+
+    def _run(
+        self, fetch: Callable[[str], Optional[T]], task: _SymbolTask, slots: threading.BoundedSemaphore
+    ) -> Optional[T]:
+        policy = self.policy
+        attempt = 0
+        while True:
+            with slots:
+                if task.abandoned.is_set():
+                    return None
+                try:
+                    return fetch(task.symbol)
+                except Exception as e:
+                    delay = policy.backoff(attempt)
+                    if attempt == policy.retries or time.monotonic() + delay >= task.deadline:
+                        raise
+                    attempt += 1
+                    logger.warning(
+                        "Fetching data for %s failed (%s); retry %d of %d in %.2f s",
+                        task.symbol,
+                        e,
+                        attempt,
+                        policy.retries,
+                        delay,
+                    )
+            # Back off without holding the host slot; a timeout ends the wait early
+            if task.abandoned.wait(delay):
+                return None
@@ -0,0 +1,516 @@
+"""Versioned binary snapshots of an asset relationship graph.
+
+A snapshot stores an :class:`~src.logic.asset_graph.AssetRelationshipGraph`
+as flat little-endian arrays:
+
+* a string table holding every distinct string once, which the other
+  sections reference by index;
+* columnar asset arrays, one per dataclass field across all asset types,
+  plus a type code per asset;
+* the relationships in CSR form: one offset per source into parallel
+  target, type and strength arrays;
+* columnar regulatory events, with their related assets in CSR form.
+
+The file starts with a fixed header (magic, format version, JSON directory
+length) followed by the JSON directory of sections and the 8-byte aligned
+sections themselves. :func:`load_snapshot` reads every section with one
+``np.frombuffer`` and builds the adjacency lists by slicing, so no Python
+code runs per edge beyond creating its tuple.
+
+:func:`open_shared_snapshot` instead maps the file read-only and serves the
+graph straight from the mapped arrays: the string table carries byte
+offsets, and the asset ids and relationship sources carry a sorted index
+for binary search. Processes mapping the same file share one copy of it
+through the page cache.
+
+Version 2 added the string offsets and the sorted indexes; version 1 files
+can still be loaded but not shared.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+import typing
+from bisect import bisect_left
+from collections.abc import ItemsView, Iterator, Mapping, ValuesView
+from dataclasses import fields
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import (
+    Asset,
+    AssetClass,
+    Bond,
+    Commodity,
+    Currency,
+    Equity,
+    RegulatoryActivity,
+    RegulatoryEvent,
+)
+
+# File extension that selects the snapshot format in RealDataFetcher
+SNAPSHOT_SUFFIX = ".graphsnap"
+
+SNAPSHOT_MAGIC = b"AGSNAP\x00\x00"
+SNAPSHOT_VERSION = 2
+
+# Versions load_snapshot can read; open_shared_snapshot needs SNAPSHOT_VERSION
+_READABLE_VERSIONS = (1, 2)
+
+# Magic, format version and length of the JSON directory that follows
+_HEADER = struct.Struct("<8sII")
+_ALIGNMENT = 8
+
+# Index into the string table that stands for None
+_NULL = -1
+
+# Asset types by type code; new types must be appended to keep codes stable
+_ASSET_TYPES: Tuple[Type[Asset], ...] = (Asset, Equity, Bond, Commodity, Currency)
+
+_ENUM_FIELDS: Dict[str, Type[Enum]] = {"asset_class": AssetClass}
+
+
+def _asset_columns() -> Tuple[List[str], List[str]]:
+    """Return the string and float asset columns: the fields of all asset types, in declaration order."""
+    string_columns: List[str] = []
+    float_columns: List[str] = []
+    for cls in _ASSET_TYPES:
+        hints = typing.get_type_hints(cls)
+        for field in fields(cls):
+            if field.name in string_columns or field.name in float_columns:
+                continue
+            is_float = float in (hints[field.name], *typing.get_args(hints[field.name]))
+            (float_columns if is_float else string_columns).append(field.name)
+    return string_columns, float_columns
+
+
+_STRING_COLUMNS, _FLOAT_COLUMNS = _asset_columns()
+
+PathLike = Union[str, Path]
+SectionReader = Callable[[str], np.ndarray]
+
+
+class _StringTable:
+    """Assigns each distinct string an index, in order of first use."""
+
+    def __init__(self) -> None:
+        self._index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add(self, value: Any) -> int:
+        if value is None:
+            return _NULL
+        if isinstance(value, Enum):
+            value = value.value
+        return self._index.setdefault(str(value), len(self._index))
+
+    def encode(self) -> Tuple[bytes, np.ndarray]:
+        """Return the NUL-separated UTF-8 table and the byte offset of each string (plus one past the end)."""
+        encoded = []
+        for value in self._index:
+            if "\0" in value:
+                raise ValueError(f"cannot store a string containing NUL in a graph snapshot: {value!r}")
+            encoded.append(value.encode("utf-8"))
+        offsets = np.zeros(len(encoded) + 1, dtype="<i8")
+        # Every string but the last is followed by its NUL separator
+        np.cumsum([len(value) + 1 for value in encoded], out=offsets[1:])
+        return b"\0".join(encoded), offsets
+
+
+# ----------------------------------------------------------------------
+# Writing
+# ----------------------------------------------------------------------
+def save_snapshot(graph: AssetRelationshipGraph, path: PathLike) -> None:
+    """Write ``graph`` to ``path`` as a binary snapshot, creating parent directories.
+
+    Float fields store None as NaN, so a NaN field value reads back as None.
+
+    Raises:
+        ValueError: If a string in the graph contains a NUL character.
+    """
+    strings = _StringTable()
+    sections: Dict[str, np.ndarray] = {}
+
+    assets = list(graph.assets.values())
+    type_codes = {cls: code for code, cls in enumerate(_ASSET_TYPES)}
+    sections["asset_type"] = np.array([type_codes.get(type(asset), 0) for asset in assets], dtype="u1")
+    sections["asset_id_order"] = _sort_order([asset.id for asset in assets])
+    for name in _STRING_COLUMNS:
+        sections[f"asset.{name}"] = np.array(
+            [strings.add(getattr(asset, name, None)) for asset in assets], dtype="<i4"
+        )
+    for name in _FLOAT_COLUMNS:
+        values = [getattr(asset, name, None) for asset in assets]
+        sections[f"asset.{name}"] = np.array([np.nan if v is None else v for v in values], dtype="<f8")
+
+    sources: List[int] = []
+    offsets = [0]
+    targets: List[int] = []
+    rel_types: List[int] = []
+    strengths: List[float] = []
+    for source, rels in graph.relationships.items():
+        sources.append(strings.add(source))
+        for target, rel_type, strength in rels:
+            targets.append(strings.add(target))
+            rel_types.append(strings.add(rel_type))
+            strengths.append(strength)
+        offsets.append(len(targets))
+    sections["edge_source"] = np.array(sources, dtype="<i4")
+    sections["edge_source_order"] = _sort_order(list(graph.relationships))
+    sections["edge_offset"] = np.array(offsets, dtype="<i8")
+    sections["edge_target"] = np.array(targets, dtype="<i4")
+    sections["edge_type"] = np.array(rel_types, dtype="<i4")
+    sections["edge_strength"] = np.array(strengths, dtype="<f8")
+
+    events = graph.regulatory_events
+    for name in ("id", "asset_id", "event_type", "date", "description"):
+        sections[f"event.{name}"] = np.array([strings.add(getattr(event, name)) for event in events], dtype="<i4")
+    sections["event.impact_score"] = np.array([event.impact_score for event in events], dtype="<f8")
+    related = [strings.add(asset_id) for event in events for asset_id in event.related_assets]
+    sections["event_related_offset"] = np.cumsum([0] + [len(event.related_assets) for event in events], dtype="<i8")
+    sections["event_related"] = np.array(related, dtype="<i4")
+
+    string_blob, sections["string_offset"] = strings.encode()
+    blobs: Dict[str, bytes] = {"strings": string_blob}
+    blobs.update((name, array.tobytes()) for name, array in sections.items())
+
+    directory: Dict[str, Any] = {
+        "string_count": len(strings),
+        "asset_types": [cls.__name__ for cls in _ASSET_TYPES],
+        "string_columns": _STRING_COLUMNS,
+        "float_columns": _FLOAT_COLUMNS,
+        "sections": {},
+    }
+    # Offsets are relative to the end of the directory, which makes them independent of its length
+    offset = 0
+    for name, blob in blobs.items():
+        dtype = sections[name].dtype.str if name in sections else "|u1"
+        directory["sections"][name] = [dtype, offset, len(blob)]
+        offset = _aligned(offset + len(blob))
+    encoded = json.dumps(directory, separators=(",", ":")).encode("utf-8")
+    encoded += b" " * (_aligned(_HEADER.size + len(encoded)) - _HEADER.size - len(encoded))
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as fp:
+        fp.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(encoded)))
+        fp.write(encoded)
+        for blob in blobs.values():
+            fp.write(blob)
+            fp.write(b"\0" * (_aligned(len(blob)) - len(blob)))
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _sort_order(keys: List[str]) -> np.ndarray:
+    """Return the positions of ``keys`` in sorted key order, the index used for binary search."""
+    return np.array(sorted(range(len(keys)), key=keys.__getitem__), dtype="<i4")
+
+
+# ----------------------------------------------------------------------
+# Reading
+# ----------------------------------------------------------------------
+def load_snapshot(path: PathLike) -> AssetRelationshipGraph:
+    """Read a graph written by :func:`save_snapshot`.
+
+    Raises:
+        ValueError: If the file is not a snapshot or has an unsupported format version.
+    """
+    return graph_from_buffer(Path(path).read_bytes())
+
+
+def graph_from_buffer(buffer: Union[bytes, memoryview]) -> AssetRelationshipGraph:
+    """Build a graph from the bytes of a snapshot file.
+
+    Raises:
+        ValueError: If ``buffer`` is not a snapshot or has an unsupported format version.
+    """
+    _, directory, section = _parse(buffer)
+    strings = _read_strings(section("strings"), directory["string_count"])
+
+    graph = AssetRelationshipGraph()
+    graph.assets = _read_assets(section, strings, directory)
+    graph.relationships = _read_relationships(section, strings)
+    graph.regulatory_events = _read_events(section, strings)
+    graph.touch()
+    return graph
+
+
+def open_shared_snapshot(path: PathLike) -> AssetRelationshipGraph:
+    """Map a snapshot read-only and return a graph served from the mapping.
+
+    ``assets`` and ``relationships`` of the returned graph are read-only
+    mappings that decode entries from the mapped arrays when accessed, so
+    opening the file costs the same for any graph size and every process
+    mapping it shares the pages. The graph cannot be mutated: it is marked
+    ``read_only``, so its add methods and ``build_relationships`` raise
+    TypeError. Replacing the file (``os.replace``) does not
+    affect graphs opened from the old one.
+
+    Raises:
+        ValueError: If the file is not a snapshot of the current format version.
+    """
+    with Path(path).open("rb") as fp:
+        buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    version, directory, section = _parse(buffer)
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"graph snapshot version {version} cannot be shared; rewrite it with save_snapshot")
+
+    strings = _MappedStrings(section("strings"), section("string_offset"))
+    graph = AssetRelationshipGraph()
+    graph.assets = _MappedAssets(section, strings, directory)  # type: ignore[assignment]
+    graph.relationships = _MappedRelationships(section, strings)  # type: ignore[assignment]
+    graph.regulatory_events = _read_events(section, strings)
+    graph.touch()
+    graph.read_only = True
+    return graph
+
+
+def _parse(buffer: Union[bytes, memoryview, mmap.mmap]) -> Tuple[int, Dict[str, Any], SectionReader]:
+    """Validate the header of ``buffer``; return its version, directory and a reader of its sections."""
+    if len(buffer) < _HEADER.size:
+        raise ValueError("not a graph snapshot: file is truncated")
+    magic, version, directory_length = _HEADER.unpack_from(buffer)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("not a graph snapshot: bad magic number")
+    if version not in _READABLE_VERSIONS:
+        raise ValueError(f"unsupported graph snapshot version {version}; expected {SNAPSHOT_VERSION}")
+    start = _HEADER.size + directory_length
+    directory = json.loads(bytes(buffer[_HEADER.size : start]))
+
+    def section(name: str) -> np.ndarray:
+        dtype, offset, length = directory["sections"][name]
+        return np.frombuffer(buffer, dtype=dtype, count=length // np.dtype(dtype).itemsize, offset=start + offset)
+
+    return version, directory, section
+
+
+def _read_strings(blob: np.ndarray, count: int) -> np.ndarray:
+    """Return the string table as an object array, so index arrays can gather from it in bulk."""
+    table = np.empty(count + 1, dtype=object)
+    # The last slot stays None: index _NULL (-1) selects it
+    table[:count] = blob.tobytes().decode("utf-8").split("\0") if count else []
+    return table
+
+
+def _lookup(strings: Union[np.ndarray, "_MappedStrings"], indices: np.ndarray) -> List[Any]:
+    """Return the strings at ``indices``, with None for the _NULL index."""
+    return list(strings.take(indices))
+
+
+def _read_assets(section: SectionReader, strings: np.ndarray, directory: Dict[str, Any]) -> Dict[str, Asset]:
+    """Build the asset mapping, constructing each asset type from its own columns."""
+    asset_types = _asset_classes(directory)
+    type_codes = section("asset_type")
+    columns: Dict[str, np.ndarray] = {name: section(f"asset.{name}") for name in directory["string_columns"]}
+    columns.update((name, section(f"asset.{name}")) for name in directory["float_columns"])
+    float_columns = set(directory["float_columns"])
+
+    assets: List[Asset] = [None] * len(type_codes)  # type: ignore[list-item]
+    for code, cls in enumerate(asset_types):
+        positions = np.flatnonzero(type_codes == code)
+        if not len(positions):
+            continue
+        names = [field.name for field in fields(cls) if field.name in columns]
+        values: List[Sequence[Any]] = []
+        for name in names:
+            column = columns[name][positions]
+            if name in float_columns:
+                values.append([None if value != value else value for value in column.tolist()])
+            else:
+                values.append(_lookup(strings, column))
+            if name in _ENUM_FIELDS:
+                values[-1] = [_ENUM_FIELDS[name](value) for value in values[-1]]
+        for position, row in zip(positions.tolist(), zip(*values)):
+            assets[position] = cls(**dict(zip(names, row)))
+    return {asset.id: asset for asset in assets}
+
+
+def _asset_classes(directory: Dict[str, Any]) -> List[Type[Asset]]:
+    """Return the asset types by the type codes of the snapshot."""
+    classes = {cls.__name__: cls for cls in _ASSET_TYPES}
+    return [classes[name] for name in directory["asset_types"]]
+
+
+def _read_relationships(section: SectionReader, strings: np.ndarray) -> Dict[str, List[Tuple[str, str, float]]]:
+    """Build the adjacency lists by slicing one list of edge tuples at the CSR offsets."""
+    offsets = section("edge_offset").tolist()
+    edges = list(
+        zip(
+            _lookup(strings, section("edge_target")),
+            _lookup(strings, section("edge_type")),
+            section("edge_strength").tolist(),
+        )
+    )
+    sources = _lookup(strings, section("edge_source"))
+    return {source: edges[begin:end] for source, begin, end in zip(sources, offsets, offsets[1:])}
+
+
+def _read_events(section: SectionReader, strings: Union[np.ndarray, "_MappedStrings"]) -> List[RegulatoryEvent]:
+    offsets = section("event_related_offset").tolist()
+    related = _lookup(strings, section("event_related"))
+    columns = zip(
+        _lookup(strings, section("event.id")),
+        _lookup(strings, section("event.asset_id")),
+        _lookup(strings, section("event.event_type")),
+        _lookup(strings, section("event.date")),
+        _lookup(strings, section("event.description")),
+        section("event.impact_score").tolist(),
+        offsets,
+        offsets[1:],
+    )
+    return [
+        RegulatoryEvent(
+            id=event_id,
+            asset_id=asset_id,
+            event_type=RegulatoryActivity(event_type),
+            date=date,
+            description=description,
+            impact_score=impact_score,
+            related_assets=related[begin:end],
+        )
+        for event_id, asset_id, event_type, date, description, impact_score, begin, end in columns
+    ]
+
+
+# ----------------------------------------------------------------------
+# Shared (memory-mapped) graphs
+# ----------------------------------------------------------------------
+class _MappedStrings:
+    """Random access to the string table of a mapped snapshot, decoding on each access."""
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        if index == _NULL:
+            return None
+        begin, end = self._offsets[index], self._offsets[index + 1] - 1
+        return self._blob[begin:end].tobytes().decode("utf-8")
+
+    def take(self, indices: np.ndarray) -> List[Optional[str]]:
+        return [self[index] for index in indices.tolist()]
+
+    def find(self, order: np.ndarray, keys: np.ndarray, value: str) -> Optional[int]:
+        """Return the position whose string is ``value``, searching ``keys`` in the sorted ``order``."""
+        found = bisect_left(order, value, key=lambda position: self[keys[position]])
+        if found < len(order) and self[keys[order[found]]] == value:
+            return int(order[found])
+        return None
+
+
+class _MappedMapping(Mapping):
+    """Base of the mapped mappings: values and items walk the entries by position."""
+
+    def _entry(self, position: int) -> Any:
+        raise NotImplementedError
+
+    def values(self) -> ValuesView:
+        return _PositionalValues(self)
+
+    def items(self) -> ItemsView:
+        return _PositionalItems(self)
+
+
+# Views that walk a mapped mapping by position instead of binary searching every key
+class _PositionalValues(ValuesView):
+    def __iter__(self) -> Iterator[Any]:
+        return map(self._mapping._entry, range(len(self._mapping)))
+
+
+class _PositionalItems(ItemsView):
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        return zip(self._mapping, _PositionalValues(self._mapping))
+
+
+class _MappedAssets(_MappedMapping):
+    """Read-only asset mapping that builds each asset from the mapped columns when accessed."""
+
+    def __init__(self, section: SectionReader, strings: _MappedStrings, directory: Dict[str, Any]):
+        self._strings = strings
+        self._type_codes = section("asset_type")
+        self._ids = section("asset.id")
+        self._order = section("asset_id_order")
+        self._columns = {name: section(f"asset.{name}") for name in directory["string_columns"]}
+        self._float_columns = {name: section(f"asset.{name}") for name in directory["float_columns"]}
+        stored = self._columns.keys() | self._float_columns.keys()
+        self._types = [
+            (cls, [field.name for field in fields(cls) if field.name in stored]) for cls in _asset_classes(directory)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._strings.take(self._ids))
+
+    def __contains__(self, asset_id: object) -> bool:
+        return isinstance(asset_id, str) and self._strings.find(self._order, self._ids, asset_id) is not None
+
+    def __getitem__(self, asset_id: str) -> Asset:
+        position = self._strings.find(self._order, self._ids, asset_id) if isinstance(asset_id, str) else None
+        if position is None:
+            raise KeyError(asset_id)
+        return self._entry(position)
+
+    def _entry(self, position: int) -> Asset:
+        cls, names = self._types[self._type_codes[position]]
+        values: Dict[str, Any] = {}
+        for name in names:
+            if name in self._float_columns:
+                value = float(self._float_columns[name][position])
+                values[name] = None if value != value else value
+            else:
+                values[name] = self._strings[self._columns[name][position]]
+                if name in _ENUM_FIELDS:
+                    values[name] = _ENUM_FIELDS[name](values[name])
+        return cls(**values)
+
+
+class _MappedRelationships(_MappedMapping):
+    """Read-only adjacency mapping that builds each source's edge list from the mapped CSR arrays."""
+
+    def __init__(self, section: SectionReader, strings: _MappedStrings):
+        self._strings = strings
+        self._sources = section("edge_source")
+        self._order = section("edge_source_order")
+        self._offsets = section("edge_offset")
+        self._targets = section("edge_target")
+        self._types = section("edge_type")
+        self._strengths = section("edge_strength")
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._strings.take(self._sources))
+
+    def __contains__(self, source_id: object) -> bool:
+        return isinstance(source_id, str) and self._strings.find(self._order, self._sources, source_id) is not None
+
+    def __getitem__(self, source_id: str) -> List[Tuple[str, str, float]]:
+        position = self._strings.find(self._order, self._sources, source_id) if isinstance(source_id, str) else None
+        if position is None:
+            raise KeyError(source_id)
+        return self._entry(position)
+
+    def _entry(self, position: int) -> List[Tuple[str, str, float]]:
+        begin, end = self._offsets[position], self._offsets[position + 1]
+        return list(
+            zip(
+                self._strings.take(self._targets[begin:end]),
+                self._strings.take(self._types[begin:end]),
+                self._strengths[begin:end].tolist(),
+            )
+        )
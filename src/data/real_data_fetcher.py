@@ -1,11 +1,16 @@
 import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
 
 import yfinance as yf
 
+from src.data.fetch_pool import FetchPolicy, FetchPool
+from src.data.graph_snapshot import SNAPSHOT_SUFFIX, load_snapshot, open_shared_snapshot, save_snapshot
 from src.logic.asset_graph import AssetRelationshipGraph
 from src.models.financial_models import (
     Asset,
@@ -20,6 +25,14 @@ from src.models.financial_models import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Seconds before a failed background refresh is retried
+REFRESH_RETRY_INTERVAL = 60.0
+
+# Host behind every yfinance request, which shares one per-host limit
+YAHOO_FINANCE_HOST = "query1.finance.yahoo.com"
+
 
 class RealDataFetcher:
     """Fetches real financial data from Yahoo Finance and other sources"""
@@ -30,14 +43,21 @@ class RealDataFetcher:
         cache_path: Optional[str] = None,
         fallback_factory: Optional[Callable[[], AssetRelationshipGraph]] = None,
         enable_network: bool = True,
+        share_snapshot: bool = False,
+        cache_ttl: Optional[float] = None,
+        on_refresh: Optional[Callable[[AssetRelationshipGraph], None]] = None,
+        fetch_policy: Optional[FetchPolicy] = None,
+        ticker_factory: Optional[Callable[[str], Any]] = None,
     ):
         """
         Initialise the RealDataFetcher with optional cache, fallback and network controls.
 
         Parameters:
-            cache_path (Optional[str]): Path to a JSON cache file to load a
+            cache_path (Optional[str]): Path to a cache file to load a
                 previously persisted AssetRelationshipGraph
                 from and to save the constructed graph to.
+                Paths ending in ".graphsnap" use the binary snapshot
+                format of src.data.graph_snapshot, any other path JSON.
                 If omitted, no file-based caching is used.
             fallback_factory (Optional[Callable[[], AssetRelationshipGraph]]):
                 Callable that returns a fallback AssetRelationshipGraph to use
@@ -49,11 +69,48 @@ class RealDataFetcher:
                 for fetching live data.
                 When False, the fetcher will not attempt network calls
                 and will use the fallback dataset.
+            share_snapshot (bool):
+                When True and the cache is a ".graphsnap" snapshot, the
+                cached graph is memory-mapped read-only instead of loaded,
+                so processes serving the same cache share one copy of it.
+                The returned graph then cannot be mutated.
+            cache_ttl (Optional[float]):
+                Seconds after which cached or fetched data is stale.
+                If omitted, data never goes stale.
+            on_refresh (Optional[Callable[[AssetRelationshipGraph], None]]):
+                Callback receiving each graph fetched by a background
+                refresh. When set, `create_real_database` serves stale or
+                missing data at once and refreshes in the background
+                instead of fetching synchronously.
+            fetch_policy (Optional[FetchPolicy]):
+                Enables concurrent fetching: the four asset classes are
+                fetched at the same time and their symbols on a shared
+                FetchPool with the policy's worker and per-host limits,
+                retries with jittered backoff and per-symbol timeout.
+                If omitted, symbols are fetched one after another and
+                failed symbols are skipped without a retry.
+            ticker_factory (Optional[Callable[[str], Any]]):
+                Returns the data source of a symbol, an object with the
+                `info` and `history(period=...)` members of
+                `yfinance.Ticker`. If omitted, `yfinance.Ticker` is used.
         """
         self.session = None
         self.cache_path = Path(cache_path) if cache_path else None
         self.fallback_factory = fallback_factory
         self.enable_network = enable_network
+        self.share_snapshot = share_snapshot
+        self.cache_ttl = cache_ttl
+        self.on_refresh = on_refresh
+        self.ticker_factory = ticker_factory
+        self.fetch_pool = FetchPool(fetch_policy) if fetch_policy is not None else None
+        # Wall-clock time the current data was written or fetched
+        self.data_timestamp: Optional[float] = None
+        self.last_refresh_duration: Optional[float] = None
+        self.refresh_count = 0
+        self.refresh_failures = 0
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._retry_at = 0.0
 
     def create_real_database(self) -> AssetRelationshipGraph:
         """
@@ -63,77 +120,238 @@ class RealDataFetcher:
         network disablement or fetch failure.
         Persist the freshly built graph to cache when possible.
 
+        With a `cache_ttl`, a cache older than the TTL is stale. Stale data is
+        refetched synchronously, unless an `on_refresh` callback is set: then
+        this method never fetches itself and returns the stale cache (or the
+        fallback when there is no cache) at once, while a background thread
+        fetches fresh data and hands the new graph to `on_refresh`.
+
         Returns:
             graph (AssetRelationshipGraph): The constructed graph containing
                 assets, regulatory events and relationships.
         """
+        cached = None
         if self.cache_path and self.cache_path.exists():
             try:
                 logger.info("Loading asset graph from cache at %s", self.cache_path)
-                return _load_from_cache(self.cache_path)
+                cached = self._load_cache()
+                self.data_timestamp = self.cache_path.stat().st_mtime
             except Exception:
                 logger.exception(
                     "Failed to load cached dataset; proceeding with standard fetch"
                 )
 
+        if cached is not None and not (self.enable_network and self.is_stale()):
+            return cached
+
         if not self.enable_network:
             logger.info(
                 "Network fetching disabled. Using fallback dataset if available."
             )
             return self._fallback()
 
-        logger.info("Creating database with real financial data from Yahoo Finance")
-        graph = AssetRelationshipGraph()
+        if self.on_refresh is not None:
+            # Stale-while-revalidate: serve what is available now
+            self.refresh_in_background()
+            return cached if cached is not None else self._fallback()
 
         try:
-            # Fetch real data for different asset classes
-            equities = self._fetch_equity_data()
-            bonds = self._fetch_bond_data()
-            commodities = self._fetch_commodity_data()
-            currencies = self._fetch_currency_data()
-
-            # Add all assets to graph
-            all_assets = equities + bonds + commodities + currencies
-            for asset in all_assets:
-                graph.add_asset(asset)
-
-            # Add some regulatory events based on real companies
-            events = self._create_regulatory_events()
-            for event in events:
-                graph.add_regulatory_event(event)
-            # Build relationships
-            graph.build_relationships()
-
-            if self.cache_path:
-                import os
-                import tempfile
-
-                try:
-                    cache_dir = os.path.dirname(self.cache_path)
-                    with tempfile.NamedTemporaryFile(
-                        "wb", dir=cache_dir, delete=False
-                    ) as tmp_file:
-                        tmp_path = tmp_file.name
-                        _save_to_cache(graph, Path(tmp_path))
-                    os.replace(tmp_path, self.cache_path)
-                except Exception:
-                    logger.exception(
-                        "Failed to persist dataset cache to %s", self.cache_path
-                    )
-
-            logger.info(
-                "Real database created with %s assets and %s relationships",
-                len(graph.assets),
-                sum(len(rels) for rels in graph.relationships.values()),
-            )
-            return graph
-
+            # An empty fetch must not replace a stale cache
+            return self._fetch_and_cache(require_assets=cached is not None)
         except Exception as e:
             logger.error("Failed to create real database: %s", e)
+            if cached is not None:
+                logger.warning("Serving the stale cached dataset after the failed refetch")
+                return cached
             # Fallback to sample data if real data fetch failure
             logger.warning("Falling back to sample data due to real data fetch failure")
             return self._fallback()
 
+    # ------------------------------------------------------------------
+    # Refreshing
+    # ------------------------------------------------------------------
+    def data_age(self) -> Optional[float]:
+        """
+        Return the age in seconds of the data last loaded or fetched.
+
+        Returns:
+            Optional[float]: Seconds since the cache file was written or the
+                data was fetched, or None if no real data was loaded yet.
+        """
+        if self.data_timestamp is None:
+            return None
+        return max(0.0, time.time() - self.data_timestamp)
+
+    def is_stale(self) -> bool:
+        """
+        Return whether the data is older than `cache_ttl`.
+
+        Without real data (the fallback is being served) it is always stale,
+        whatever the TTL, so refreshes keep being attempted every
+        `REFRESH_RETRY_INTERVAL` seconds until real data arrives. Real data
+        never goes stale without a `cache_ttl`.
+        """
+        age = self.data_age()
+        if age is None:
+            return True
+        return self.cache_ttl is not None and age > self.cache_ttl
+
+    def refresh_in_background(self) -> bool:
+        """
+        Start fetching fresh data on a background thread.
+
+        On success the new graph is cached and passed to `on_refresh`; on
+        failure the current data keeps being served and no new refresh starts
+        for `REFRESH_RETRY_INTERVAL` seconds.
+
+        Returns:
+            bool: True if a refresh was started, False if network access is
+                disabled, one is already running or a failed one is backing off.
+        """
+        if not self.enable_network:
+            return False
+        with self._refresh_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return False
+            if time.monotonic() < self._retry_at:
+                return False
+            self._refresh_thread = threading.Thread(
+                target=self._refresh, name="graph-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+            return True
+
+    def wait_for_refresh(self, timeout: Optional[float] = None) -> None:
+        """Block until the running background refresh, if any, has finished."""
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def refresh_metrics(self) -> Dict[str, Any]:
+        """
+        Return metrics about the data freshness and the background refreshes.
+
+        Returns:
+            Dict[str, Any]: "data_age_seconds", "stale",
+                "refresh_in_progress", "last_refresh_duration_seconds",
+                "refresh_count" and "refresh_failures".
+        """
+        with self._refresh_lock:
+            thread = self._refresh_thread
+            duration, count, failures = self.last_refresh_duration, self.refresh_count, self.refresh_failures
+        return {
+            "data_age_seconds": self.data_age(),
+            "stale": self.is_stale(),
+            "refresh_in_progress": thread is not None and thread.is_alive(),
+            "last_refresh_duration_seconds": duration,
+            "refresh_count": count,
+            "refresh_failures": failures,
+        }
+
+    def _refresh(self) -> None:
+        start = time.perf_counter()
+        try:
+            graph = self._fetch_and_cache(require_assets=True)
+        except Exception:
+            logger.exception("Background refresh of the asset graph failed; keeping the current data")
+            graph = None
+        duration = time.perf_counter() - start
+        # Read by refresh_in_background() and refresh_metrics() on other threads
+        with self._refresh_lock:
+            self.last_refresh_duration = duration
+            if graph is None:
+                self.refresh_failures += 1
+                self._retry_at = time.monotonic() + REFRESH_RETRY_INTERVAL
+                return
+            self.refresh_count += 1
+        logger.info("Asset graph refreshed in %.1f s", duration)
+        if self.on_refresh is not None:
+            self.on_refresh(graph)
+
+    def _fetch_and_cache(self, require_assets: bool = False) -> AssetRelationshipGraph:
+        """
+        Fetch live data into a new graph and persist it to the cache.
+
+        Parameters:
+            require_assets (bool): Treat a fetch that returns no asset at all
+                as a failure, so that it does not replace existing data.
+
+        Returns:
+            AssetRelationshipGraph: The fetched graph.
+
+        Raises:
+            RuntimeError: If `require_assets` is set and no asset could be fetched.
+        """
+        logger.info("Creating database with real financial data from Yahoo Finance")
+        graph = AssetRelationshipGraph()
+
+        # Fetch real data for different asset classes
+        fetches = (
+            self._fetch_equity_data,
+            self._fetch_bond_data,
+            self._fetch_commodity_data,
+            self._fetch_currency_data,
+        )
+        if self.fetch_pool is None:
+            fetched = [fetch() for fetch in fetches]
+        else:
+            # The classes only wait on the shared pool, which bounds the requests
+            with ThreadPoolExecutor(max_workers=len(fetches), thread_name_prefix="asset-class") as executor:
+                fetched = [future.result() for future in [executor.submit(fetch) for fetch in fetches]]
+
+        # Add all assets to graph
+        all_assets = [asset for assets in fetched for asset in assets]
+        if require_assets and not all_assets:
+            raise RuntimeError("no market data could be fetched")
+        for asset in all_assets:
+            graph.add_asset(asset)
+
+        # Add some regulatory events based on real companies
+        events = self._create_regulatory_events()
+        for event in events:
+            graph.add_regulatory_event(event)
+        # Build relationships
+        graph.build_relationships()
+        self.data_timestamp = time.time()
+
+        if self.cache_path:
+            import os
+            import tempfile
+
+            try:
+                cache_dir = os.path.dirname(self.cache_path)
+                # Same suffix as the cache, which selects the file format
+                with tempfile.NamedTemporaryFile(
+                    "wb", dir=cache_dir, suffix=self.cache_path.suffix, delete=False
+                ) as tmp_file:
+                    tmp_path = tmp_file.name
+                    _save_to_cache(graph, Path(tmp_path))
+                os.replace(tmp_path, self.cache_path)
+                if self._shares_cache():
+                    # Serve the mapped copy so this process shares it too
+                    graph = self._load_cache()
+            except Exception:
+                logger.exception(
+                    "Failed to persist dataset cache to %s", self.cache_path
+                )
+
+        logger.info(
+            "Real database created with %s assets and %s relationships",
+            len(graph.assets),
+            sum(len(rels) for rels in graph.relationships.values()),
+        )
+        return graph
+
+    def _shares_cache(self) -> bool:
+        """Return whether the cache is a snapshot this fetcher memory-maps instead of loading."""
+        return self.share_snapshot and self.cache_path.suffix == SNAPSHOT_SUFFIX
+
+    def _load_cache(self) -> AssetRelationshipGraph:
+        """Return the cached graph, mapped read-only when `share_snapshot` applies."""
+        if self._shares_cache():
+            return open_shared_snapshot(self.cache_path)
+        return _load_from_cache(self.cache_path)
+
     def _fallback(self) -> AssetRelationshipGraph:
         """
         Selects a fallback AssetRelationshipGraph to use when real data cannot be
@@ -152,8 +370,42 @@ class RealDataFetcher:
 
         return create_sample_database()
 
-    @staticmethod
-    def _fetch_equity_data() -> List[Equity]:
+    def _ticker(self, symbol: str) -> Any:
+        """Return the data source of `symbol`, from `ticker_factory` or `yfinance.Ticker`."""
+        if self.ticker_factory is not None:
+            return self.ticker_factory(symbol)
+        return yf.Ticker(symbol)
+
+    def _fetch_symbols(
+        self, kind: str, fetch: Callable[[str], Optional[T]], symbols: Iterable[str]
+    ) -> List[T]:
+        """
+        Fetch every symbol of an asset class, skipping failed and empty ones.
+
+        Parameters:
+            kind (str): Asset class named in log messages.
+            fetch (Callable[[str], Optional[T]]): Builds the asset of a symbol,
+                returning None when the symbol has no price data.
+            symbols (Iterable[str]): Symbols to fetch.
+
+        Returns:
+            List[T]: The fetched assets in symbol order.
+        """
+        if self.fetch_pool is not None:
+            return self.fetch_pool.map(fetch, symbols, host=YAHOO_FINANCE_HOST)
+
+        assets = []
+        for symbol in symbols:
+            try:
+                asset = fetch(symbol)
+            except Exception as e:
+                logger.error("Failed to fetch %s data for %s: %s", kind, symbol, e)
+                continue
+            if asset is not None:
+                assets.append(asset)
+        return assets
+
+    def _fetch_equity_data(self) -> List[Equity]:
         """
         Fetches current market data for a predefined set of major equities and
         returns them as Equity objects.
@@ -170,45 +422,39 @@ class RealDataFetcher:
             "JPM": ("JPMorgan Chase & Co.", "Financial Services"),
         }
 
-        equities = []
-        for symbol, (name, sector) in equity_symbols.items():
-            try:
-                ticker = yf.Ticker(symbol)
-                info = ticker.info
-                hist = ticker.history(period="1d")
-
-                if hist.empty:
-                    logger.warning("No price data for %s", symbol)
-                    continue
-
-                current_price = float(hist["Close"].iloc[-1])
-
-                equity = Equity(
-                    id=symbol,
-                    symbol=symbol,
-                    name=name,
-                    asset_class=AssetClass.EQUITY,
-                    sector=sector,
-                    price=current_price,
-                    market_cap=info.get("marketCap"),
-                    pe_ratio=info.get("trailingPE"),
-                    dividend_yield=info.get("dividendYield"),
-                    earnings_per_share=info.get("trailingEps"),
-                    book_value=info.get("bookValue"),
-                )
-                equities.append(equity)
-                logger.info(
-                    "Fetched price for %s (%s): %s", symbol, name, current_price
-                )
-
-            except Exception as e:
-                logger.error("Failed to fetch data for %s: %s", symbol, e)
-                continue
+        def fetch(symbol: str) -> Optional[Equity]:
+            name, sector = equity_symbols[symbol]
+            ticker = self._ticker(symbol)
+            info = ticker.info
+            hist = ticker.history(period="1d")
+
+            if hist.empty:
+                logger.warning("No price data for %s", symbol)
+                return None
+
+            current_price = float(hist["Close"].iloc[-1])
+
+            equity = Equity(
+                id=symbol,
+                symbol=symbol,
+                name=name,
+                asset_class=AssetClass.EQUITY,
+                sector=sector,
+                price=current_price,
+                market_cap=info.get("marketCap"),
+                pe_ratio=info.get("trailingPE"),
+                dividend_yield=info.get("dividendYield"),
+                earnings_per_share=info.get("trailingEps"),
+                book_value=info.get("bookValue"),
+            )
+            logger.info(
+                "Fetched price for %s (%s): %s", symbol, name, current_price
+            )
+            return equity
 
-        return equities
+        return self._fetch_symbols("equity", fetch, equity_symbols)
 
-    @staticmethod
-    def _fetch_bond_data() -> List[Bond]:
+    def _fetch_bond_data(self) -> List[Bond]:
         """Fetch real bond / treasury data"""
         # For bonds, we'll use Treasury ETFs and bond proxies since individual bonds are harder to access
         bond_symbols = {
@@ -227,45 +473,39 @@ class RealDataFetcher:
             ),
         }
 
-        bonds = []
-        for symbol, (name, sector, issuer_id, rating) in bond_symbols.items():
-            try:
-                ticker = yf.Ticker(symbol)
-                info = ticker.info
-                hist = ticker.history(period="1d")
-
-                if hist.empty:
-                    logger.warning("No price data for %s", symbol)
-                    continue
-
-                current_price = float(hist["Close"].iloc[-1])
-
-                bond = Bond(
-                    id=symbol,
-                    symbol=symbol,
-                    name=name,
-                    asset_class=AssetClass.FIXED_INCOME,
-                    sector=sector,
-                    price=current_price,
-                    yield_to_maturity=info.get(
-                        "yield", 0.03
-                    ),  # Default 3% if not available
-                    coupon_rate=info.get("yield", 0.025),  # Approximate
-                    maturity_date="2035-01-01",  # Approximate for ETFs
-                    credit_rating=rating,
-                    issuer_id=issuer_id,
-                )
-                bonds.append(bond)
-                logger.info("Fetched %s: %s at $%.2f", symbol, name, current_price)
-
-            except Exception as e:
-                logger.error("Failed to fetch bond data for %s: %s", symbol, e)
-                continue
+        def fetch(symbol: str) -> Optional[Bond]:
+            name, sector, issuer_id, rating = bond_symbols[symbol]
+            ticker = self._ticker(symbol)
+            info = ticker.info
+            hist = ticker.history(period="1d")
+
+            if hist.empty:
+                logger.warning("No price data for %s", symbol)
+                return None
+
+            current_price = float(hist["Close"].iloc[-1])
+
+            bond = Bond(
+                id=symbol,
+                symbol=symbol,
+                name=name,
+                asset_class=AssetClass.FIXED_INCOME,
+                sector=sector,
+                price=current_price,
+                yield_to_maturity=info.get(
+                    "yield", 0.03
+                ),  # Default 3% if not available
+                coupon_rate=info.get("yield", 0.025),  # Approximate
+                maturity_date="2035-01-01",  # Approximate for ETFs
+                credit_rating=rating,
+                issuer_id=issuer_id,
+            )
+            logger.info("Fetched %s: %s at $%.2f", symbol, name, current_price)
+            return bond
 
-        return bonds
+        return self._fetch_symbols("bond", fetch, bond_symbols)
 
-    @staticmethod
-    def _fetch_commodity_data() -> List[Commodity]:
+    def _fetch_commodity_data(self) -> List[Commodity]:
         """Fetch real commodity data"""
         commodity_symbols = {
             "GC=F": ("Gold Futures", "Precious Metals", 100),
@@ -273,48 +513,42 @@ class RealDataFetcher:
             "SI=F": ("Silver Futures", "Precious Metals", 5000),
         }
 
-        commodities = []
-        for symbol, (name, sector, contract_size) in commodity_symbols.items():
-            try:
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period="1d")
-
-                if hist.empty:
-                    logger.warning("No price data for %s", symbol)
-                    continue
+        def fetch(symbol: str) -> Optional[Commodity]:
+            name, sector, contract_size = commodity_symbols[symbol]
+            ticker = self._ticker(symbol)
+            hist = ticker.history(period="1d")
 
-                current_price = float(hist["Close"].iloc[-1])
+            if hist.empty:
+                logger.warning("No price data for %s", symbol)
+                return None
 
-                # Calculate simple volatility from recent data
-                hist_week = ticker.history(period="5d")
-                volatility = (
-                    float(hist_week["Close"].pct_change().std())
-                    if len(hist_week) > 1
-                    else 0.20
-                )
+            current_price = float(hist["Close"].iloc[-1])
 
-                commodity = Commodity(
-                    id=symbol.replace("=F", "_FUTURE"),
-                    symbol=symbol,
-                    name=name,
-                    asset_class=AssetClass.COMMODITY,
-                    sector=sector,
-                    price=current_price,
-                    contract_size=contract_size,
-                    delivery_date="2025-03-31",  # Approximate
-                    volatility=volatility,
-                )
-                commodities.append(commodity)
-                logger.info("Fetched %s: %s at $%.2f", symbol, name, current_price)
+            # Calculate simple volatility from recent data
+            hist_week = ticker.history(period="5d")
+            volatility = (
+                float(hist_week["Close"].pct_change().std())
+                if len(hist_week) > 1
+                else 0.20
+            )
 
-            except Exception as e:
-                logger.error("Failed to fetch commodity data for %s: %s", symbol, e)
-                continue
+            commodity = Commodity(
+                id=symbol.replace("=F", "_FUTURE"),
+                symbol=symbol,
+                name=name,
+                asset_class=AssetClass.COMMODITY,
+                sector=sector,
+                price=current_price,
+                contract_size=contract_size,
+                delivery_date="2025-03-31",  # Approximate
+                volatility=volatility,
+            )
+            logger.info("Fetched %s: %s at $%.2f", symbol, name, current_price)
+            return commodity
 
-        return commodities
+        return self._fetch_symbols("commodity", fetch, commodity_symbols)
 
-    @staticmethod
-    def _fetch_currency_data() -> List[Currency]:
+    def _fetch_currency_data(self) -> List[Currency]:
         """Fetch real currency exchange rate data"""
         currency_symbols = {
             "EURUSD=X": ("Euro", "EU", "EUR"),
@@ -322,38 +556,33 @@ class RealDataFetcher:
             "JPYUSD=X": ("Japanese Yen", "Japan", "JPY"),
         }
 
-        currencies = []
-        for symbol, (name, country, currency_code) in currency_symbols.items():
-            try:
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period="1d")
-
-                if hist.empty:
-                    logger.warning("No price data for %s", symbol)
-                    continue
-
-                current_rate = float(hist["Close"].iloc[-1])
-
-                currency = Currency(
-                    id=symbol.replace("=X", ""),
-                    symbol=currency_code,
-                    name=name,
-                    asset_class=AssetClass.CURRENCY,
-                    sector="Forex",
-                    price=current_rate,
-                    exchange_rate=current_rate,
-                    country=country,
-                    # Approximate - would need separate API for real rates
-                    central_bank_rate=0.02,
-                )
-                currencies.append(currency)
-                logger.info("Fetched %s: %s at %.4f", symbol, name, current_rate)
-
-            except Exception as e:
-                logger.error("Failed to fetch currency data for %s: %s", symbol, e)
-                continue
+        def fetch(symbol: str) -> Optional[Currency]:
+            name, country, currency_code = currency_symbols[symbol]
+            ticker = self._ticker(symbol)
+            hist = ticker.history(period="1d")
+
+            if hist.empty:
+                logger.warning("No price data for %s", symbol)
+                return None
+
+            current_rate = float(hist["Close"].iloc[-1])
+
+            currency = Currency(
+                id=symbol.replace("=X", ""),
+                symbol=currency_code,
+                name=name,
+                asset_class=AssetClass.CURRENCY,
+                sector="Forex",
+                price=current_rate,
+                exchange_rate=current_rate,
+                country=country,
+                # Approximate - would need separate API for real rates
+                central_bank_rate=0.02,
+            )
+            logger.info("Fetched %s: %s at %.4f", symbol, name, current_rate)
+            return currency
 
-        return currencies
+        return self._fetch_symbols("currency", fetch, currency_symbols)
 
     @staticmethod
     def _create_regulatory_events() -> List[RegulatoryEvent]:
@@ -472,8 +701,6 @@ def _serialize_graph(graph: AssetRelationshipGraph) -> Dict[str, Any]:
             - "regulatory_events": list of serialized regulatory event objects
             - "relationships": mapping from source id to a list of
               outgoing relationships
-            - "incoming_relationships": mapping from target id to a list of
-              incoming relationships
     """
     return {
         "assets": [_serialize_dataclass(asset) for asset in graph.assets.values()],
@@ -491,17 +718,6 @@ def _serialize_graph(graph: AssetRelationshipGraph) -> Dict[str, Any]:
             ]
             for source, rels in graph.relationships.items()
         },
-        "incoming_relationships": {
-            target: [
-                {
-                    "source": source,
-                    "relationship_type": rel_type,
-                    "strength": strength,
-                }
-                for source, rel_type, strength in rels
-            ]
-            for target, rels in graph.incoming_relationships.items()
-        },
     }
 
 
@@ -550,6 +766,7 @@ def _deserialize_event(data: Dict[str, Any]) -> RegulatoryEvent:
         RegulatoryEvent: The deserialized RegulatoryEvent instance.
     """
     data = dict(data)
+    data.pop("__type__", None)
     data["event_type"] = RegulatoryActivity(data["event_type"])
     return RegulatoryEvent(**data)
 
@@ -589,14 +806,19 @@ def _deserialize_graph(payload: Dict[str, Any]) -> AssetRelationshipGraph:
 
 def _load_from_cache(path: Path) -> AssetRelationshipGraph:
     """
-    Load an AssetRelationshipGraph from a JSON cache file.
+    Load an AssetRelationshipGraph from a cache file.
+
+    Files with the ".graphsnap" extension are read as binary snapshots,
+    any other file as JSON.
 
     Parameters:
-        path(Path): Filesystem path to the cache JSON file to read.
+        path(Path): Filesystem path to the cache file to read.
 
     Returns:
-        AssetRelationshipGraph: The graph reconstructed from the JSON payload.
+        AssetRelationshipGraph: The graph reconstructed from the cache.
     """
+    if path.suffix == SNAPSHOT_SUFFIX:
+        return load_snapshot(path)
     with path.open("r", encoding="utf-8") as fp:
         payload = json.load(fp)
     return _deserialize_graph(payload)
@@ -604,17 +826,20 @@ def _load_from_cache(path: Path) -> AssetRelationshipGraph:
 
 def _save_to_cache(graph: AssetRelationshipGraph, path: Path) -> None:
     """
-    Persist an AssetRelationshipGraph to a JSON file at the given filesystem path.
+    Persist an AssetRelationshipGraph to a cache file at the given filesystem path.
 
-    The function serialises the provided graph to JSON
-    (UTF - 8, pretty - printed with two - space indentation),
-    creates parent directories if necessary,
-    and overwrites any existing file at the path.
+    Paths with the ".graphsnap" extension get a binary snapshot; any other
+    path gets JSON (UTF - 8, pretty - printed with two - space indentation).
+    Parent directories are created if necessary,
+    and any existing file at the path is overwritten.
 
     Parameters:
         graph(AssetRelationshipGraph): The graph to persist.
-        path(Path): Filesystem path where the JSON representation will be written.
+        path(Path): Filesystem path where the graph will be written.
     """
+    if path.suffix == SNAPSHOT_SUFFIX:
+        save_snapshot(graph, path)
+        return
     payload = _serialize_graph(graph)
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as fp:
@@ -0,0 +1,265 @@
+"""Write-behind persistence of in-memory graph mutations.
+
+:class:`WriteBehindWriter` keeps a journal of the assets, relationships and
+regulatory events added to an :class:`~src.logic.asset_graph.AssetRelationshipGraph`
+and writes it to the database on a background thread, so graph mutations
+never wait on SQL.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from src.models.financial_models import Asset, RegulatoryEvent
+
+from .database import create_engine_from_url, create_session_factory, init_db, session_scope
+from .repository import AssetGraphRepository, RelationshipRecord
+
+logger = logging.getLogger(__name__)
+
+# Journal entries that trigger a flush before the interval has elapsed
+WRITE_BEHIND_BATCH_SIZE = 1_000
+
+# Seconds between time-triggered flushes
+WRITE_BEHIND_FLUSH_INTERVAL = 1.0
+
+
+class WriteBehindWriter:
+    """Journal graph mutations in memory and persist them in batches.
+
+    ``record_*`` calls only update the journal. A background thread flushes
+    it through :class:`AssetGraphRepository` in one transaction once
+    ``batch_size`` entries are pending or ``flush_interval`` seconds have
+    passed. Entries are keyed like their database rows, so repeated writes
+    of the same asset, relationship or event between flushes collapse into
+    the latest one. After ``record_relationships_reset()`` the next flush
+    replaces the stored relationships with the journalled ones, so
+    relationships the graph dropped are deleted too.
+
+    Relationships and events that reference an asset which is neither in
+    the batch nor in the database would fail the whole transaction on the
+    foreign keys; they are dropped with a warning instead. A failed flush
+    puts its entries back (unless newer ones were recorded meanwhile) and
+    is retried after ``flush_interval``. ``close()`` stops the thread and
+    flushes whatever is left; at interpreter exit it runs too, logging
+    instead of raising a failure of that last flush. With
+    ``journal_changes`` the flushed writes are added to the change journal.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = WRITE_BEHIND_BATCH_SIZE,
+        flush_interval: float = WRITE_BEHIND_FLUSH_INTERVAL,
+        journal_changes: bool = False,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._session_factory = session_factory
+        self.journal_changes = journal_changes
+        self._assets: Dict[str, Asset] = {}
+        self._relationships: Dict[Tuple[str, str, str], RelationshipRecord] = {}
+        self._events: Dict[str, RegulatoryEvent] = {}
+        self._replace_relationships = False
+        self._condition = threading.Condition()
+        # Serialises flushes so that batches reach the database in order
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="graph-write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self._close_at_exit)
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "WriteBehindWriter":
+        """Create a writer for the database at ``url``, creating its schema if needed."""
+        engine = create_engine_from_url(url)
+        init_db(engine)
+        return cls(create_session_factory(engine), **kwargs)
+
+    def __len__(self) -> int:
+        with self._condition:
+            return self._pending()
+
+    def __enter__(self) -> "WriteBehindWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Journal
+    # ------------------------------------------------------------------
+    def record_asset(self, asset: Asset) -> None:
+        """Journal an asset create or update."""
+        self._record(self._assets, asset.id, asset)
+
+    def record_relationship(
+        self, source_id: str, target_id: str, rel_type: str, strength: float, bidirectional: bool
+    ) -> None:
+        """Journal a relationship create or update."""
+        record = RelationshipRecord(source_id, target_id, rel_type, strength, bidirectional)
+        self._record(self._relationships, (source_id, target_id, rel_type), record)
+
+    def record_relationships_reset(self) -> None:
+        """Journal that the graph dropped all relationships before rebuilding them."""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("write-behind writer is closed")
+            self._relationships = {}
+            self._replace_relationships = True
+
+    def record_regulatory_event(self, event: RegulatoryEvent) -> None:
+        """Journal a regulatory event create or update."""
+        self._record(self._events, event.id, event)
+
+    def _record(self, journal: Dict, key, value) -> None:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("write-behind writer is closed")
+            journal[key] = value
+            if self._pending() >= self.batch_size:
+                self._condition.notify()
+
+    def _pending(self) -> int:
+        return len(self._assets) + len(self._relationships) + len(self._events)
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+    def flush(self) -> int:
+        """Write all journalled entries in one transaction and return their number.
+
+        Raises:
+            Exception: Whatever the database raised; the entries stay journalled.
+        """
+        with self._flush_lock:
+            with self._condition:
+                assets: List[Asset] = list(self._assets.values())
+                relationships: List[RelationshipRecord] = list(self._relationships.values())
+                events: List[RegulatoryEvent] = list(self._events.values())
+                replace_relationships = self._replace_relationships
+                self._assets, self._relationships, self._events = {}, {}, {}
+                self._replace_relationships = False
+            if not (assets or relationships or events or replace_relationships):
+                return 0
+
+            try:
+                with session_scope(self._session_factory) as session:
+                    repository = AssetGraphRepository(session, self.journal_changes)
+                    # Assets first: relationships and events reference them
+                    repository.upsert_assets(assets)
+                    relationships, events = self._without_orphans(repository, assets, relationships, events)
+                    if replace_relationships:
+                        repository.replace_relationships(relationships)
+                    else:
+                        repository.upsert_relationships(relationships)
+                    for event in events:
+                        repository.upsert_regulatory_event(event)
+            except Exception:
+                with self._condition:
+                    self._restore(assets, relationships, events, replace_relationships)
+                raise
+            return len(assets) + len(relationships) + len(events)
+
+    @staticmethod
+    def _without_orphans(
+        repository: AssetGraphRepository,
+        assets: List[Asset],
+        relationships: List[RelationshipRecord],
+        events: List[RegulatoryEvent],
+    ) -> Tuple[List[RelationshipRecord], List[RegulatoryEvent]]:
+        """Drop the relationships and events referencing assets that are neither in the batch nor stored."""
+        referenced = {asset_id for rel in relationships for asset_id in (rel.source_id, rel.target_id)}
+        referenced.update(asset_id for event in events for asset_id in (event.asset_id, *event.related_assets))
+        known = {asset.id for asset in assets}
+        known |= repository.existing_asset_ids(referenced - known)
+        if referenced <= known:
+            return relationships, events
+
+        kept_relationships = []
+        for rel in relationships:
+            if rel.source_id in known and rel.target_id in known:
+                kept_relationships.append(rel)
+            else:
+                logger.warning(
+                    "Dropping relationship %s -> %s (%s): unknown asset",
+                    rel.source_id,
+                    rel.target_id,
+                    rel.relationship_type,
+                )
+        kept_events = []
+        for event in events:
+            if event.asset_id in known and known.issuperset(event.related_assets):
+                kept_events.append(event)
+            else:
+                logger.warning("Dropping regulatory event %s: unknown asset", event.id)
+        return kept_relationships, kept_events
+
+    def _restore(
+        self,
+        assets: List[Asset],
+        relationships: List[RelationshipRecord],
+        events: List[RegulatoryEvent],
+        replace_relationships: bool,
+    ) -> None:
+        """Put back the entries of a failed flush that were not recorded again since."""
+        self._assets = {**{asset.id: asset for asset in assets}, **self._assets}
+        if not self._replace_relationships:
+            # A reset recorded since supersedes the failed relationships
+            self._relationships = {
+                **{(rel.source_id, rel.target_id, rel.relationship_type): rel for rel in relationships},
+                **self._relationships,
+            }
+            self._replace_relationships = replace_relationships
+        self._events = {**{event.id: event for event in events}, **self._events}
+
+    def close(self) -> None:
+        """Stop the background thread and flush the remaining entries.
+
+        Recording after ``close()`` raises RuntimeError. Calling it again is
+        a no-op.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        atexit.unregister(self._close_at_exit)
+        self.flush()
+
+    def _close_at_exit(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            logger.exception("Write-behind flush at exit failed; %d entries were not persisted", len(self))
+
+    def _run(self) -> None:
+        retrying = False
+        while True:
+            with self._condition:
+                if retrying:
+                    # Back off for one interval instead of retrying at once
+                    self._condition.wait(self.flush_interval)
+                else:
+                    self._condition.wait_for(
+                        lambda: self._closed or self._pending() >= self.batch_size, self.flush_interval
+                    )
+                if self._closed:
+                    return
+            try:
+                self.flush()
+                retrying = False
+            except Exception:
+                logger.exception("Write-behind flush failed; %d entries kept for retry", len(self))
+                retrying = True
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
 from src.models.financial_models import Asset, Bond, RegulatoryEvent
 
+if TYPE_CHECKING:
+    from src.data.write_behind import WriteBehindWriter
+
 
 class AssetRelationshipGraph:
     """
@@ -17,28 +20,66 @@ class AssetRelationshipGraph:
         assets: Dict[str, Asset] mapping asset IDs to Asset objects.
         relationships: Dict[source_id, List[(target_id, rel_type, strength)]]
         regulatory_events: List[RegulatoryEvent]
+        version: Counter bumped by every mutating method. Visualization caches
+            key on it, so code that edits ``relationships`` directly should
+            call ``touch()`` afterwards.
+        write_behind: Optional WriteBehindWriter that persists the assets,
+            relationships and events added through the mutating methods.
+            Persistence is opt-in: ``database_url`` alone does not create
+            one, pass ``WriteBehindWriter.from_url(database_url)``.
+        read_only: When True, the mutating methods raise TypeError. Set for
+            graphs served from a shared snapshot mapping.
     """
 
-    def __init__(self, database_url: str | None = None) -> None:
+    def __init__(self, database_url: str | None = None, write_behind: Optional[WriteBehindWriter] = None) -> None:
         self.assets: Dict[str, Asset] = {}
         self.relationships: Dict[str, List[Tuple[str, str, float]]] = {}
         self.regulatory_events: List[RegulatoryEvent] = []
         self.database_url = database_url
+        self._version = 0
+        self.read_only = False
+        self.write_behind = write_behind
+
+    @property
+    def version(self) -> int:
+        """Return the mutation counter of this graph."""
+        return self._version
+
+    def touch(self) -> None:
+        """Mark the graph as modified, invalidating derived caches."""
+        self._version += 1
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise TypeError("graph is read-only")
 
     def add_asset(self, asset: Asset) -> None:
         """Add an asset to the graph."""
+        self._check_writable()
         self.assets[asset.id] = asset
+        self.touch()
+        if self.write_behind is not None:
+            self.write_behind.record_asset(asset)
 
     def add_regulatory_event(self, event: RegulatoryEvent) -> None:
         """Add a regulatory event to the graph."""
+        self._check_writable()
         self.regulatory_events.append(event)
+        self.touch()
+        if self.write_behind is not None:
+            self.write_behind.record_regulatory_event(event)
 
     def build_relationships(self) -> None:
         """
         Automatically discover relationships between assets
         based on business rules.
         """
+        self._check_writable()
         self.relationships = {}
+        self.touch()
+        if self.write_behind is not None:
+            # The stored relationships are replaced, dropping those not rebuilt
+            self.write_behind.record_relationships_reset()
 
         asset_ids = list(self.assets.keys())
         for i, id1 in enumerate(asset_ids):
@@ -79,18 +120,30 @@ class AssetRelationshipGraph:
         bidirectional: bool = False,
     ) -> None:
         """Manually add a relationship to the graph."""
+        self._check_writable()
+        self.touch()
         if source_id not in self.relationships:
             self.relationships[source_id] = []
 
         # Avoid duplicates
+        added = reverse_added = False
         if not any(r[0] == target_id and r[1] == rel_type for r in self.relationships[source_id]):
             self.relationships[source_id].append((target_id, rel_type, strength))
+            added = True
 
         if bidirectional:
             if target_id not in self.relationships:
                 self.relationships[target_id] = []
             if not any(r[0] == source_id and r[1] == rel_type for r in self.relationships[target_id]):
                 self.relationships[target_id].append((source_id, rel_type, strength))
+                reverse_added = True
+
+        # Journal only what was added, so a reload matches the in-memory graph
+        if self.write_behind is not None:
+            if added:
+                self.write_behind.record_relationship(source_id, target_id, rel_type, strength, reverse_added)
+            elif reverse_added:
+                self.write_behind.record_relationship(target_id, source_id, rel_type, strength, False)
 
     def calculate_metrics(self) -> Dict[str, Any]:
         """Calculate network statistics and distributions."""
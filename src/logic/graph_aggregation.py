@@ -0,0 +1,250 @@
+"""Aggregation of an asset graph into a weighted meta-graph.
+
+Overview visualizations do not need every individual relationship; they need
+the flows between groups of assets. This module collapses the graph into one
+meta-node per group (for example a sector) and one weighted meta-edge per
+ordered pair of groups. Assets can be grouped by sector, by asset class or by
+community (densely connected clusters found from the relationships).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import repeat
+from operator import itemgetter
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.logic.asset_graph import AssetRelationshipGraph
+
+GROUPINGS = ("sector", "asset_class", "community")
+
+
+@dataclass(frozen=True)
+class MetaGraph:
+    """Weighted meta-graph produced by the aggregation stage.
+
+    Attributes:
+        group_by: Name of the grouping that produced the meta-nodes.
+        nodes: Meta-node labels, indexed by the arrays below.
+        node_sizes: Number of assets in each meta-node.
+        sources: Source meta-node index of each meta-edge.
+        targets: Target meta-node index of each meta-edge.
+        edge_counts: Number of relationships collapsed into each meta-edge.
+        total_strength: Sum of relationship strengths per meta-edge.
+    """
+
+    group_by: str
+    nodes: List[str]
+    node_sizes: np.ndarray
+    sources: np.ndarray
+    targets: np.ndarray
+    edge_counts: np.ndarray
+    total_strength: np.ndarray
+
+    @property
+    def mean_strength(self) -> np.ndarray:
+        """Average relationship strength per meta-edge."""
+        return self.total_strength / np.maximum(self.edge_counts, 1)
+
+
+def relationship_columns(
+    graph: AssetRelationshipGraph,
+    source_ids: Optional[Iterable[str]] = None,
+) -> Tuple[List[str], List[str], List[str], List[float]]:
+    """Flatten ``graph.relationships`` into parallel edge columns.
+
+    Columns are extracted with ``itemgetter`` rather than ``zip(*rows)``: the
+    latter allocates one tuple per step and triggers repeated garbage
+    collection passes on large graphs.
+
+    Args:
+        graph: Graph whose relationships are flattened
+        source_ids: Restrict to these source assets (default: all sources)
+
+    Returns:
+        Tuple of ``(source_ids, target_ids, rel_types, strengths)`` lists
+    """
+    relationships = graph.relationships
+    if source_ids is None:
+        source_ids = relationships.keys()
+
+    sources: List[str] = []
+    rows: List[Tuple[str, str, float]] = []
+    for source_id in source_ids:
+        rels = relationships.get(source_id, ())
+        sources.extend(repeat(source_id, len(rels)))
+        rows.extend(rels)
+    return (
+        sources,
+        list(map(itemgetter(0), rows)),
+        list(map(itemgetter(1), rows)),
+        list(map(itemgetter(2), rows)),
+    )
+
+
+def aggregate_graph(graph: AssetRelationshipGraph, group_by: str = "sector") -> MetaGraph:
+    """Collapse ``graph`` into a weighted meta-graph.
+
+    The relationships are mapped once onto a compact integer adjacency (one
+    index per registered asset); grouping and edge collapsing are then array
+    operations over that adjacency. Relationships whose endpoints are not
+    registered assets are ignored, and relationships inside one group become
+    self-loops on that group.
+
+    Args:
+        graph: Graph to aggregate
+        group_by: One of ``GROUPINGS``. ``"community"`` groups assets found by
+            label propagation over the relationship strengths.
+
+    Returns:
+        The aggregated meta-graph
+
+    Raises:
+        ValueError: If ``group_by`` is not one of ``GROUPINGS``
+    """
+    if group_by not in GROUPINGS:
+        raise ValueError(f"Invalid group_by '{group_by}': expected one of {', '.join(GROUPINGS)}")
+
+    asset_ids = list(graph.assets)
+    source_idx, target_idx, strength = _compact_adjacency(graph, asset_ids)
+
+    if group_by == "community":
+        labels, codes = _community_codes(source_idx, target_idx, strength, len(asset_ids))
+    else:
+        labels, codes = _attribute_codes(graph, asset_ids, group_by)
+    return _collapse(group_by, labels, codes, source_idx, target_idx, strength)
+
+
+def aggregate_by_sector(graph: AssetRelationshipGraph) -> MetaGraph:
+    """Collapse ``graph`` into a sector-to-sector meta-graph."""
+    return aggregate_graph(graph, "sector")
+
+
+def _compact_adjacency(
+    graph: AssetRelationshipGraph, asset_ids: List[str]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Map relationships onto indices into ``asset_ids``, dropping unknown endpoints."""
+    index = {asset_id: idx for idx, asset_id in enumerate(asset_ids)}
+    source_ids, target_ids, _, strengths = relationship_columns(graph)
+
+    num_edges = len(source_ids)
+    source_idx = np.fromiter(map(index.get, source_ids, repeat(-1)), dtype=np.intp, count=num_edges)
+    target_idx = np.fromiter(map(index.get, target_ids, repeat(-1)), dtype=np.intp, count=num_edges)
+    strength = np.asarray(strengths, dtype=float).reshape(num_edges)
+
+    known = (source_idx >= 0) & (target_idx >= 0)
+    return source_idx[known], target_idx[known], strength[known]
+
+
+def _attribute_codes(
+    graph: AssetRelationshipGraph, asset_ids: List[str], group_by: str
+) -> Tuple[List[str], np.ndarray]:
+    """Group assets by a categorical attribute, with labels in sorted order."""
+    assets = graph.assets
+    if group_by == "asset_class":
+        values = [assets[asset_id].asset_class.value for asset_id in asset_ids]
+    else:
+        values = [getattr(assets[asset_id], group_by) for asset_id in asset_ids]
+
+    labels = sorted(set(values))
+    label_index = {label: idx for idx, label in enumerate(labels)}
+    codes = np.fromiter(map(label_index.__getitem__, values), dtype=np.intp, count=len(values))
+    return labels, codes
+
+
+def _community_codes(
+    source_idx: np.ndarray, target_idx: np.ndarray, strength: np.ndarray, num_nodes: int
+) -> Tuple[List[str], np.ndarray]:
+    """Group assets into communities, numbered by decreasing size."""
+    _, codes = np.unique(_label_propagation(source_idx, target_idx, strength, num_nodes), return_inverse=True)
+    codes = codes.reshape(num_nodes)
+    sizes = np.bincount(codes)
+    rank = np.empty_like(sizes)
+    rank[np.argsort(-sizes, kind="stable")] = np.arange(len(sizes))
+    return [f"Community {idx + 1}" for idx in range(len(sizes))], rank[codes]
+
+
+def _label_propagation(
+    source_idx: np.ndarray,
+    target_idx: np.ndarray,
+    strength: np.ndarray,
+    num_nodes: int,
+    max_iter: int = 20,
+) -> np.ndarray:
+    """Detect communities by weighted label propagation.
+
+    Relationships are treated as undirected, with parallel and reverse edges
+    merged into their strongest one. Every node repeatedly adopts the label
+    carrying the largest total strength among its neighbours. Each node also
+    votes for its own label with the weight of its strongest edge and ties go
+    to the smallest label, which keeps the synchronous update deterministic
+    and stops pairs of nodes from swapping labels forever.
+
+    Returns:
+        Community label (a node index) per node
+    """
+    labels = np.arange(num_nodes)
+    distinct = source_idx != target_idx
+    low = np.minimum(source_idx, target_idx)[distinct]
+    high = np.maximum(source_idx, target_idx)[distinct]
+    if not len(low):
+        return labels
+
+    pair_keys, inverse = np.unique(low * num_nodes + high, return_inverse=True)
+    pair_strength = np.zeros(len(pair_keys))
+    np.maximum.at(pair_strength, inverse.reshape(-1), strength[distinct])
+    low, high = np.divmod(pair_keys, num_nodes)
+
+    nodes = np.arange(num_nodes)
+    self_weight = np.zeros(num_nodes)
+    np.maximum.at(self_weight, low, pair_strength)
+    np.maximum.at(self_weight, high, pair_strength)
+
+    voter = np.concatenate([low, high, nodes])
+    voted = np.concatenate([high, low, nodes])
+    weight = np.concatenate([pair_strength, pair_strength, self_weight])
+
+    for _ in range(max_iter):
+        keys, inverse = np.unique(voted * num_nodes + labels[voter], return_inverse=True)
+        scores = np.bincount(inverse.reshape(-1), weights=weight, minlength=len(keys))
+        # Keys are sorted by (node, label), so each node's votes form one
+        # segment and the first maximum of a segment is its smallest label.
+        node, label = np.divmod(keys, num_nodes)
+        starts = np.flatnonzero(np.r_[True, node[1:] != node[:-1]])
+        segment_max = np.maximum.reduceat(scores, starts)
+        best = np.flatnonzero(scores == np.repeat(segment_max, np.diff(np.r_[starts, len(keys)])))
+        best = best[np.r_[True, node[best][1:] != node[best][:-1]]]
+
+        updated = labels.copy()
+        updated[node[best]] = label[best]
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+    return labels
+
+
+def _collapse(
+    group_by: str,
+    labels: List[str],
+    codes: np.ndarray,
+    source_idx: np.ndarray,
+    target_idx: np.ndarray,
+    strength: np.ndarray,
+) -> MetaGraph:
+    """Collapse the compact adjacency into one weighted edge per group pair."""
+    num_groups = max(len(labels), 1)
+    pair_keys = codes[source_idx] * num_groups + codes[target_idx]
+    unique_keys, inverse, counts = np.unique(pair_keys, return_inverse=True, return_counts=True)
+    totals = np.bincount(inverse.reshape(-1), weights=strength, minlength=len(unique_keys))
+
+    return MetaGraph(
+        group_by=group_by,
+        nodes=labels,
+        node_sizes=np.bincount(codes, minlength=len(labels)),
+        sources=unique_keys // num_groups,
+        targets=unique_keys % num_groups,
+        edge_counts=counts,
+        total_strength=totals,
+    )
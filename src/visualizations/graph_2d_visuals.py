@@ -11,11 +11,36 @@ relationship filtering.
 
 import logging
 import math
-from typing import Dict, List, Tuple
+from typing import Dict, Hashable, List, Optional, Tuple
 
+import numpy as np
 import plotly.graph_objects as go
 
 from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.graph_aggregation import aggregate_graph, relationship_columns
+from src.visualizations.graph_visuals import (
+    LOD_MAX_EDGES,
+    LOD_MAX_NODES,
+    _build_asset_id_index,
+    _build_edge_arrays,
+    _build_edge_coordinates_optimized,
+    _build_hover_data,
+    _build_hover_template,
+    _check_strength_percentile,
+    _create_meta_graph_traces,
+    _edge_count,
+    _EdgeGroup,
+    _get_cached_bundles,
+    _graph_fingerprint,
+    _graph_node_data,
+    _hidden_types,
+    _is_filtered_out,
+    _meta_graph_positions,
+    _resolve_level_of_detail,
+    _select_strongest_edges,
+    _split_edge_groups,
+    _version_fingerprint,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +55,11 @@ REL_TYPE_COLORS = {
     "regulatory_impact": "#FFA07A",
 }
 
+# SVG rendering becomes sluggish in the browser above a few thousand edges;
+# "auto" render mode switches to WebGL (Scattergl) past this threshold.
+WEBGL_EDGE_THRESHOLD = 2_000
+RENDER_MODES = ("auto", "svg", "webgl")
+
 
 def _create_circular_layout(asset_ids: List[str]) -> Dict[str, Tuple[float, float]]:
     """Create circular layout for 2D visualization.
@@ -117,6 +147,10 @@ def _create_2d_relationship_traces(
     show_income_comparison: bool = True,
     show_regulatory: bool = True,
     show_all_relationships: bool = False,
+    trace_cls: type = go.Scatter,
+    max_edges: Optional[int] = None,
+    min_strength_percentile: Optional[float] = None,
+    layout_key: Optional[Hashable] = None,
 ) -> List[go.Scatter]:
     """Create 2D relationship traces with filtering.
 
@@ -132,6 +166,14 @@ def _create_2d_relationship_traces(
         show_income_comparison: Show income comparison relationships
         show_regulatory: Show regulatory relationships
         show_all_relationships: Master toggle to show all relationships
+        trace_cls: Trace class, ``go.Scatter`` (SVG) or ``go.Scattergl`` (WebGL)
+        max_edges: Optional edge budget; only the strongest visible edges
+            are kept
+        min_strength_percentile: Optional strength percentile (0-100) of the
+            visible edges below which edges are dropped
+        layout_key: Optional key identifying ``positions`` and ``asset_ids``
+            within one graph version, such as the layout type. Without it the
+            trace cache only matches when the same objects are passed again.
 
     Returns:
         List of Plotly Scatter traces for relationships
@@ -139,81 +181,185 @@ def _create_2d_relationship_traces(
     if not asset_ids or not positions:
         return []
 
-    traces = []
-    asset_id_set = set(asset_ids)
-
     # Construct relationship filters dictionary
-    relationship_filters = {
-        "same_sector": show_same_sector,
-        "market_cap_similar": show_market_cap,
-        "correlation": show_correlation,
-        "corporate_bond_to_equity": show_corporate_bond,
-        "commodity_currency": show_commodity_currency,
-        "income_comparison": show_income_comparison,
-        "regulatory_impact": show_regulatory,
-    }
-
-    # Group relationships by type
-    relationship_groups = {}
-
-    for source_id in asset_ids:
-        if source_id not in graph.relationships:
-            continue
-
-        for target_id, rel_type, strength in graph.relationships[source_id]:
-            # Skip if target not in positions
-            if target_id not in positions or target_id not in asset_id_set:
-                continue
-
-            # Apply filters if not showing all relationships
-            if not show_all_relationships and rel_type in relationship_filters and not relationship_filters[rel_type]:
-                continue
-
-            # Group by relationship type
-            if rel_type not in relationship_groups:
-                relationship_groups[rel_type] = []
-
-            relationship_groups[rel_type].append({"source_id": source_id, "target_id": target_id, "strength": strength})
-
-    # Create traces for each relationship type
-    for rel_type, relationships in relationship_groups.items():
-        if not relationships:
-            continue
-
-        edges_x = []
-        edges_y = []
-        hover_texts = []
-
-        for rel in relationships:
-            source_pos = positions[rel["source_id"]]
-            target_pos = positions[rel["target_id"]]
-
-            edges_x.extend([source_pos[0], target_pos[0], None])
-            edges_y.extend([source_pos[1], target_pos[1], None])
-
-            hover_text = (
-                f"{rel['source_id']} → {rel['target_id']}<br>"
-                f"Type: {rel_type}<br>"
-                f"Strength: {rel['strength']:.2f}"
+    relationship_filters = None
+    if not show_all_relationships:
+        relationship_filters = {
+            "same_sector": show_same_sector,
+            "market_cap_similar": show_market_cap,
+            "correlation": show_correlation,
+            "corporate_bond_to_equity": show_corporate_bond,
+            "commodity_currency": show_commodity_currency,
+            "income_comparison": show_income_comparison,
+            "regulatory_impact": show_regulatory,
+        }
+
+    # Edge selection ranks the visible edges only, so selected bundles are built per filter setting
+    selects = max_edges is not None or min_strength_percentile is not None
+    bundles = _get_2d_relationship_trace_bundles(
+        graph,
+        positions,
+        asset_ids,
+        trace_cls,
+        max_edges,
+        min_strength_percentile,
+        layout_key,
+        relationship_filters if selects else None,
+    )
+    return [trace for rel_type, trace in bundles.items() if not _is_filtered_out(rel_type, relationship_filters)]
+
+
+def _get_2d_relationship_trace_bundles(
+    graph: AssetRelationshipGraph,
+    positions: Dict[str, Tuple[float, float]],
+    asset_ids: List[str],
+    trace_cls: type = go.Scatter,
+    max_edges: Optional[int] = None,
+    min_strength_percentile: Optional[float] = None,
+    layout_key: Optional[Hashable] = None,
+    relationship_filters: Optional[Dict[str, bool]] = None,
+) -> Dict[str, go.Scatter]:
+    """Return one prebuilt trace per relationship type.
+
+    Bundles are cached per graph version, layout, trace class, edge budget,
+    strength percentile and relationship filters. Without filters they hold
+    every type, so changing the relationship filters only selects a different
+    subset of traces.
+
+    Args:
+        graph: Asset relationship graph
+        positions: Dictionary mapping asset IDs to (x, y) positions
+        asset_ids: List of asset IDs
+        trace_cls: Trace class used for the edges
+        max_edges: Optional edge budget; only the strongest edges are kept
+        min_strength_percentile: Optional strength percentile (0-100) below
+            which edges are dropped
+        layout_key: Optional key identifying the layout, see
+            ``_create_2d_relationship_traces``
+        relationship_filters: Optional mapping of relationship type to
+            visibility; hidden types are dropped before edge selection
+
+    Returns:
+        Dictionary mapping relationship type to its Plotly Scatter trace
+    """
+
+    def build() -> Dict[str, go.Scatter]:
+        # Only assets with a position can anchor an edge
+        placed_ids = [asset_id for asset_id in asset_ids if asset_id in positions]
+        if not placed_ids:
+            return {}
+        position_array = np.array([positions[asset_id][:2] for asset_id in placed_ids], dtype=float)
+        asset_id_index = _build_asset_id_index(placed_ids)
+        placed_ids_arr = np.asarray(placed_ids, dtype=object)
+
+        # Gather every edge into parallel columns in one pass, then group by type
+        source_ids, target_ids, rel_types, strengths = relationship_columns(graph, placed_ids)
+        edges = _build_edge_arrays(source_ids, target_ids, rel_types, strengths, asset_id_index, relationship_filters)
+        if max_edges is not None or min_strength_percentile is not None:
+            selected = _select_strongest_edges(edges.strength, max_edges, min_strength_percentile)
+            edges = edges._replace(
+                source_idx=edges.source_idx[selected],
+                target_idx=edges.target_idx[selected],
+                type_codes=edges.type_codes[selected],
+                strength=edges.strength[selected],
             )
-            hover_texts.extend([hover_text, hover_text, None])
-
-        color = REL_TYPE_COLORS.get(rel_type, "#888888")
-        trace_name = rel_type.replace("_", " ").title()
-
-        trace = go.Scatter(
-            x=edges_x,
-            y=edges_y,
-            mode="lines",
-            line=dict(color=color, width=2),
-            hovertext=hover_texts,
-            hoverinfo="text",
-            name=trace_name,
-            showlegend=True,
-        )
-        traces.append(trace)
 
-    return traces
+        bundles: Dict[str, go.Scatter] = {}
+        for type_code, members in _split_edge_groups(edges.type_codes):
+            rel_type = edges.rel_types[type_code]
+            group = _EdgeGroup(edges.source_idx[members], edges.target_idx[members], edges.strength[members])
+            edges_x, edges_y = _build_edge_coordinates_optimized(group.source_idx, group.target_idx, position_array)
+
+            color = REL_TYPE_COLORS.get(rel_type, "#888888")
+            trace_name = rel_type.replace("_", " ").title()
+
+            bundles[rel_type] = trace_cls(
+                x=edges_x,
+                y=edges_y,
+                mode="lines",
+                line=dict(color=color, width=2),
+                customdata=_build_hover_data(group, placed_ids_arr),
+                hovertemplate=_build_hover_template(rel_type, is_bidirectional=False),
+                name=trace_name,
+                showlegend=True,
+            )
+        return bundles
+
+    if layout_key is None:
+        fingerprint = (_graph_fingerprint(graph, asset_ids, positions), _hidden_types(relationship_filters))
+    else:
+        fingerprint = (*_version_fingerprint(graph), layout_key, _hidden_types(relationship_filters))
+    kind = f"relationships_2d:{trace_cls.__name__}:{max_edges}:{min_strength_percentile}"
+    return _get_cached_bundles(graph, kind, fingerprint, build)
+
+
+def _resolve_trace_class(render_mode: str, num_edges: int) -> type:
+    """Pick the Plotly trace class for ``render_mode``.
+
+    Raises:
+        ValueError: If ``render_mode`` is not one of ``RENDER_MODES``
+    """
+    if render_mode not in RENDER_MODES:
+        raise ValueError(f"Invalid render_mode '{render_mode}': expected one of {', '.join(RENDER_MODES)}")
+    if render_mode == "webgl" or (render_mode == "auto" and num_edges > WEBGL_EDGE_THRESHOLD):
+        return go.Scattergl
+    return go.Scatter
+
+
+def _configure_2d_layout(fig: go.Figure, title: str, annotation_text: str) -> None:
+    """Apply the shared 2D layout with a footer annotation."""
+    fig.update_layout(
+        title=title,
+        plot_bgcolor="white",
+        paper_bgcolor="#F8F9FA",
+        xaxis=dict(
+            showgrid=True,
+            gridcolor="rgba(200, 200, 200, 0.3)",
+            zeroline=False,
+            showticklabels=False,
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridcolor="rgba(200, 200, 200, 0.3)",
+            zeroline=False,
+            showticklabels=False,
+        ),
+        width=1200,
+        height=800,
+        hovermode="closest",
+        showlegend=True,
+        legend=dict(
+            x=0.02,
+            y=0.98,
+            bgcolor="rgba(255, 255, 255, 0.8)",
+            bordercolor="rgba(0, 0, 0, 0.3)",
+            borderwidth=1,
+        ),
+        annotations=[
+            dict(
+                text=annotation_text,
+                xref="paper",
+                yref="paper",
+                x=0.5,
+                y=-0.05,
+                showarrow=False,
+                font=dict(size=12, color="gray"),
+            )
+        ],
+    )
+
+
+def _visualize_overview_2d(graph: AssetRelationshipGraph, group_by: str) -> go.Figure:
+    """Render the aggregated overview used as the zoomed-out level of detail."""
+    meta = aggregate_graph(graph, group_by)
+    fig = go.Figure()
+    fig.add_traces(_create_meta_graph_traces(meta, _meta_graph_positions(len(meta.nodes), 2)))
+    _configure_2d_layout(
+        fig,
+        f"2D Asset Relationship Network (Overview by {meta.group_by.replace('_', ' ')})",
+        f"Level of detail: overview ({len(meta.nodes)} groups)",
+    )
+    return fig
 
 
 def visualize_2d_graph(
@@ -227,6 +373,12 @@ def visualize_2d_graph(
     show_income_comparison: bool = True,
     show_regulatory: bool = True,
     show_all_relationships: bool = False,
+    render_mode: str = "auto",
+    level_of_detail: str = "auto",
+    max_edges: int = LOD_MAX_EDGES,
+    max_nodes: int = LOD_MAX_NODES,
+    overview_group_by: str = "sector",
+    min_strength_percentile: Optional[float] = None,
 ) -> go.Figure:
     """Create 2D visualization of asset relationship graph.
 
@@ -241,12 +393,26 @@ def visualize_2d_graph(
         show_income_comparison: Show income comparison relationships
         show_regulatory: Show regulatory relationships
         show_all_relationships: Master toggle to show all relationships
+        render_mode: 'svg', 'webgl' or 'auto' (WebGL above
+            ``WEBGL_EDGE_THRESHOLD`` edges)
+        level_of_detail: 'full', 'reduced' (strongest ``max_edges`` edges,
+            no node labels), 'overview' (meta-nodes per group) or 'auto'
+        max_edges: Edge budget for the reduced level of detail, spent on the
+            relationship types left visible by the show_* filters
+        max_nodes: Node count above which 'auto' switches to the overview
+        overview_group_by: Grouping of the overview, one of
+            ``GROUPINGS`` ('sector', 'asset_class' or 'community')
+        min_strength_percentile: Optional percentile (0-100) of relationship
+            strength below which edges are dropped, at the full and reduced
+            levels of detail. Computed over the relationship types left
+            visible and applied before the ``max_edges`` budget.
 
     Returns:
         Plotly Figure object with 2D visualization
     """
     if not isinstance(graph, AssetRelationshipGraph):
         raise ValueError("Invalid graph data provided")
+    _check_strength_percentile(min_strength_percentile)
 
     # Get asset data
     asset_ids = list(graph.assets.keys())
@@ -261,6 +427,13 @@ def visualize_2d_graph(
         )
         return fig
 
+    lod = _resolve_level_of_detail(graph, level_of_detail, max_edges, max_nodes)
+    if lod == "overview":
+        return _visualize_overview_2d(graph, overview_group_by)
+    edge_budget = max_edges if lod == "reduced" else None
+    num_edges = _edge_count(graph)
+    trace_cls = _resolve_trace_class(render_mode, num_edges if edge_budget is None else min(num_edges, edge_budget))
+
     # Create layout based on type
     if layout_type == "circular":
         positions = _create_circular_layout(asset_ids)
@@ -274,7 +447,7 @@ def visualize_2d_graph(
                 asset_ids_ordered,
                 _,
                 _,
-            ) = graph.get_3d_visualization_data_enhanced()
+            ) = _graph_node_data(graph)
             # Convert array to dictionary
             positions_3d = {asset_ids_ordered[i]: tuple(positions_3d_array[i]) for i in range(len(asset_ids_ordered))}
             positions = _create_spring_layout_2d(positions_3d, asset_ids)
@@ -298,10 +471,13 @@ def visualize_2d_graph(
         show_income_comparison=show_income_comparison,
         show_regulatory=show_regulatory,
         show_all_relationships=show_all_relationships,
+        trace_cls=trace_cls,
+        max_edges=edge_budget,
+        min_strength_percentile=min_strength_percentile,
+        layout_key=layout_type,
     )
 
-    for trace in relationship_traces:
-        fig.add_trace(trace)
+    fig.add_traces(relationship_traces)
 
     # Add node trace
     node_x = [positions[asset_id][0] for asset_id in asset_ids]
@@ -339,17 +515,18 @@ def visualize_2d_graph(
         )
         hover_texts.append(hover_text)
 
-    node_trace = go.Scatter(
+    show_labels = lod == "full"
+    node_trace = trace_cls(
         x=node_x,
         y=node_y,
-        mode="markers+text",
+        mode="markers+text" if show_labels else "markers",
         marker=dict(
             size=node_sizes,
             color=colors,
             opacity=0.9,
             line=dict(color="rgba(0,0,0,0.8)", width=2),
         ),
-        text=asset_ids,
+        text=asset_ids if show_labels else None,
         hovertext=hover_texts,
         hoverinfo="text",
         textposition="top center",
@@ -362,44 +539,9 @@ def visualize_2d_graph(
 
     # Update layout
     layout_name = layout_type.capitalize()
-    fig.update_layout(
-        title=f"2D Asset Relationship Network ({layout_name} Layout)",
-        plot_bgcolor="white",
-        paper_bgcolor="#F8F9FA",
-        xaxis=dict(
-            showgrid=True,
-            gridcolor="rgba(200, 200, 200, 0.3)",
-            zeroline=False,
-            showticklabels=False,
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor="rgba(200, 200, 200, 0.3)",
-            zeroline=False,
-            showticklabels=False,
-        ),
-        width=1200,
-        height=800,
-        hovermode="closest",
-        showlegend=True,
-        legend=dict(
-            x=0.02,
-            y=0.98,
-            bgcolor="rgba(255, 255, 255, 0.8)",
-            bordercolor="rgba(0, 0, 0, 0.3)",
-            borderwidth=1,
-        ),
-        annotations=[
-            dict(
-                text=f"Layout: {layout_name}",
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=-0.05,
-                showarrow=False,
-                font=dict(size=12, color="gray"),
-            )
-        ],
-    )
+    annotation_text = f"Layout: {layout_name}"
+    if lod == "reduced":
+        annotation_text += f" | Level of detail: strongest {edge_budget} relationships"
+    _configure_2d_layout(fig, f"2D Asset Relationship Network ({layout_name} Layout)", annotation_text)
 
     return fig
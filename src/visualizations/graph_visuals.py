@@ -1,19 +1,47 @@
 import logging
 import re
 import threading
+import weakref
 from collections import defaultdict
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from collections.abc import Mapping
+from itertools import repeat
+from operator import itemgetter
+from typing import Any, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple, TypeVar
 
 import numpy as np
 import plotly.graph_objects as go
 
 from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.graph_aggregation import MetaGraph, aggregate_graph, relationship_columns
 
 logger = logging.getLogger(__name__)
 
 # Thread lock for protecting concurrent access to graph.relationships
 _graph_access_lock = threading.RLock()
 
+# Precomputed trace bundles per graph: {graph: {kind: (fingerprint, bundles)}}.
+# Entries disappear together with the graph object.
+_trace_bundle_cache: "weakref.WeakKeyDictionary[AssetRelationshipGraph, Dict[str, Tuple[Hashable, Any]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Render inputs that passed validation per graph: {graph: {kind: fingerprint}}.
+_validated_inputs: "weakref.WeakKeyDictionary[AssetRelationshipGraph, Dict[str, Hashable]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+_T = TypeVar("_T")
+
+# Input validation modes: "once" validates each graph version on its first
+# render only, "strict" validates on every render.
+VALIDATION_MODES = ("once", "strict")
+
+# Level-of-detail budgets: above these sizes a figure is reduced so that its
+# payload stays bounded regardless of graph size.
+LOD_MAX_EDGES = 20_000
+LOD_MAX_NODES = 2_000
+LEVELS_OF_DETAIL = ("auto", "full", "reduced", "overview")
+
 # Color and style mapping for relationship types (shared constant)
 REL_TYPE_COLORS = defaultdict(
     lambda: "#888888",
@@ -60,6 +88,162 @@ def _is_valid_color_format(color: str) -> bool:
     return True
 
 
+class _Identity:
+    """Hashable handle that compares by object identity.
+
+    Holding the object keeps it alive, so its ``id`` cannot be reused by a
+    different object while a cache key refers to it.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Identity) and other.obj is self.obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+
+def _version_fingerprint(graph: AssetRelationshipGraph) -> Tuple[Hashable, ...]:
+    """Identify one graph version in O(1).
+
+    Keys on the graph mutation counter and the identity of
+    ``graph.relationships``; edits made without ``graph.touch()`` are not seen.
+    """
+    return (getattr(graph, "version", None), _Identity(graph.relationships))
+
+
+def _graph_fingerprint(
+    graph: AssetRelationshipGraph,
+    asset_ids: Sequence[str],
+    positions: Any,
+) -> Hashable:
+    """Identify one graph version rendered at one set of node positions.
+
+    ``asset_ids`` and ``positions`` are keyed by identity, so renders reuse the
+    cache when they pass the same objects, as ``_graph_node_data`` does for
+    each graph version.
+    """
+    return (*_relationships_fingerprint(graph, asset_ids), _Identity(positions))
+
+
+def _relationships_fingerprint(graph: AssetRelationshipGraph, asset_ids: Sequence[str]) -> Tuple[Hashable, ...]:
+    """Identify one graph version restricted to ``asset_ids``."""
+    return (*_version_fingerprint(graph), _Identity(asset_ids))
+
+
+def _graph_node_data(graph: AssetRelationshipGraph) -> Tuple[np.ndarray, List[str], List[str], List[str]]:
+    """Return ``graph.get_3d_visualization_data_enhanced()``, computed once per graph version.
+
+    The returned arrays and lists are shared between renders and must not be
+    modified.
+    """
+    return _get_cached_bundles(
+        graph, "node_data", _version_fingerprint(graph), graph.get_3d_visualization_data_enhanced
+    )
+
+
+def _edge_count(graph: AssetRelationshipGraph) -> int:
+    """Return the number of relationships of ``graph``, counted once per graph version."""
+    return _get_cached_bundles(
+        graph, "edge_count", _version_fingerprint(graph), lambda: sum(map(len, graph.relationships.values()))
+    )
+
+
+def _safe_fingerprint(make: Callable[[], Hashable]) -> Optional[Hashable]:
+    """Return ``make()``, or None when malformed inputs cannot be fingerprinted."""
+    try:
+        return make()
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+def _check_validation_mode(validation: str) -> None:
+    """Raise ValueError unless ``validation`` is one of ``VALIDATION_MODES``."""
+    if validation not in VALIDATION_MODES:
+        raise ValueError(
+            f"Invalid validation mode '{validation}': expected one of {', '.join(VALIDATION_MODES)}"
+        )
+
+
+def _check_strength_percentile(min_strength_percentile: Optional[float]) -> None:
+    """Raise ValueError unless ``min_strength_percentile`` is None or within 0-100."""
+    if min_strength_percentile is not None and not 0 <= min_strength_percentile <= 100:
+        raise ValueError(
+            f"Invalid min_strength_percentile {min_strength_percentile}: expected a value between 0 and 100"
+        )
+
+
+def _is_validated(graph: AssetRelationshipGraph, kind: str, fingerprint: Optional[Hashable]) -> bool:
+    """Return True if ``graph`` already passed the ``kind`` validation for ``fingerprint``."""
+    if fingerprint is None:
+        return False
+    with _graph_access_lock:
+        return _validated_inputs.get(graph, {}).get(kind) == fingerprint
+
+
+def _mark_validated(graph: AssetRelationshipGraph, kind: str, fingerprint: Optional[Hashable]) -> None:
+    """Record that ``graph`` passed the ``kind`` validation for ``fingerprint``."""
+    if fingerprint is None:
+        return
+    with _graph_access_lock:
+        _validated_inputs.setdefault(graph, {})[kind] = fingerprint
+
+
+def _validate_once(
+    graph: AssetRelationshipGraph,
+    kind: str,
+    fingerprint: Optional[Hashable],
+    validate: Callable[[], Any],
+    validation: str = "once",
+) -> None:
+    """Run ``validate`` unless ``graph`` already passed it with the same inputs.
+
+    With ``validation="strict"`` it always runs. Only successful validations
+    are recorded, so invalid inputs keep failing on every render.
+    """
+    _check_validation_mode(validation)
+    if validation == "once" and _is_validated(graph, kind, fingerprint):
+        return
+    validate()
+    _mark_validated(graph, kind, fingerprint)
+
+
+def _get_cached_bundles(
+    graph: AssetRelationshipGraph,
+    kind: str,
+    fingerprint: Hashable,
+    build: Callable[[], _T],
+) -> _T:
+    """Return the bundles cached for ``graph`` under ``kind``, rebuilding them on a fingerprint change.
+
+    Cached bundles are shared between figures and must be treated as read-only;
+    ``go.Figure.add_traces`` copies traces, so adding them to a figure is safe.
+    """
+    with _graph_access_lock:
+        entry = _trace_bundle_cache.get(graph, {}).get(kind)
+    if entry is not None and entry[0] == fingerprint:
+        return entry[1]
+
+    bundles = build()
+    with _graph_access_lock:
+        _trace_bundle_cache.setdefault(graph, {})[kind] = (fingerprint, bundles)
+    return bundles
+
+
+def _is_filtered_out(rel_type: str, relationship_filters: Optional[Dict[str, bool]]) -> bool:
+    """Return True if ``relationship_filters`` explicitly hides ``rel_type``."""
+    return bool(relationship_filters) and not relationship_filters.get(rel_type, True)
+
+
+def _hidden_types(relationship_filters: Optional[Dict[str, bool]]) -> Tuple[str, ...]:
+    """Return the relationship types hidden by ``relationship_filters``, sorted, as a cache key."""
+    return tuple(sorted(rel_type for rel_type, visible in (relationship_filters or {}).items() if not visible))
+
+
 def _build_asset_id_index(asset_ids: List[str]) -> Dict[str, int]:
     """Build O(1) lookup index for asset IDs to their positions."""
     return {asset_id: idx for idx, asset_id in enumerate(asset_ids)}
@@ -156,11 +340,11 @@ def _build_relationship_index(
             f"got {type(graph).__name__}"
         )
 
-    # Validate graph.relationships exists and is a dictionary
+    # Validate graph.relationships exists and is a mapping (a dict, or read-only for mapped snapshots)
     if not hasattr(graph, "relationships"):
         raise ValueError("Invalid graph: missing 'relationships' attribute")
 
-    if not isinstance(graph.relationships, dict):
+    if not isinstance(graph.relationships, Mapping):
         raise TypeError(
             f"Invalid graph data: graph.relationships must be a dictionary, "
             f"got {type(graph.relationships).__name__}"
@@ -262,6 +446,8 @@ def _create_node_trace(
     asset_ids: List[str],
     colors: List[str],
     hover_texts: List[str],
+    show_labels: bool = True,
+    validate: bool = True,
 ) -> go.Scatter3d:
     """Create node trace for 3D visualization with comprehensive input validation.
 
@@ -282,6 +468,10 @@ def _create_node_trace(
             length must match positions)
         colors: List of node colors(length must match positions)
         hover_texts: List of hover texts(length must match positions)
+        show_labels: Draw asset IDs next to the markers. Disabled for large
+            graphs to keep the payload small (hover texts are kept).
+        validate: Run the detailed content checks. Callers that already
+            validated the inputs (see ``_validate_node_data``) pass False.
 
     Returns:
         Plotly Scatter3d trace for nodes
@@ -324,7 +514,8 @@ def _create_node_trace(
 
     # Comprehensive validation: detailed checks on content, numeric types, and finite values
     # Delegates to shared validator to ensure consistency across all visualization functions
-    _validate_visualization_data(positions, asset_ids, colors, hover_texts)
+    if validate:
+        _validate_visualization_data(positions, asset_ids, colors, hover_texts)
 
     # Edge case validation: Ensure inputs are not empty
     if len(asset_ids) == 0:
@@ -335,7 +526,7 @@ def _create_node_trace(
         x=positions[:, 0],
         y=positions[:, 1],
         z=positions[:, 2],
-        mode="markers+text",
+        mode="markers+text" if show_labels else "markers",
         marker=dict(
             size=15,
             color=colors,
@@ -346,7 +537,7 @@ def _create_node_trace(
             ),
             symbol="circle",
         ),
-        text=asset_ids,
+        text=asset_ids if show_labels else None,
         hovertext=hover_texts,
         hoverinfo="text",
         textposition="top center",
@@ -393,7 +584,11 @@ def _calculate_visible_relationships(relationship_traces: List[go.Scatter3d]) ->
     """
     try:
         return (
-            sum(len(getattr(trace, "x", []) or []) for trace in relationship_traces)
+            sum(
+                len(x)
+                for x in (getattr(trace, "x", None) for trace in relationship_traces)
+                if x is not None
+            )
             // 3
         )
     except Exception:  # pylint: disable=broad-except
@@ -611,40 +806,253 @@ def _validate_visualization_data(
     _validate_asset_ids_uniqueness(asset_ids)
 
 
- def visualize_3d_graph(graph: AssetRelationshipGraph) -> go.Figure:
-     """Create enhanced 3D visualization of asset relationship graph
-     with improved relationship visibility"""
-     if not isinstance(graph, AssetRelationshipGraph) or not hasattr(
-         graph, "get_3d_visualization_data_enhanced"
-     ):
-         raise ValueError("Invalid graph data provided")
+def _validate_node_data(
+    graph: AssetRelationshipGraph,
+    positions: np.ndarray,
+    asset_ids: List[str],
+    colors: List[str],
+    hover_texts: List[str],
+    validation: str = "once",
+) -> None:
+    """Validate the node data of ``graph``, once per graph version unless strict.
+
+    The node data is derived from the graph, so a graph version whose node data
+    passed validation is not checked again by later renders.
+    """
+    fingerprint = _safe_fingerprint(lambda: _graph_fingerprint(graph, asset_ids, positions))
+    _validate_once(
+        graph,
+        "node_data",
+        fingerprint,
+        lambda: _validate_visualization_data(positions, asset_ids, colors, hover_texts),
+        validation,
+    )
+
+
+def _relationship_columns_once(
+    graph: AssetRelationshipGraph, asset_ids: List[str], validation: str = "once"
+) -> Tuple[List[str], List[str], List[str], List[float]]:
+    """Return ``(source_ids, target_ids, rel_types, strengths)`` edge columns of ``graph``.
+
+    The first time a graph version is indexed (and on every call with
+    ``validation="strict"``) the columns come from the validating
+    ``_build_relationship_index``. Later calls read them straight from
+    ``graph.relationships`` without per-tuple checks; edges to unknown assets
+    and duplicates are then dropped by the array stages.
+    """
+    _check_validation_mode(validation)
+    fingerprint = _safe_fingerprint(lambda: _relationships_fingerprint(graph, asset_ids))
+    if validation == "once" and _is_validated(graph, "relationships", fingerprint):
+        with _graph_access_lock:
+            return relationship_columns(graph)
+
+    relationship_index = _build_relationship_index(graph, asset_ids)
+    _mark_validated(graph, "relationships", fingerprint)
+    keys = list(relationship_index)
+    return (
+        list(map(itemgetter(0), keys)),
+        list(map(itemgetter(1), keys)),
+        list(map(itemgetter(2), keys)),
+        list(relationship_index.values()),
+    )
+
+
+def _resolve_level_of_detail(
+    graph: AssetRelationshipGraph,
+    level_of_detail: str,
+    max_edges: int,
+    max_nodes: int,
+) -> str:
+    """Resolve ``"auto"`` into a concrete level of detail for ``graph``.
+
+    Returns:
+        ``"full"`` when the graph fits both budgets, ``"overview"`` when it has
+        more than ``max_nodes`` nodes (and assets to aggregate), otherwise
+        ``"reduced"``.
+
+    Raises:
+        ValueError: If ``level_of_detail`` is not one of ``LEVELS_OF_DETAIL``
+    """
+    if level_of_detail not in LEVELS_OF_DETAIL:
+        raise ValueError(
+            f"Invalid level_of_detail '{level_of_detail}': "
+            f"expected one of {', '.join(LEVELS_OF_DETAIL)}"
+        )
+    if level_of_detail != "auto":
+        return level_of_detail
+
+    num_nodes = max(len(graph.assets), len(graph.relationships))
+    if num_nodes > max_nodes and graph.assets:
+        return "overview"
+    if num_nodes > max_nodes or _edge_count(graph) > max_edges:
+        return "reduced"
+    return "full"
+
+
+def _meta_graph_positions(num_nodes: int, dims: int) -> np.ndarray:
+    """Place meta-nodes evenly on a circle in ``dims`` dimensions."""
+    theta = np.linspace(0, 2 * np.pi, num_nodes, endpoint=False)
+    positions = np.zeros((num_nodes, dims))
+    positions[:, 0] = np.cos(theta)
+    positions[:, 1] = np.sin(theta)
+    return positions
+
 
-     positions, asset_ids, colors, hover_texts = (
-         graph.get_3d_visualization_data_enhanced()
-     )
+def _create_meta_graph_traces(meta: MetaGraph, positions: np.ndarray) -> List[go.Scatter3d]:
+    """Create the meta-edge and meta-node traces of an aggregated overview.
 
-     # Validate visualization data to prevent runtime errors
-     _validate_visualization_data(positions, asset_ids, colors, hover_texts)
+    Args:
+        meta: Aggregated meta-graph
+        positions: Meta-node positions of shape (n, 3) for a 3D figure or
+            (n, 2) for a 2D figure
+
+    Returns:
+        List with one trace for inter-group flows (omitted when there are none)
+        and one trace for the meta-nodes
+    """
+    trace_cls = go.Scatter3d if positions.shape[1] == 3 else go.Scatter
+    axes = "xyz"[: positions.shape[1]]
+    labels = np.asarray(meta.nodes, dtype=object)
+    internal = meta.sources == meta.targets
+    traces = []
+
+    if (~internal).any():
+        source_idx = meta.sources[~internal]
+        target_idx = meta.targets[~internal]
+        coords = _build_edge_coordinates_optimized(source_idx, target_idx, positions)
+        customdata = np.full((len(source_idx) * 3, 4), None, dtype=object)
+        for offset in (0, 1):
+            customdata[offset::3, 0] = labels[source_idx]
+            customdata[offset::3, 1] = labels[target_idx]
+            customdata[offset::3, 2] = meta.edge_counts[~internal]
+            customdata[offset::3, 3] = meta.mean_strength[~internal]
+        traces.append(
+            trace_cls(
+                **dict(zip(axes, coords)),
+                mode="lines",
+                line=dict(color="rgba(90, 90, 90, 0.6)", width=3),
+                customdata=customdata,
+                hovertemplate=(
+                    "%{customdata[0]} → %{customdata[1]}<br>Relationships: %{customdata[2]}<br>"
+                    "Mean strength: %{customdata[3]:.2f}<extra></extra>"
+                ),
+                name=f"{meta.group_by.replace('_', ' ').title()} Flows",
+            )
+        )
+
+    internal_counts = np.zeros(len(meta.nodes), dtype=np.int64)
+    internal_counts[meta.sources[internal]] = meta.edge_counts[internal]
+    largest = max(int(meta.node_sizes.max()), 1) if len(meta.nodes) else 1
+    traces.append(
+        trace_cls(
+            **{axis: positions[:, dim] for dim, axis in enumerate(axes)},
+            mode="markers+text",
+            marker=dict(
+                size=12 + 38 * np.sqrt(meta.node_sizes / largest),
+                color="#4ECDC4",
+                opacity=0.9,
+                line=dict(color="rgba(0,0,0,0.8)", width=2),
+            ),
+            text=meta.nodes,
+            customdata=np.column_stack([meta.node_sizes, internal_counts]),
+            hovertemplate=(
+                "%{text}<br>Assets: %{customdata[0]}<br>"
+                "Internal relationships: %{customdata[1]}<extra></extra>"
+            ),
+            textposition="top center",
+            name=meta.group_by.replace("_", " ").title(),
+        )
+    )
+    return traces
+
+
+def _visualize_overview_3d(graph: AssetRelationshipGraph, group_by: str) -> go.Figure:
+    """Render the aggregated overview used as the zoomed-out level of detail."""
+    meta = aggregate_graph(graph, group_by)
+    fig = go.Figure()
+    fig.add_traces(_create_meta_graph_traces(meta, _meta_graph_positions(len(meta.nodes), 3)))
+    title = (
+        f"Financial Asset Network - Overview by {meta.group_by.replace('_', ' ')}: "
+        f"{len(meta.nodes)} groups, {int(meta.edge_counts.sum())} Relationships"
+    )
+    _configure_3d_layout(fig, title)
+    return fig
+
+
+def visualize_3d_graph(
+    graph: AssetRelationshipGraph,
+    level_of_detail: str = "auto",
+    max_edges: int = LOD_MAX_EDGES,
+    max_nodes: int = LOD_MAX_NODES,
+    overview_group_by: str = "sector",
+    validation: str = "once",
+    min_strength_percentile: Optional[float] = None,
+) -> go.Figure:
+    """Create enhanced 3D visualization of asset relationship graph
+    with improved relationship visibility.
+
+    Args:
+        graph: Asset relationship graph to visualize
+        level_of_detail: One of ``LEVELS_OF_DETAIL``. ``"full"`` renders
+            everything, ``"reduced"`` keeps the ``max_edges`` strongest edges
+            and drops node labels, ``"overview"`` collapses groups of assets
+            into meta-nodes. ``"auto"`` (default) picks based on the budgets.
+        max_edges: Edge budget for the reduced level of detail
+        max_nodes: Node count above which ``"auto"`` switches to the overview
+        overview_group_by: Grouping of the overview, one of ``GROUPINGS``
+            (``"sector"``, ``"asset_class"`` or ``"community"``)
+        validation: One of ``VALIDATION_MODES``. ``"once"`` (default) checks
+            the node data and relationships of a graph version on its first
+            render only; ``"strict"`` checks them on every render.
+        min_strength_percentile: Optional percentile (0-100) of relationship
+            strength below which edges are dropped, at the full and reduced
+            levels of detail. Applied before the ``max_edges`` budget.
+    """
+    if not isinstance(graph, AssetRelationshipGraph) or not hasattr(
+        graph, "get_3d_visualization_data_enhanced"
+    ):
+        raise ValueError("Invalid graph data provided")
 
-     fig = go.Figure()
+    _check_validation_mode(validation)
+    _check_strength_percentile(min_strength_percentile)
+    lod = _resolve_level_of_detail(graph, level_of_detail, max_edges, max_nodes)
+    if lod == "overview":
+        return _visualize_overview_3d(graph, overview_group_by)
+    edge_budget = max_edges if lod == "reduced" else None
 
-     # Create separate traces for different relationship types and directions
-     try:
-         relationship_traces = _create_relationship_traces(graph, positions, asset_ids)
-     except Exception as exc:  # pylint: disable=broad-except
-         logger.exception("Failed to create relationship traces: %s", exc)
-         relationship_traces = []
+    positions, asset_ids, colors, hover_texts = _graph_node_data(graph)
 
-     # Batch add traces
-     if relationship_traces:
-         try:
-             fig.add_traces(relationship_traces)
-         except Exception as exc:  # pylint: disable=broad-except
-             logger.exception("Failed to add relationship traces to figure: %s", exc)
+    # Validate visualization data to prevent runtime errors
+    _validate_node_data(graph, positions, asset_ids, colors, hover_texts, validation)
+
+    fig = go.Figure()
+
+    # Create separate traces for different relationship types and directions
+    try:
+        relationship_traces = _create_relationship_traces(
+            graph,
+            positions,
+            asset_ids,
+            max_edges=edge_budget,
+            min_strength_percentile=min_strength_percentile,
+            validation=validation,
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.exception("Failed to create relationship traces: %s", exc)
+        relationship_traces = []
+
+    # Batch add traces
+    if relationship_traces:
+        try:
+            fig.add_traces(relationship_traces)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.exception("Failed to add relationship traces to figure: %s", exc)
 
     # Add directional arrows for unidirectional relationships
     try:
-        arrow_traces = _create_directional_arrows(graph, positions, asset_ids)
+        arrow_traces = _create_directional_arrows(
+            graph, positions, asset_ids, max_edges=edge_budget, min_strength_percentile=min_strength_percentile
+        )
     except Exception as exc:  # pylint: disable=broad-except
         logger.exception("Failed to create directional arrow traces: %s", exc)
         arrow_traces = []
@@ -656,13 +1064,13 @@ def _validate_visualization_data(
             logger.exception("Failed to add arrow traces to figure: %s", exc)
 
     # Add nodes with enhanced styling
-    node_trace = _create_node_trace(positions, asset_ids, colors, hover_texts)
+    node_trace = _create_node_trace(
+        positions, asset_ids, colors, hover_texts, show_labels=lod == "full", validate=False
+    )
     fig.add_trace(node_trace)
 
     # Calculate total relationships for dynamic title
-    total_relationships = (
-        sum(len(getattr(trace, "x", []) or []) for trace in relationship_traces) // 3
-    )
+    total_relationships = _calculate_visible_relationships(relationship_traces)
     dynamic_title = _generate_dynamic_title(len(asset_ids), total_relationships)
 
     fig.update_layout(
@@ -701,99 +1109,223 @@ def _validate_visualization_data(
     return fig
 
 
-def _collect_and_group_relationships(
-    graph: AssetRelationshipGraph,
-    asset_ids: Iterable[str],
-    relationship_filters: Optional[Dict[str, bool]] = None,
-) -> Dict[Tuple[str, bool], List[dict]]:
-    """Collect and group relationships with directionality info in a single pass."""
-    relationship_index = _build_relationship_index(graph, asset_ids)
+class _EdgeArrays(NamedTuple):
+    """Columnar edge list: one entry per relationship, indexed into ``asset_ids``."""
 
-    processed_pairs: Set[Tuple[str, str, str]] = set()
-    relationship_groups: Dict[Tuple[str, bool], List[dict]] = defaultdict(list)
+    source_idx: np.ndarray
+    target_idx: np.ndarray
+    type_codes: np.ndarray
+    strength: np.ndarray
+    rel_types: List[str]
 
-    for (source_id, target_id, rel_type), strength in relationship_index.items():
-        if (
-            relationship_filters
-            and rel_type in relationship_filters
-            and not relationship_filters[rel_type]
-        ):
-            continue
 
-        # Canonical pair key for bidirectional detection
-        if source_id <= target_id:
-            pair_key: Tuple[str, str, str] = (source_id, target_id, rel_type)
-        else:
-            pair_key = (target_id, source_id, rel_type)
-
-        # Reverse lookup for bidirectionality
-        is_bidirectional = (target_id, source_id, rel_type) in relationship_index
-
-        # Avoid duplicate entries for bidirectional edges
-        if is_bidirectional and pair_key in processed_pairs:
-            continue
-        if is_bidirectional:
-            processed_pairs.add(pair_key)
-
-        relationship_groups[(rel_type, is_bidirectional)].append(
-            {
-                "source_id": source_id,
-                "target_id": target_id,
-                "strength": float(strength),
-            }
-        )
+class _EdgeGroup(NamedTuple):
+    """Edges sharing one ``(rel_type, is_bidirectional)`` trace."""
 
-    return relationship_groups
+    source_idx: np.ndarray
+    target_idx: np.ndarray
+    strength: np.ndarray
 
 
-def _build_edge_coordinates_optimized(
-    relationships: List[dict],
-    positions: np.ndarray,
+def _build_edge_arrays(
+    source_ids: Sequence[str],
+    target_ids: Sequence[str],
+    rel_types: Sequence[str],
+    strengths: Sequence[float],
     asset_id_index: Dict[str, int],
-) -> Tuple[List[Optional[float]], List[Optional[float]], List[Optional[float]]]:
-    """Build edge coordinate lists for relationships using optimized O(1) lookups."""
-    num_edges = len(relationships)
-    edges_x: List[Optional[float]] = [None] * (num_edges * 3)
-    edges_y: List[Optional[float]] = [None] * (num_edges * 3)
-    edges_z: List[Optional[float]] = [None] * (num_edges * 3)
+    relationship_filters: Optional[Dict[str, bool]] = None,
+) -> _EdgeArrays:
+    """Convert parallel edge columns into index arrays.
 
-    for i, rel in enumerate(relationships):
-        source_idx = asset_id_index[rel["source_id"]]
-        target_idx = asset_id_index[rel["target_id"]]
+    Lookups run through ``map``/``np.fromiter`` so no Python bytecode executes
+    per edge. Edges whose endpoints are not in ``asset_id_index`` or whose type
+    is disabled in ``relationship_filters`` are dropped.
+    """
+    num_edges = len(source_ids)
+    source_idx = np.fromiter(map(asset_id_index.get, source_ids, repeat(-1)), dtype=np.intp, count=num_edges)
+    target_idx = np.fromiter(map(asset_id_index.get, target_ids, repeat(-1)), dtype=np.intp, count=num_edges)
+
+    type_list = list(dict.fromkeys(rel_types))
+    type_code_index = {rel_type: code for code, rel_type in enumerate(type_list)}
+    type_codes = np.fromiter(map(type_code_index.__getitem__, rel_types), dtype=np.intp, count=num_edges)
+    strength = np.asarray(strengths, dtype=float).reshape(num_edges)
+
+    keep = (source_idx >= 0) & (target_idx >= 0)
+    if relationship_filters:
+        hidden_codes = [
+            type_code_index[rel_type]
+            for rel_type, visible in relationship_filters.items()
+            if not visible and rel_type in type_code_index
+        ]
+        keep &= ~np.isin(type_codes, hidden_codes)
+
+    return _EdgeArrays(
+        source_idx=source_idx[keep],
+        target_idx=target_idx[keep],
+        type_codes=type_codes[keep],
+        strength=strength[keep],
+        rel_types=type_list,
+    )
 
-        base_idx = i * 3
 
-        edges_x[base_idx] = positions[source_idx, 0]
-        edges_x[base_idx + 1] = positions[target_idx, 0]
+def _drop_duplicate_edges(edges: _EdgeArrays, num_nodes: int) -> _EdgeArrays:
+    """Keep one edge per ``(source, target, rel_type)``.
 
-        edges_y[base_idx] = positions[source_idx, 1]
-        edges_y[base_idx + 1] = positions[target_idx, 1]
+    Matches the relationship index: an edge keeps the position of its first
+    occurrence and the strength of its last one.
+    """
+    n = max(num_nodes, 1)
+    keys = (edges.type_codes * n + edges.source_idx) * n + edges.target_idx
+    unique_keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    if len(unique_keys) == len(keys):
+        return edges
+
+    inverse = inverse.reshape(-1)
+    last = np.zeros(len(unique_keys), dtype=np.intp)
+    np.maximum.at(last, inverse, np.arange(len(keys)))
+    keep = np.sort(first)
+    return edges._replace(
+        source_idx=edges.source_idx[keep],
+        target_idx=edges.target_idx[keep],
+        type_codes=edges.type_codes[keep],
+        strength=edges.strength[last[inverse[keep]]],
+    )
 
-        edges_z[base_idx] = positions[source_idx, 2]
-        edges_z[base_idx + 1] = positions[target_idx, 2]
 
-    return edges_x, edges_y, edges_z
+def _find_bidirectional_edges(edges: _EdgeArrays, num_nodes: int) -> np.ndarray:
+    """Return a boolean mask marking edges whose reverse edge (same type) exists."""
+    n = max(num_nodes, 1)
+    keys = (edges.type_codes * n + edges.source_idx) * n + edges.target_idx
+    reverse_keys = (edges.type_codes * n + edges.target_idx) * n + edges.source_idx
+    return np.isin(reverse_keys, keys)
 
 
-def _build_hover_texts(
-    relationships: List[dict], rel_type: str, is_bidirectional: bool
-) -> List[Optional[str]]:
-    """Build hover text list for relationships with pre-allocation for performance."""
-    direction_text = "↔" if is_bidirectional else "→"
+def _split_edge_groups(group_codes: np.ndarray) -> List[Tuple[int, np.ndarray]]:
+    """Partition edge positions by group code in a single sort.
 
-    num_rels = len(relationships)
-    hover_texts: List[Optional[str]] = [None] * (num_rels * 3)
+    Returns:
+        List of ``(group_code, member_positions)`` ordered by the first
+        appearance of each group, so legend order follows the input order.
+    """
+    if group_codes.size == 0:
+        return []
 
-    for i, rel in enumerate(relationships):
-        hover_text = (
-            f"{rel['source_id']} {direction_text} {rel['target_id']}<br>"
-            f"Type: {rel_type}<br>Strength: {rel['strength']:.2f}"
-        )
-        base_idx = i * 3
-        hover_texts[base_idx] = hover_text
-        hover_texts[base_idx + 1] = hover_text
+    order = np.argsort(group_codes, kind="stable")
+    sorted_codes = group_codes[order]
+    bounds = np.flatnonzero(np.diff(sorted_codes)) + 1
+    members = np.split(order, bounds)
+    groups = [(int(group_codes[m[0]]), m) for m in members]
+    groups.sort(key=lambda group: group[1][0])
+    return groups
+
+
+def _select_strongest_edges(
+    strength: np.ndarray,
+    max_edges: Optional[int] = None,
+    min_strength_percentile: Optional[float] = None,
+) -> np.ndarray:
+    """Return the sorted positions of the edges kept by the level-of-detail rules.
+
+    Edges below ``min_strength_percentile`` (0-100) are dropped first; if more
+    than ``max_edges`` remain, only the strongest ``max_edges`` are kept, ties
+    broken by input order so the selection is deterministic.
+    """
+    selected = np.arange(len(strength))
+    if min_strength_percentile is not None and len(strength):
+        cutoff = np.percentile(strength, min_strength_percentile)
+        selected = selected[strength >= cutoff]
+    if max_edges is not None and len(selected) > max_edges:
+        strongest = np.argsort(-strength[selected], kind="stable")[:max_edges]
+        selected = np.sort(selected[strongest])
+    return selected
 
-    return hover_texts
+
+def _collect_and_group_relationships(
+    graph: AssetRelationshipGraph,
+    asset_ids: Iterable[str],
+    relationship_filters: Optional[Dict[str, bool]] = None,
+    max_edges: Optional[int] = None,
+    min_strength_percentile: Optional[float] = None,
+) -> Dict[Tuple[str, bool], _EdgeGroup]:
+    """Collect and group relationships with directionality info in a single pass.
+
+    Bidirectional pairs are detected with a vectorized reverse-key lookup and
+    emitted once (from the endpoint with the lower asset index). Rendered
+    edges are then selected by ``_select_strongest_edges`` with ``max_edges``
+    and ``min_strength_percentile``.
+    """
+    if not isinstance(asset_ids, (list, tuple)):
+        asset_ids = list(asset_ids)
+    asset_id_index = _build_asset_id_index(asset_ids)
+    edges = _drop_duplicate_edges(
+        _build_edge_arrays(*_relationship_columns_once(graph, asset_ids), asset_id_index, relationship_filters),
+        len(asset_id_index),
+    )
+    is_bidirectional = _find_bidirectional_edges(edges, len(asset_id_index))
+    keep = ~is_bidirectional | (edges.source_idx <= edges.target_idx)
+    if max_edges is not None or min_strength_percentile is not None:
+        kept_positions = np.flatnonzero(keep)
+        selected = _select_strongest_edges(edges.strength[kept_positions], max_edges, min_strength_percentile)
+        keep = np.zeros_like(keep)
+        keep[kept_positions[selected]] = True
+
+    source_idx = edges.source_idx[keep]
+    target_idx = edges.target_idx[keep]
+    strength = edges.strength[keep]
+    group_codes = edges.type_codes[keep] * 2 + is_bidirectional[keep]
+
+    relationship_groups: Dict[Tuple[str, bool], _EdgeGroup] = {}
+    for code, members in _split_edge_groups(group_codes):
+        key = (edges.rel_types[code // 2], bool(code % 2))
+        relationship_groups[key] = _EdgeGroup(source_idx[members], target_idx[members], strength[members])
+
+    return relationship_groups
+
+
+def _build_edge_coordinates_optimized(
+    source_idx: np.ndarray,
+    target_idx: np.ndarray,
+    positions: np.ndarray,
+) -> Tuple[np.ndarray, ...]:
+    """Build NaN-separated edge coordinate arrays with NumPy fancy indexing.
+
+    Each edge occupies three consecutive slots ``(source, target, NaN)``; the
+    NaN breaks the polyline so that a single trace can draw every edge.
+
+    Returns:
+        One array of length ``3 * len(source_idx)`` per position dimension.
+    """
+    num_edges = len(source_idx)
+    coords = np.full((num_edges, 3, positions.shape[1]), np.nan)
+    coords[:, 0] = positions[source_idx]
+    coords[:, 1] = positions[target_idx]
+    flat = coords.reshape(num_edges * 3, positions.shape[1])
+    return tuple(flat[:, dim] for dim in range(positions.shape[1]))
+
+
+def _build_hover_data(group: _EdgeGroup, asset_ids: np.ndarray) -> np.ndarray:
+    """Build per-point ``customdata`` rows ``(source_id, target_id, strength)``.
+
+    Rows are aligned with the coordinates from
+    ``_build_edge_coordinates_optimized``; separator rows stay ``None``.
+    The text itself is rendered client-side by ``_build_hover_template``.
+    """
+    num_edges = len(group.source_idx)
+    customdata = np.full((num_edges * 3, 3), None, dtype=object)
+    for offset in (0, 1):
+        customdata[offset::3, 0] = asset_ids[group.source_idx]
+        customdata[offset::3, 1] = asset_ids[group.target_idx]
+        customdata[offset::3, 2] = group.strength
+    return customdata
+
+
+def _build_hover_template(rel_type: str, is_bidirectional: bool) -> str:
+    """Build the hover template matching the rows from ``_build_hover_data``."""
+    direction_text = "↔" if is_bidirectional else "→"
+    return (
+        f"%{{customdata[0]}} {direction_text} %{{customdata[1]}}<br>"
+        f"Type: {rel_type}<br>Strength: %{{customdata[2]:.2f}}<extra></extra>"
+    )
 
 
 def _get_line_style(rel_type: str, is_bidirectional: bool) -> dict:
@@ -827,15 +1359,12 @@ def _format_trace_name(rel_type: str, is_bidirectional: bool) -> str:
 def _create_trace_for_group(
     rel_type: str,
     is_bidirectional: bool,
-    relationships: List[dict],
+    group: _EdgeGroup,
     positions: np.ndarray,
-    asset_id_index: Dict[str, int],
+    asset_ids: np.ndarray,
 ) -> go.Scatter3d:
     """Create a single trace for a relationship group with optimized performance."""
-    edges_x, edges_y, edges_z = _build_edge_coordinates_optimized(
-        relationships, positions, asset_id_index
-    )
-    hover_texts = _build_hover_texts(relationships, rel_type, is_bidirectional)
+    edges_x, edges_y, edges_z = _build_edge_coordinates_optimized(group.source_idx, group.target_idx, positions)
 
     return go.Scatter3d(
         x=edges_x,
@@ -843,8 +1372,8 @@ def _create_trace_for_group(
         z=edges_z,
         mode="lines",
         line=_get_line_style(rel_type, is_bidirectional),
-        hovertext=hover_texts,
-        hoverinfo="text",
+        customdata=_build_hover_data(group, asset_ids),
+        hovertemplate=_build_hover_template(rel_type, is_bidirectional),
         name=_format_trace_name(rel_type, is_bidirectional),
         visible=True,
         legendgroup=rel_type,
@@ -856,18 +1385,26 @@ def _create_relationship_traces(
     positions: np.ndarray,
     asset_ids: List[str],
     relationship_filters: Optional[Dict[str, bool]] = None,
+    max_edges: Optional[int] = None,
+    validation: str = "once",
+    min_strength_percentile: Optional[float] = None,
 ) -> List[go.Scatter3d]:
     """Create separate traces for different types of relationships
     with enhanced visibility.
 
     Returns a list of traces for batch addition to figure using
-    fig.add_traces() for optimal performance.
+    fig.add_traces() for optimal performance. ``max_edges`` caps the number of
+    rendered edges, keeping the strongest ones, and ``min_strength_percentile``
+    drops edges below that strength percentile; both apply to the edges left
+    visible by ``relationship_filters``. Relationships are validated
+    when a graph version is first indexed; ``validation="strict"`` checks them
+    again on every call, even when the traces come from the cache.
     """
     if not isinstance(graph, AssetRelationshipGraph):
         raise ValueError(
             "Invalid input data: graph must be an AssetRelationshipGraph instance"
         )
-    if not hasattr(graph, "relationships") or not isinstance(graph.relationships, dict):
+    if not hasattr(graph, "relationships") or not isinstance(graph.relationships, Mapping):
         raise ValueError(
             "Invalid input data: graph must have a relationships dictionary"
         )
@@ -878,107 +1415,166 @@ def _create_relationship_traces(
             "Invalid input data: positions array length must match asset_ids length"
         )
 
-    asset_id_index = _build_asset_id_index(asset_ids)
+    _check_validation_mode(validation)
+    if validation == "strict":
+        _build_relationship_index(graph, asset_ids)
 
-    relationship_groups = _collect_and_group_relationships(
-        graph, asset_ids, relationship_filters
+    # Edge selection ranks the visible edges only, so selected bundles are built per filter setting
+    selects = max_edges is not None or min_strength_percentile is not None
+    bundles = _get_relationship_trace_bundles(
+        graph, positions, asset_ids, max_edges, min_strength_percentile, relationship_filters if selects else None
     )
+    return [
+        trace
+        for (rel_type, _), trace in bundles.items()
+        if not _is_filtered_out(rel_type, relationship_filters)
+    ]
 
-    traces: List[go.Scatter3d] = []
-    for (rel_type, is_bidirectional), relationships in relationship_groups.items():
-        if relationships:
-            trace = _create_trace_for_group(
-                rel_type, is_bidirectional, relationships, positions, asset_id_index
-            )
-            traces.append(trace)
 
-    return traces
+def _get_relationship_trace_bundles(
+    graph: AssetRelationshipGraph,
+    positions: np.ndarray,
+    asset_ids: List[str],
+    max_edges: Optional[int] = None,
+    min_strength_percentile: Optional[float] = None,
+    relationship_filters: Optional[Dict[str, bool]] = None,
+) -> Dict[Tuple[str, bool], go.Scatter3d]:
+    """Return one prebuilt trace per ``(rel_type, is_bidirectional)`` group.
+
+    Bundles are built once per graph version, node layout, edge budget,
+    strength percentile and relationship filters. Without filters they hold
+    every type, so toggling a relationship filter only selects different
+    bundles.
+    """
+
+    def build() -> Dict[Tuple[str, bool], go.Scatter3d]:
+        asset_ids_arr = np.asarray(asset_ids, dtype=object)
+        relationship_groups = _collect_and_group_relationships(
+            graph, asset_ids, relationship_filters, max_edges, min_strength_percentile
+        )
+        return {
+            key: _create_trace_for_group(key[0], key[1], group, positions, asset_ids_arr)
+            for key, group in relationship_groups.items()
+            if len(group.source_idx)
+        }
+
+    fingerprint = (_graph_fingerprint(graph, asset_ids, positions), _hidden_types(relationship_filters))
+    kind = f"relationships_3d:{max_edges}:{min_strength_percentile}"
+    return _get_cached_bundles(graph, kind, fingerprint, build)
 
 
 def _create_directional_arrows(
     graph: AssetRelationshipGraph,
     positions: np.ndarray,
     asset_ids: List[str],
+    max_edges: Optional[int] = None,
+    min_strength_percentile: Optional[float] = None,
+    relationship_filters: Optional[Dict[str, bool]] = None,
 ) -> List[go.Scatter3d]:
     """Create arrow markers for unidirectional relationships using
     vectorized NumPy operations.
 
-    Returns a list of traces for batch addition to figure.
+    Returns a list of traces for batch addition to figure. ``max_edges``,
+    ``min_strength_percentile`` and ``relationship_filters`` select edges as
+    in ``_create_relationship_traces`` so arrows are only drawn for rendered
+    edges.
     """
     if not isinstance(graph, AssetRelationshipGraph):
         raise TypeError("Expected graph to be an instance of AssetRelationshipGraph")
-    if not hasattr(graph, "relationships") or not isinstance(graph.relationships, dict):
+    if not hasattr(graph, "relationships") or not isinstance(graph.relationships, Mapping):
         raise ValueError(
             "Invalid input data: graph must have a relationships dictionary"
         )
 
-    try:
-        if positions is None or asset_ids is None:
-            raise ValueError("positions and asset_ids must not be None")
-        if len(positions) != len(asset_ids):
-            raise ValueError("positions and asset_ids must have the same length")
-    except TypeError as exc:
-        raise ValueError(
-            "Invalid input data: positions and asset_ids must support len()"
-        ) from exc
+    def build() -> List[go.Scatter3d]:
+        nonlocal positions, asset_ids
+        try:
+            if positions is None or asset_ids is None:
+                raise ValueError("positions and asset_ids must not be None")
+            if len(positions) != len(asset_ids):
+                raise ValueError("positions and asset_ids must have the same length")
+        except TypeError as exc:
+            raise ValueError(
+                "Invalid input data: positions and asset_ids must support len()"
+            ) from exc
 
-    if not isinstance(positions, np.ndarray):
-        positions = np.asarray(positions)
-    if positions.ndim != 2 or positions.shape[1] != 3:
-        raise ValueError("Invalid positions shape: expected (n, 3)")
+        if not isinstance(positions, np.ndarray):
+            positions = np.asarray(positions)
+        if positions.ndim != 2 or positions.shape[1] != 3:
+            raise ValueError("Invalid positions shape: expected (n, 3)")
 
-    if not isinstance(asset_ids, (list, tuple)):
-        try:
-            asset_ids = list(asset_ids)
-        except Exception as exc:  # pylint: disable=broad-except
-            raise ValueError("asset_ids must be an iterable of strings") from exc
+        if not isinstance(asset_ids, (list, tuple)):
+            try:
+                asset_ids = list(asset_ids)
+            except Exception as exc:  # pylint: disable=broad-except
+                raise ValueError("asset_ids must be an iterable of strings") from exc
 
-    if not np.issubdtype(positions.dtype, np.number):
-        try:
-            positions = positions.astype(float)
-        except Exception as exc:  # pylint: disable=broad-except
-            raise ValueError("Invalid positions: values must be numeric") from exc
+        if not np.issubdtype(positions.dtype, np.number):
+            try:
+                positions = positions.astype(float)
+            except Exception as exc:  # pylint: disable=broad-except
+                raise ValueError("Invalid positions: values must be numeric") from exc
 
-    if not np.isfinite(positions).all():
-        raise ValueError("Invalid positions: values must be finite numbers")
+        if not np.isfinite(positions).all():
+            raise ValueError("Invalid positions: values must be finite numbers")
 
-    # Early return optimization:
-    # prevent unnecessary computation and memory allocation
-    # when there are no unidirectional relationships to display
-    if not all(isinstance(a, str) and a for a in asset_ids):
-        raise ValueError("asset_ids must contain non-empty strings")
+        # Early return optimization:
+        # prevent unnecessary computation and memory allocation
+        # when there are no unidirectional relationships to display
+        if not all(isinstance(a, str) and a for a in asset_ids):
+            raise ValueError("asset_ids must contain non-empty strings")
 
-    relationship_index = _build_relationship_index(graph, asset_ids)
-    asset_id_index = _build_asset_id_index(asset_ids)
+        return _build_directional_arrow_traces(
+            graph, positions, asset_ids, max_edges, min_strength_percentile, relationship_filters
+        )
 
-    source_indices: List[int] = []
-    target_indices: List[int] = []
-    hover_texts: List[str] = []
-
-    # Gather unidirectional relationships
-    for (source_id, target_id, rel_type), _ in relationship_index.items():
-        reverse_key = (target_id, source_id, rel_type)
-        if reverse_key not in relationship_index:
-            source_indices.append(asset_id_index[source_id])
-            target_indices.append(asset_id_index[target_id])
-            hover_texts.append(
-                f"Direction: {source_id} → {target_id}<br>Type: {rel_type}"
-            )
+    # Inputs that produced cached arrows already passed the checks in build()
+    fingerprint = (_graph_fingerprint(graph, asset_ids, positions), _hidden_types(relationship_filters))
+    return _get_cached_bundles(graph, f"arrows_3d:{max_edges}:{min_strength_percentile}", fingerprint, build)
+
+
+def _build_directional_arrow_traces(
+    graph: AssetRelationshipGraph,
+    positions: np.ndarray,
+    asset_ids: List[str],
+    max_edges: Optional[int] = None,
+    min_strength_percentile: Optional[float] = None,
+    relationship_filters: Optional[Dict[str, bool]] = None,
+) -> List[go.Scatter3d]:
+    """Build the arrow marker trace for already validated inputs."""
+    relationship_groups = _collect_and_group_relationships(
+        graph, asset_ids, relationship_filters, max_edges, min_strength_percentile
+    )
+    unidirectional = [
+        (rel_type, group)
+        for (rel_type, is_bidirectional), group in relationship_groups.items()
+        if not is_bidirectional and len(group.source_idx)
+    ]
 
-    if not source_indices:
+    if not unidirectional:
         return []
 
+    src_idx_arr = np.concatenate([group.source_idx for _, group in unidirectional])
+    tgt_idx_arr = np.concatenate([group.target_idx for _, group in unidirectional])
+    rel_type_col = np.concatenate(
+        [np.full(len(group.source_idx), rel_type, dtype=object) for rel_type, group in unidirectional]
+    )
+
     # Vectorized arrow position calculation at 70% along each edge
-    src_idx_arr = np.asarray(source_indices, dtype=int)
-    tgt_idx_arr = np.asarray(target_indices, dtype=int)
     source_positions = positions[src_idx_arr]
     target_positions = positions[tgt_idx_arr]
     arrow_positions = source_positions + 0.7 * (target_positions - source_positions)
 
+    asset_ids_arr = np.asarray(asset_ids, dtype=object)
+    customdata = np.empty((len(src_idx_arr), 3), dtype=object)
+    customdata[:, 0] = asset_ids_arr[src_idx_arr]
+    customdata[:, 1] = asset_ids_arr[tgt_idx_arr]
+    customdata[:, 2] = rel_type_col
+
     arrow_trace = go.Scatter3d(
-        x=arrow_positions[:, 0].tolist(),
-        y=arrow_positions[:, 1].tolist(),
-        z=arrow_positions[:, 2].tolist(),
+        x=arrow_positions[:, 0],
+        y=arrow_positions[:, 1],
+        z=arrow_positions[:, 2],
         mode="markers",
         marker=dict(
             symbol="diamond",
@@ -986,8 +1582,11 @@ def _create_directional_arrows(
             color="rgba(255, 0, 0, 0.8)",
             line=dict(color="red", width=1),
         ),
-        hovertext=hover_texts,
-        hoverinfo="text",
+        customdata=customdata,
+        hovertemplate=(
+            "Direction: %{customdata[0]} → %{customdata[1]}<br>"
+            "Type: %{customdata[2]}<extra></extra>"
+        ),
         name="Direction Arrows",
         visible=True,
         showlegend=False,
@@ -1093,6 +1692,12 @@ def visualize_3d_graph_with_filters(
     show_regulatory: bool = True,
     show_all_relationships: bool = True,
     toggle_arrows: bool = True,
+    level_of_detail: str = "auto",
+    max_edges: int = LOD_MAX_EDGES,
+    max_nodes: int = LOD_MAX_NODES,
+    overview_group_by: str = "sector",
+    validation: str = "once",
+    min_strength_percentile: Optional[float] = None,
 ) -> go.Figure:
     """Create 3D visualization with selective relationship filtering.
 
@@ -1116,6 +1721,17 @@ def visualize_3d_graph_with_filters(
             (default: True)
         toggle_arrows: Show directional arrows for unidirectional
             relationships (default: True)
+        level_of_detail: Level of detail, see ``visualize_3d_graph``
+            (default: "auto")
+        max_edges: Edge budget for the reduced level of detail, spent on
+            the relationship types left visible by the filters
+        max_nodes: Node count above which "auto" switches to the overview
+        overview_group_by: Grouping of the overview (default: "sector")
+        validation: Input validation mode, see ``visualize_3d_graph``
+            (default: "once")
+        min_strength_percentile: Strength percentile below which edges are
+            dropped, computed over the visible relationship types, see
+            ``visualize_3d_graph`` (default: None)
 
     Returns:
         Plotly Figure object with 3D visualization
@@ -1186,11 +1802,16 @@ def visualize_3d_graph_with_filters(
         )
         raise ValueError("Failed to build filter configuration") from exc
 
+    _check_validation_mode(validation)
+    _check_strength_percentile(min_strength_percentile)
+    lod = _resolve_level_of_detail(graph, level_of_detail, max_edges, max_nodes)
+    if lod == "overview":
+        return _visualize_overview_3d(graph, overview_group_by)
+    edge_budget = max_edges if lod == "reduced" else None
+
     # Retrieve visualization data with error handling
     try:
-        positions, asset_ids, colors, hover_texts = (
-            graph.get_3d_visualization_data_enhanced()
-        )
+        positions, asset_ids, colors, hover_texts = _graph_node_data(graph)
     except Exception as exc:  # pylint: disable=broad-except
         logger.exception(
             "Failed to retrieve visualization data from graph: %s",
@@ -1200,7 +1821,7 @@ def visualize_3d_graph_with_filters(
 
     # Validate retrieved data
     try:
-        _validate_visualization_data(positions, asset_ids, colors, hover_texts)
+        _validate_node_data(graph, positions, asset_ids, colors, hover_texts, validation)
     except ValueError as exc:
         logger.error("Invalid visualization data: %s", exc)
         raise
@@ -1211,7 +1832,13 @@ def visualize_3d_graph_with_filters(
     # Build relationship traces with comprehensive error handling
     try:
         relationship_traces = _create_relationship_traces(
-            graph, positions, asset_ids, relationship_filters
+            graph,
+            positions,
+            asset_ids,
+            relationship_filters,
+            max_edges=edge_budget,
+            min_strength_percentile=min_strength_percentile,
+            validation=validation,
         )
     except (TypeError, ValueError) as exc:
         logger.exception(
@@ -1240,7 +1867,14 @@ def visualize_3d_graph_with_filters(
     # Add directional arrows if enabled
     if toggle_arrows:
         try:
-            arrow_traces = _create_directional_arrows(graph, positions, asset_ids)
+            arrow_traces = _create_directional_arrows(
+                graph,
+                positions,
+                asset_ids,
+                max_edges=edge_budget,
+                min_strength_percentile=min_strength_percentile,
+                relationship_filters=relationship_filters,
+            )
         except (TypeError, ValueError) as exc:
             logger.exception(
                 "Failed to create directional arrows due to invalid data: %s", exc
@@ -1258,7 +1892,9 @@ def visualize_3d_graph_with_filters(
 
     # Add node trace
     try:
-        node_trace = _create_node_trace(positions, asset_ids, colors, hover_texts)
+        node_trace = _create_node_trace(
+            positions, asset_ids, colors, hover_texts, show_labels=lod == "full", validate=False
+        )
         fig.add_trace(node_trace)
     except Exception as exc:  # pylint: disable=broad-except
         logger.exception("Failed to create or add node trace: %s", exc)
@@ -22,10 +22,10 @@ pytest.importorskip("sqlalchemy")
 
 
 def _apply_migration(database_path: Path) -> None:
-    """Apply database migrations by executing the initial SQL script on the given database path."""
-    sql = Path("migrations/001_initial.sql").read_text(encoding="utf-8")
+    """Apply database migrations by executing every SQL script, in order, on the given database path."""
     with sqlite3.connect(database_path) as connection:
-        connection.executescript(sql)
+        for script in sorted(Path("migrations").glob("*.sql")):
+            connection.executescript(script.read_text(encoding="utf-8"))
 
 
 @pytest.fixture
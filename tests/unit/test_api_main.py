@@ -5,13 +5,16 @@ lazy graph initialization with thread-safe double-check locking, and response mo
 """
 
 import os
+import time
 from unittest.mock import Mock, patch
 
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
 
 import api.main as api_main
+from api.auth import User, get_current_active_user
 from api.main import (
     AssetResponse,
     MetricsResponse,
@@ -20,7 +23,9 @@ from api.main import (
     app,
     validate_origin,
 )
+from src.data.database import create_session_factory, init_db, session_scope
 from src.data.real_data_fetcher import _save_to_cache
+from src.data.repository import AssetGraphRepository
 from src.data.sample_data import create_sample_database
 from src.logic.asset_graph import AssetRelationshipGraph
 from src.models.financial_models import AssetClass, Equity
@@ -117,6 +122,56 @@ class TestGraphInitialization:
         api_main.reset_graph()
         monkeypatch.delenv("GRAPH_CACHE_PATH", raising=False)
 
+    def test_graph_maps_snapshot_cache(self, tmp_path, monkeypatch):
+        """Graph initialization should serve a .graphsnap cache from a read-only mapping."""
+        cache_path = tmp_path / "graph.graphsnap"
+        reference_graph = create_sample_database()
+        _save_to_cache(reference_graph, cache_path)
+
+        monkeypatch.setenv("GRAPH_CACHE_PATH", str(cache_path))
+        api_main.reset_graph()
+
+        graph = api_main.get_graph()
+        assert not isinstance(graph.relationships, dict)
+        assert dict(graph.relationships) == reference_graph.relationships
+
+        response = TestClient(app).get("/api/relationships")
+        assert response.status_code == 200
+        assert len(response.json()) == sum(len(rels) for rels in reference_graph.relationships.values())
+
+        api_main.reset_graph()
+        monkeypatch.delenv("GRAPH_CACHE_PATH", raising=False)
+
+    def test_stale_graph_is_refreshed_in_background(self, tmp_path, monkeypatch):
+        """A stale cache should be served while a background refresh replaces it."""
+        cache_path = tmp_path / "graph.graphsnap"
+        _save_to_cache(create_sample_database(), cache_path)
+        os.utime(cache_path, (0, 0))
+        fresh_graph = AssetRelationshipGraph()
+        fresh_graph.add_asset(
+            Equity(id="FRESH", symbol="FRESH", name="Fresh", asset_class=AssetClass.EQUITY, sector="Tech", price=1.0)
+        )
+
+        monkeypatch.setenv("GRAPH_CACHE_PATH", str(cache_path))
+        monkeypatch.setenv("USE_REAL_DATA_FETCHER", "true")
+        monkeypatch.setenv("GRAPH_CACHE_TTL_SECONDS", "60")
+        api_main.reset_graph()
+
+        def fetch_fresh(fetcher, require_assets=False):
+            fetcher.data_timestamp = time.time()
+            return fresh_graph
+
+        with patch.object(api_main.RealDataFetcher, "_fetch_and_cache", fetch_fresh):
+            stale_graph = api_main.get_graph()
+            assert "FRESH" not in stale_graph.assets
+            api_main.graph_fetcher.wait_for_refresh(5)
+
+        assert api_main.get_graph() is fresh_graph
+        health = TestClient(app).get("/api/health").json()
+        assert health["data_refresh"]["refresh_count"] == 1
+
+        api_main.reset_graph()
+
     def test_graph_fallback_on_corrupted_cache(self, tmp_path, monkeypatch):
         """Graph initialization should fallback when cache is corrupted or invalid."""
         cache_path = tmp_path / "graph_snapshot.json"
@@ -502,6 +557,28 @@ class TestAPIEndpoints:
             assert "strength" in edge
             assert 0 <= edge["strength"] <= 1
 
+    def test_get_visualization_overview(self, client):
+        """Test that group_by returns one node per sector with aggregated edges."""
+        graph = create_sample_database()
+        api_main.set_graph(graph)
+
+        response = client.get("/api/visualization?group_by=sector")
+        assert response.status_code == 200
+        viz_data = response.json()
+
+        sectors = {asset.sector for asset in graph.assets.values()}
+        assert {node["id"] for node in viz_data["nodes"]} == sectors
+        assert sum(node["asset_count"] for node in viz_data["nodes"]) == len(graph.assets)
+        for edge in viz_data["edges"]:
+            assert edge["source"] != edge["target"]
+            assert edge["count"] > 0
+            assert 0 <= edge["strength"] <= 1
+
+    def test_get_visualization_invalid_group_by(self, client):
+        """Test that an unknown grouping is rejected."""
+        response = client.get("/api/visualization?group_by=country")
+        assert response.status_code == 400
+
     def test_get_asset_classes(self, client):
         """Test getting list of asset classes."""
         response = client.get("/api/asset-classes")
@@ -530,6 +607,116 @@ class TestAPIEndpoints:
         assert data["sectors"] == sorted(data["sectors"])
 
 
+class TestChangesEndpoint:
+    """Test the change journal endpoint."""
+
+    @staticmethod
+    @pytest.fixture
+    def session_factory(tmp_path):
+        """Point the API at a fresh asset graph database and yield its session factory."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'changes.db'}")
+        init_db(engine)
+        factory = create_session_factory(engine)
+        api_main.set_graph_store(factory)
+        app.dependency_overrides[get_current_active_user] = lambda: User(username="reader", hashed_password="")
+        try:
+            yield factory
+        finally:
+            app.dependency_overrides.pop(get_current_active_user, None)
+            api_main.set_graph_store(None)
+            engine.dispose()
+
+    @staticmethod
+    def test_changes_are_tailed_from_last_seq(session_factory):
+        """Clients receive the changes after `since` and the cursor for the next call."""
+        with session_scope(session_factory) as session:
+            AssetGraphRepository(session, journal_changes=True).upsert_assets(
+                Equity(
+                    id=asset_id,
+                    symbol=asset_id,
+                    name=f"{asset_id} Corp",
+                    asset_class=AssetClass.EQUITY,
+                    sector="Technology",
+                    price=10.0,
+                )
+                for asset_id in ("A", "B", "C")
+            )
+        client = TestClient(app)
+
+        first = client.get("/api/changes?limit=2").json()
+        second = client.get(f"/api/changes?since={first['last_seq']}").json()
+        empty = client.get(f"/api/changes?since={second['last_seq']}").json()
+
+        assert [change["key"] for change in first["changes"]] == [["A"], ["B"]]
+        assert first["changes"][0]["entity"] == "asset"
+        assert first["changes"][0]["operation"] == "upsert"
+        assert first["changes"][0]["data"]["price"] == 10.0
+        assert [change["key"] for change in second["changes"]] == [["C"]]
+        assert empty == {"changes": [], "last_seq": second["last_seq"]}
+
+    @staticmethod
+    def test_invalid_parameters_are_rejected(session_factory):
+        """Negative cursors and out-of-range limits fail validation."""
+        _ = session_factory
+        client = TestClient(app)
+
+        assert client.get("/api/changes?since=-1").status_code == 422
+        assert client.get("/api/changes?limit=0").status_code == 422
+
+    @staticmethod
+    def test_requires_authentication(session_factory):
+        """The journal is not served without a token."""
+        _ = session_factory
+        app.dependency_overrides.pop(get_current_active_user)
+        client = TestClient(app)
+
+        assert client.get("/api/changes").status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class TestStoredAssetsEndpoint:
+    """Test the keyset-paginated stored assets endpoint."""
+
+    @staticmethod
+    @pytest.fixture
+    def session_factory(tmp_path):
+        """Point the API at a fresh asset graph database and yield its session factory."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'store.db'}")
+        init_db(engine)
+        factory = create_session_factory(engine)
+        api_main.set_graph_store(factory)
+        try:
+            yield factory
+        finally:
+            api_main.set_graph_store(None)
+            engine.dispose()
+
+    @staticmethod
+    def test_pages_follow_next_cursor(session_factory):
+        """Clients walk the stored assets page by page with `next_cursor`."""
+        with session_scope(session_factory) as session:
+            AssetGraphRepository(session).upsert_assets(
+                Equity(
+                    id=asset_id,
+                    symbol=asset_id,
+                    name=f"{asset_id} Corp",
+                    asset_class=AssetClass.EQUITY,
+                    sector="Technology",
+                    price=10.0,
+                )
+                for asset_id in ("C", "A", "B")
+            )
+        client = TestClient(app)
+
+        first = client.get("/api/store/assets?limit=2").json()
+        second = client.get(f"/api/store/assets?limit=2&after={first['next_cursor']}").json()
+
+        assert [asset["id"] for asset in first["assets"]] == ["A", "B"]
+        assert first["assets"][0]["asset_class"] == AssetClass.EQUITY.value
+        assert [asset["id"] for asset in second["assets"]] == ["C"]
+        assert second["next_cursor"] is None
+        assert client.get("/api/store/assets?limit=0").status_code == 422
+
+
 class TestErrorHandling:
     """Test error handling and edge cases."""
 
@@ -33,6 +33,19 @@ class TestAssetRelationshipGraphInit:
         assert hasattr(graph, "relationships")
         assert isinstance(graph.relationships, dict)
 
+    @staticmethod
+    def test_version_increments_on_mutation():
+        """Test that mutating methods bump the version used by visualization caches."""
+        graph = AssetRelationshipGraph()
+        initial = graph.version
+
+        graph.add_relationship("A", "B", "correlation", 0.5)
+        after_add = graph.version
+        graph.touch()
+
+        assert after_add > initial
+        assert graph.version > after_add
+
 
 @pytest.mark.unit
 class TestGet3DVisualizationDataEnhanced:
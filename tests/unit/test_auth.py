@@ -0,0 +1,216 @@
+"""Unit tests for the authentication helpers in api.auth."""
+
+import asyncio
+import threading
+from datetime import timedelta
+from unittest.mock import patch
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+import api.auth as auth
+from api.auth import (
+    TTLCache,
+    UserRepository,
+    authenticate_user_async,
+    create_access_token,
+    decode_token,
+    get_current_user,
+    get_password_hash,
+    get_user,
+    get_user_async,
+    verify_password_async,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    """Start every test with empty user and token caches."""
+    auth.user_cache.clear()
+    auth.token_claims_cache.clear()
+    yield
+    auth.user_cache.clear()
+    auth.token_claims_cache.clear()
+
+
+class FakeClock:
+    """Manually advanced clock for TTLCache."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Test cases for the TTL/LRU cache."""
+
+    @staticmethod
+    def test_entries_expire_after_ttl():
+        """Test that entries are served until their time to live has passed."""
+        clock = FakeClock()
+        cache = TTLCache(maxsize=10, ttl=5.0, timer=clock)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=1.0)
+
+        clock.now = 0.9
+        assert (cache.get("a"), cache.get("b")) == (1, 2)
+        clock.now = 1.0
+        assert (cache.get("a"), cache.get("b")) == (1, None)
+        clock.now = 5.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    @staticmethod
+    def test_least_recently_used_entry_is_evicted():
+        """Test that a full cache drops the entry read or written longest ago."""
+        cache = TTLCache(maxsize=2, ttl=60.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+    @staticmethod
+    def test_invalidate():
+        """Test that invalidated keys are no longer served."""
+        cache = TTLCache(maxsize=2, ttl=60.0)
+        cache.set("a", 1)
+        cache.invalidate("a")
+        cache.invalidate("missing")
+
+        assert cache.get("a") is None
+
+
+class TestUserCache:
+    """Test cases for caching user records."""
+
+    @staticmethod
+    def test_get_user_is_served_from_cache():
+        """Test that repeated lookups query the repository once."""
+        user = auth.UserInDB(username="cached", hashed_password="hash")
+        with patch.object(auth.user_repository, "get_user", return_value=user) as lookup:
+            assert get_user("cached") is user
+            assert get_user("cached") is user
+
+        lookup.assert_called_once_with("cached")
+
+    @staticmethod
+    def test_missing_users_are_not_cached():
+        """Test that unknown usernames are looked up again."""
+        with patch.object(auth.user_repository, "get_user", return_value=None) as lookup:
+            assert get_user("nobody") is None
+            assert get_user("nobody") is None
+
+        assert lookup.call_count == 2
+
+    @staticmethod
+    def test_create_or_update_user_invalidates_cache():
+        """Test that updating credentials evicts the cached record."""
+        UserRepository.create_or_update_user(
+            username="cache-test", hashed_password=get_password_hash("old"), is_disabled=False
+        )
+        assert get_user("cache-test").disabled is False
+
+        UserRepository.create_or_update_user(
+            username="cache-test", hashed_password=get_password_hash("new"), is_disabled=True
+        )
+
+        assert get_user("cache-test").disabled is True
+
+
+class TestTokenClaimsCache:
+    """Test cases for caching decoded token claims."""
+
+    @staticmethod
+    def test_decode_token_verifies_once():
+        """Test that a token's signature is only checked on first use."""
+        token = create_access_token({"sub": "alice"})
+        with patch.object(auth.jwt, "decode", wraps=jwt.decode) as decode:
+            assert decode_token(token)["sub"] == "alice"
+            assert decode_token(token)["sub"] == "alice"
+
+        decode.assert_called_once()
+
+    @staticmethod
+    def test_claims_do_not_outlive_token():
+        """Test that cached claims expire with the token."""
+        token = create_access_token({"sub": "alice"}, expires_delta=timedelta(seconds=30))
+        decode_token(token)
+        later = auth.token_claims_cache._timer() + 31
+
+        with patch.object(auth.token_claims_cache, "_timer", lambda: later):
+            assert auth.token_claims_cache.get(token) is None
+
+    @staticmethod
+    def test_expired_token_is_rejected():
+        """Test that expired tokens are neither cached nor accepted."""
+        token = create_access_token({"sub": "alice"}, expires_delta=timedelta(seconds=-1))
+
+        with pytest.raises(HTTPException) as excinfo:
+            asyncio.run(get_current_user(token))
+
+        assert excinfo.value.detail == "Token has expired"
+        assert len(auth.token_claims_cache) == 0
+
+
+class TestAsyncUserLookup:
+    """Test cases for looking users up from the async dependencies."""
+
+    @staticmethod
+    def test_repository_lookup_leaves_the_event_loop():
+        """Test that get_current_user queries the credential store off the event loop thread."""
+        user = auth.UserInDB(username="alice", hashed_password="hash")
+        threads = []
+
+        def lookup(username):
+            threads.append(threading.current_thread())
+            return user
+
+        async def resolve():
+            return await get_current_user(create_access_token({"sub": "alice"})), threading.current_thread()
+
+        with patch.object(auth.user_repository, "get_user", lookup):
+            resolved, loop_thread = asyncio.run(resolve())
+
+        assert resolved is user
+        assert threads and threads[0] is not loop_thread
+
+    @staticmethod
+    def test_cached_user_is_served_on_the_loop():
+        """Test that cache hits skip the threadpool and the repository."""
+        user = auth.UserInDB(username="alice", hashed_password="hash")
+        auth.user_cache.set("alice", user)
+
+        with patch.object(auth.user_repository, "get_user", side_effect=AssertionError("queried")):
+            with patch.object(auth, "run_in_threadpool", side_effect=AssertionError("offloaded")):
+                assert asyncio.run(get_user_async("alice")) is user
+
+
+class TestAsyncPasswordVerification:
+    """Test cases for verifying passwords on the hashing thread pool."""
+
+    @staticmethod
+    def test_verify_password_runs_on_pool():
+        """Test that verification leaves the event loop thread."""
+        threads = []
+
+        def verify(plain_password, hashed_password):
+            threads.append(threading.current_thread().name)
+            return True
+
+        with patch.object(auth, "verify_password", verify):
+            assert asyncio.run(verify_password_async("secret", "hash")) is True
+
+        assert threads[0].startswith("password-hash")
+
+    @staticmethod
+    def test_authenticate_user_async():
+        """Test that the async path accepts the right password and rejects others."""
+        user = auth.UserInDB(username="alice", hashed_password=get_password_hash("secret"))
+        with patch.object(auth.user_repository, "get_user", return_value=user):
+            assert asyncio.run(authenticate_user_async("alice", "secret")) is user
+            assert asyncio.run(authenticate_user_async("alice", "wrong")) is False
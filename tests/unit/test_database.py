@@ -13,7 +13,7 @@ import os
 from unittest.mock import patch
 
 import pytest
-from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy import Column, Integer, String, column, create_engine, insert, select, table
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
@@ -21,10 +21,14 @@ from sqlalchemy.pool import StaticPool
 from src.data.database import (
     DEFAULT_DATABASE_URL,
     Base,
+    RoutingSession,
     create_engine_from_url,
+    create_routing_session_factory,
     create_session_factory,
     init_db,
+    read_your_writes,
     session_scope,
+    sqlite_pragmas_from_env,
 )
 
 pytest.importorskip("sqlalchemy")
@@ -82,6 +86,68 @@ class TestEngineCreation:
         assert engine.pool is not None
 
 
+class TestSQLitePragmas:
+    """Test cases for the SQLite connection profile."""
+
+    @staticmethod
+    def _pragma(engine, name):
+        with engine.connect() as connection:
+            return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+    def test_file_engine_applies_profile(self, tmp_path):
+        """Test that file-backed engines use WAL and the tuned settings."""
+        with patch.dict(os.environ, {}, clear=True):
+            engine = create_engine_from_url(f"sqlite:///{tmp_path / 'profile.db'}")
+
+        assert self._pragma(engine, "journal_mode") == "wal"
+        assert self._pragma(engine, "synchronous") == 1  # NORMAL
+        assert self._pragma(engine, "foreign_keys") == 1
+        assert self._pragma(engine, "busy_timeout") == 5000
+        assert self._pragma(engine, "temp_store") == 2  # MEMORY
+        assert self._pragma(engine, "cache_size") == -65536
+        engine.dispose()
+
+    def test_env_overrides_and_skips(self, tmp_path):
+        """Test that env vars override a pragma and an empty value skips it."""
+        overrides = {"ASSET_GRAPH_SQLITE_SYNCHRONOUS": "FULL", "ASSET_GRAPH_SQLITE_JOURNAL_MODE": ""}
+        with patch.dict(os.environ, overrides, clear=True):
+            engine = create_engine_from_url(f"sqlite:///{tmp_path / 'override.db'}")
+
+        assert self._pragma(engine, "synchronous") == 2  # FULL
+        assert self._pragma(engine, "journal_mode") == "delete"
+        engine.dispose()
+
+    def test_empty_mapping_keeps_defaults(self, tmp_path):
+        """Test that an explicit empty mapping disables the profile."""
+        engine = create_engine_from_url(f"sqlite:///{tmp_path / 'plain.db'}", sqlite_pragmas={})
+
+        assert self._pragma(engine, "journal_mode") == "delete"
+        assert self._pragma(engine, "foreign_keys") == 0
+        engine.dispose()
+
+    def test_memory_engine_enforces_foreign_keys(self):
+        """Test that in-memory engines also get the profile."""
+        engine = create_engine_from_url("sqlite:///:memory:")
+
+        assert self._pragma(engine, "foreign_keys") == 1
+
+    @staticmethod
+    def test_invalid_value_rejected():
+        """Test that values which are not plain numbers or keywords are rejected."""
+        with patch.dict(os.environ, {"ASSET_GRAPH_SQLITE_CACHE_SIZE": "1; DROP TABLE assets"}):
+            with pytest.raises(ValueError, match="cache_size"):
+                create_engine_from_url("sqlite:///:memory:")
+
+    @staticmethod
+    def test_pragmas_from_env_defaults():
+        """Test that the default profile is returned without overrides."""
+        with patch.dict(os.environ, {}, clear=True):
+            pragmas = sqlite_pragmas_from_env()
+
+        assert pragmas["journal_mode"] == "WAL"
+        assert list(pragmas)[0] == "busy_timeout"
+
+
 class TestSessionFactory:
     """Test cases for session factory creation."""
 
@@ -117,6 +183,96 @@ class TestSessionFactory:
         session.close()
 
 
+# Table holding one row that names the database it lives in
+_origin = table("origin", column("name"))
+
+
+def _origin_engine(tmp_path, name):
+    """Create a SQLite database whose ``origin`` table names it ``name``."""
+    engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+    with engine.begin() as connection:
+        connection.exec_driver_sql("CREATE TABLE origin (name TEXT)")
+        connection.execute(insert(_origin).values(name=name))
+    return engine
+
+
+def _read_origins(session):
+    return sorted(session.execute(select(_origin.c.name)).scalars())
+
+
+@pytest.fixture
+def routing_factory(tmp_path):
+    """Create a routing session factory on a primary and two replica SQLite files."""
+    engines = [_origin_engine(tmp_path, name) for name in ("primary", "replica1", "replica2")]
+    yield create_routing_session_factory(engines[0], engines[1:])
+    for engine in engines:
+        engine.dispose()
+
+
+class TestRoutingSession:
+    """Test cases for read/write routing between a primary and its replicas."""
+
+    @staticmethod
+    def test_reads_rotate_over_replicas(routing_factory):
+        """Test that each session reads from the next replica in turn."""
+        origins = []
+        for _ in range(4):
+            with session_scope(routing_factory) as session:
+                assert isinstance(session, RoutingSession)
+                origins.extend(_read_origins(session))
+
+        assert origins == ["replica1", "replica2", "replica1", "replica2"]
+
+    @staticmethod
+    def test_session_reads_its_own_writes(routing_factory):
+        """Test that a session reads from the primary once it has written."""
+        with session_scope(routing_factory) as session:
+            before = _read_origins(session)
+            session.execute(insert(_origin).values(name="written"))
+            after = _read_origins(session)
+
+        assert before == ["replica1"]
+        assert after == ["primary", "written"]
+        assert session.reads_from_primary
+
+    @staticmethod
+    def test_locking_reads_go_to_the_primary(routing_factory):
+        """Test that SELECT ... FOR UPDATE and explicit pinning use the primary."""
+        with session_scope(routing_factory) as session:
+            locked = session.execute(select(_origin.c.name).with_for_update()).scalars().all()
+        with session_scope(routing_factory) as session:
+            session.stick_to_primary()
+            pinned = _read_origins(session)
+
+        assert locked == ["primary"]
+        assert pinned == ["primary"]
+
+    @staticmethod
+    def test_read_your_writes_spans_sessions(routing_factory):
+        """Test that a write pins the later sessions of the same block to the primary."""
+        with read_your_writes():
+            with session_scope(routing_factory) as session:
+                session.execute(insert(_origin).values(name="written"))
+            with session_scope(routing_factory) as session:
+                inside = _read_origins(session)
+        with session_scope(routing_factory) as session:
+            outside = _read_origins(session)
+
+        assert inside == ["primary", "written"]
+        assert outside == ["replica1"]
+
+    @staticmethod
+    def test_without_replicas_sessions_are_plain(tmp_path):
+        """Test that a factory without replicas creates ordinary sessions on the primary."""
+        engine = _origin_engine(tmp_path, "primary")
+        session = create_routing_session_factory(engine, [])()
+
+        assert not isinstance(session, RoutingSession)
+        assert _read_origins(session) == ["primary"]
+        session.close()
+        engine.dispose()
+
+
 class TestDatabaseInitialization:
     """Test cases for database initialization."""
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import importlib
 import os
+import sqlite3
 import threading
 from typing import Iterator
 
@@ -28,6 +29,8 @@ def restore_database_module(monkeypatch) -> Iterator[None]:
     if getattr(database, "_MEMORY_CONNECTION", None) is not None:
         database._MEMORY_CONNECTION.close()
         database._MEMORY_CONNECTION = None
+    if getattr(database, "_POOL", None) is not None:
+        database._POOL.close()
 
     if original_url is None:
         monkeypatch.delenv("DATABASE_URL", raising=False)
@@ -348,8 +351,8 @@ class TestGetConnectionWithMemoryDb:
             assert row is not None
             assert row["username"] == "testuser"
 
-    def test_get_connection_closes_file_db(self, monkeypatch, restore_database_module):
-        """Test that get_connection closes file database connections."""
+    def test_get_connection_reuses_pooled_file_db(self, monkeypatch, restore_database_module):
+        """Test that get_connection returns file database connections to the pool."""
         import tempfile
 
         with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp_file:
@@ -370,11 +373,11 @@ class TestGetConnectionWithMemoryDb:
                 )
                 conn.commit()
 
-            # After exiting context, connection should be closed for file databases
-            # We can't directly check if it's closed, but we can verify that
-            # a new context gives us a different connection object
+            # After exiting the context the connection is back in the pool
+            # and handed out again instead of opening a new file handle
             with reloaded_database.get_connection() as conn2:
-                assert conn2 is not conn_ref
+                assert conn2 is conn_ref
+                assert conn2.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
         finally:
             if os.path.exists(tmp_path):
                 os.remove(tmp_path)
@@ -624,3 +627,106 @@ class TestEdgeCasesAndErrorHandling:
             assert database._is_memory_db(fmt) is False, (
                 f"Incorrectly detected {fmt} as memory DB"
             )
+
+
+def test_credential_store_has_its_own_pragma_profile(monkeypatch, tmp_path, restore_database_module):
+    """Test that the asset graph store settings do not reach the credential store connections."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'credentials.db'}")
+    monkeypatch.setenv("ASSET_GRAPH_SQLITE_SYNCHRONOUS", "OFF")
+    monkeypatch.setenv("DATABASE_SQLITE_BUSY_TIMEOUT", "1234")
+
+    reloaded_database = importlib.reload(database)
+
+    with reloaded_database.get_connection() as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert connection.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+        assert connection.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+        assert connection.execute("PRAGMA foreign_keys").fetchone()[0] == 0
+        assert connection.execute("PRAGMA mmap_size").fetchone()[0] == 0
+
+
+class TestConnectionPool:
+    """Tests for the bounded connection pool used for file-backed databases."""
+
+    @staticmethod
+    def _pool(tmp_path, max_size=2, timeout=0.05):
+        path = str(tmp_path / "pool.db")
+
+        def factory():
+            connection = sqlite3.connect(path, check_same_thread=False)
+            connection.execute("CREATE TABLE IF NOT EXISTS items (name TEXT)")
+            connection.commit()
+            return connection
+
+        return database.ConnectionPool(factory, max_size, timeout)
+
+    def test_pool_is_bounded(self, tmp_path):
+        """Test that checkout times out once every connection is in use."""
+        pool = self._pool(tmp_path, max_size=2)
+        first, second = pool.acquire(), pool.acquire()
+
+        with pytest.raises(TimeoutError):
+            pool.acquire()
+
+        pool.release(first)
+        assert pool.acquire() is first
+        pool.release(first)
+        pool.release(second)
+        pool.close()
+
+    def test_unhealthy_connection_is_replaced(self, tmp_path):
+        """Test that a broken idle connection is discarded on checkout."""
+        pool = self._pool(tmp_path)
+        connection = pool.acquire()
+        pool.release(connection)
+        connection.close()
+
+        replacement = pool.acquire()
+
+        assert replacement is not connection
+        assert replacement.execute("SELECT 1").fetchone() == (1,)
+        pool.release(replacement)
+        pool.close()
+
+    def test_release_rolls_back_open_transaction(self, tmp_path):
+        """Test that uncommitted writes do not leak to the next borrower."""
+        pool = self._pool(tmp_path)
+        connection = pool.acquire()
+        connection.execute("INSERT INTO items VALUES ('pending')")
+        pool.release(connection)
+
+        reused = pool.acquire()
+
+        assert reused is connection
+        assert reused.execute("SELECT COUNT(*) FROM items").fetchone() == (0,)
+        pool.release(reused)
+        pool.close()
+
+    def test_concurrent_checkouts_never_exceed_size(self, tmp_path):
+        """Test that threads share at most max_size connections."""
+        pool = self._pool(tmp_path, max_size=3, timeout=5)
+        seen = set()
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(20):
+                connection = pool.acquire()
+                with lock:
+                    seen.add(id(connection))
+                connection.execute("SELECT COUNT(*) FROM items").fetchone()
+                pool.release(connection)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(seen) <= 3
+        pool.close()
+
+    @staticmethod
+    def test_invalid_pool_size():
+        """Test that a non-positive pool size is rejected."""
+        with pytest.raises(ValueError, match="pool size"):
+            database.ConnectionPool(lambda: None, 0, 1.0)
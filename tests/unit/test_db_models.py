@@ -8,20 +8,31 @@ This module contains comprehensive unit tests for the database models including:
 - Model field validation and nullable constraints
 """
 
+import sqlite3
+from pathlib import Path
+
 import pytest
 from sqlalchemy import create_engine, inspect
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
 from src.data.database import create_session_factory, init_db
 from src.data.db_models import (
     AssetORM,
     AssetRelationshipORM,
+    EventTypeORM,
     RegulatoryEventAssetORM,
     RegulatoryEventORM,
+    RelationshipTypeORM,
+    _reuse_lookup_rows,
+    lookup_ids,
 )
+from src.data.repository import AssetGraphRepository
 
 pytest.importorskip("sqlalchemy")
 
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+
 
 @pytest.fixture
 def db_session(tmp_path):
@@ -655,3 +666,244 @@ class TestRegulatoryEventAssetORM:
         # Related asset link should be deleted
         remaining = db_session.query(RegulatoryEventAssetORM).filter_by(event_id="CASCADE_EVENT").first()
         assert remaining is None
+
+
+def _create_schema(db_path, source):
+    """Create the schema at ``db_path`` from the ORM models or from the SQL migrations."""
+    if source == "orm":
+        engine = create_engine(f"sqlite:///{db_path}")
+        init_db(engine)
+        engine.dispose()
+        return
+    with sqlite3.connect(db_path) as connection:
+        for script in sorted(MIGRATIONS_DIR.glob("*.sql")):
+            connection.executescript(script.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(params=["orm", "migrations"])
+def indexed_engine(request, tmp_path):
+    """Create an engine on a schema built from the ORM models or from the SQL migrations."""
+    db_path = tmp_path / "indexes.db"
+    _create_schema(db_path, request.param)
+    engine = create_engine(f"sqlite:///{db_path}")
+    yield engine
+    engine.dispose()
+
+
+class TestSecondaryIndexes:
+    """EXPLAIN-based checks that lookups use the secondary indexes."""
+
+    @staticmethod
+    def _query_plan(engine, sql, params=()):
+        with engine.connect() as connection:
+            rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        return " | ".join(row[-1] for row in rows)
+
+    @staticmethod
+    def test_orm_and_migration_indexes_match(tmp_path):
+        """Test that the ORM declarations and the migrations define the same indexes."""
+        definitions = []
+        for source in ("orm", "migrations"):
+            db_path = tmp_path / f"{source}.db"
+            _create_schema(db_path, source)
+            with sqlite3.connect(db_path) as connection:
+                rows = connection.execute(
+                    "SELECT name, tbl_name FROM sqlite_master WHERE type = 'index' AND name LIKE 'ix_%'"
+                ).fetchall()
+            definitions.append(sorted(rows))
+
+        assert definitions[0] == definitions[1]
+        assert len(definitions[0]) == 7
+
+    @pytest.mark.parametrize(
+        "sql, index",
+        [
+            (
+                "SELECT source_asset_id, strength FROM asset_relationships WHERE target_asset_id = ?",
+                "COVERING INDEX ix_asset_relationships_target",
+            ),
+            (
+                "SELECT source_asset_id FROM asset_relationships "
+                "WHERE target_asset_id = ? AND relationship_type_id = ?",
+                "COVERING INDEX ix_asset_relationships_target",
+            ),
+            ("SELECT id FROM regulatory_events WHERE asset_id = ? ORDER BY date", "INDEX ix_regulatory_events_asset"),
+            (
+                "SELECT event_id FROM regulatory_event_assets WHERE asset_id = ?",
+                "COVERING INDEX ix_regulatory_event_assets_asset",
+            ),
+            (
+                "SELECT id FROM asset_relationships WHERE (source_asset_id, id) > (?, 0) "
+                "ORDER BY source_asset_id, id LIMIT 10",
+                "INDEX ix_asset_relationships_source",
+            ),
+            ("SELECT id FROM assets WHERE sector = ?", "INDEX ix_assets_sector"),
+            ("SELECT id FROM assets WHERE asset_class = ?", "INDEX ix_assets_asset_class"),
+            ("SELECT id FROM assets WHERE issuer_id = ?", "INDEX ix_assets_issuer_id"),
+        ],
+    )
+    def test_lookup_uses_index(self, indexed_engine, sql, index):
+        """Test that each lookup is served by its index rather than a full scan."""
+        params = tuple("X" for _ in range(sql.count("?")))
+
+        plan = self._query_plan(indexed_engine, sql, params)
+
+        assert index in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_price_history_range_scans_primary_key(self, indexed_engine):
+        """Test that price history is clustered by its key and read without sorting."""
+        with indexed_engine.connect() as connection:
+            ddl = connection.exec_driver_sql("SELECT sql FROM sqlite_master WHERE name = 'price_history'").scalar()
+        plan = self._query_plan(
+            indexed_engine,
+            "SELECT date, close FROM price_history WHERE asset_id = ? AND date BETWEEN ? AND ? "
+            "ORDER BY asset_id, date",
+            ("A", "2024-01-01", "2024-12-31"),
+        )
+
+        assert "WITHOUT ROWID" in ddl.upper()
+        assert "PRIMARY KEY" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_distinct_sectors_scan_covering_index(self, indexed_engine):
+        """Test that listing distinct sectors reads only the sector index."""
+        plan = self._query_plan(indexed_engine, "SELECT DISTINCT sector FROM assets")
+
+        assert "COVERING INDEX ix_assets_sector" in plan
+
+
+class TestTypeLookupTables:
+    """Test cases for the dictionary-encoded relationship and event types."""
+
+    @staticmethod
+    def _add_assets(session, *asset_ids):
+        session.add_all(
+            AssetORM(
+                id=asset_id,
+                symbol=asset_id,
+                name=asset_id,
+                asset_class="equity",
+                sector="Tech",
+                price=1.0,
+                currency="USD",
+            )
+            for asset_id in asset_ids
+        )
+
+    @staticmethod
+    def _relationship(source_id, target_id, rel_type):
+        return AssetRelationshipORM(
+            source_asset_id=source_id, target_asset_id=target_id, relationship_type=rel_type, strength=1.0
+        )
+
+    def test_relationship_types_are_stored_once(self, db_session):
+        """Test that relationships sharing a type name share one lookup row."""
+        self._add_assets(db_session, "A", "B", "C")
+        db_session.add_all([self._relationship("A", "B", "same_sector"), self._relationship("A", "C", "same_sector")])
+        db_session.commit()
+        db_session.add(self._relationship("B", "C", "same_sector"))
+        db_session.commit()
+
+        assert [row.name for row in db_session.query(RelationshipTypeORM)] == ["same_sector"]
+        assert {rel.relationship_type_id for rel in db_session.query(AssetRelationshipORM)} == {
+            db_session.query(RelationshipTypeORM.id).scalar()
+        }
+
+    def test_type_names_stay_queryable(self, db_session):
+        """Test that the type attributes read, filter and update by name."""
+        self._add_assets(db_session, "A", "B")
+        rel = self._relationship("A", "B", "correlation")
+        event = RegulatoryEventORM(
+            id="EV1", asset_id="A", event_type="sec_filing", date="2024-01-01", description="Filing", impact_score=0.1
+        )
+        db_session.add_all([rel, event])
+        db_session.commit()
+
+        rel.relationship_type = "same_sector"
+        db_session.commit()
+        db_session.expire_all()
+
+        assert db_session.query(AssetRelationshipORM).one().relationship_type == "same_sector"
+        assert db_session.query(AssetRelationshipORM).filter_by(relationship_type="same_sector").count() == 1
+        assert (
+            db_session.query(AssetRelationshipORM)
+            .filter(AssetRelationshipORM.relationship_type.in_(["correlation"]))
+            .count()
+            == 0
+        )
+        assert db_session.query(RegulatoryEventORM).filter(RegulatoryEventORM.event_type == "sec_filing").one() == event
+        assert event.event_type == "sec_filing"
+
+    def test_lookup_hook_is_scoped_to_asset_graph_sessions(self, tmp_path):
+        """Test that only asset graph sessions, not every Session in the process, resolve type names on flush."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'scoped.db'}")
+        init_db(engine)
+        plain = Session(engine)
+        try:
+            assert _reuse_lookup_rows not in plain.dispatch.before_flush
+            with create_session_factory(engine)() as session:
+                assert _reuse_lookup_rows in session.dispatch.before_flush
+
+            # A repository brings the hook to sessions from any factory
+            AssetGraphRepository(plain)
+            self._add_assets(plain, "A", "B", "C")
+            plain.add_all([self._relationship("A", "B", "same_sector"), self._relationship("A", "C", "same_sector")])
+            plain.commit()
+            AssetGraphRepository(plain)
+
+            assert list(plain.dispatch.before_flush).count(_reuse_lookup_rows) == 1
+            assert plain.query(RelationshipTypeORM).count() == 1
+        finally:
+            plain.close()
+            engine.dispose()
+
+    @staticmethod
+    def test_lookup_ids_inserts_missing_names(db_session):
+        """Test that lookup_ids returns existing ids and creates the missing ones."""
+        first = lookup_ids(db_session, EventTypeORM, ["earnings_report"])
+        both = lookup_ids(db_session, EventTypeORM, ["earnings_report", "dividend_announcement"])
+
+        assert both["earnings_report"] == first["earnings_report"]
+        assert len(set(both.values())) == 2
+        assert lookup_ids(db_session, EventTypeORM, []) == {}
+
+    @staticmethod
+    def test_migration_preserves_rows(tmp_path):
+        """Test that migration 005 moves existing type names into the lookup tables."""
+        db_path = tmp_path / "migrated.db"
+        scripts = sorted(MIGRATIONS_DIR.glob("*.sql"))
+        lookup_script = next(script for script in scripts if script.name.startswith("005_"))
+        with sqlite3.connect(db_path) as connection:
+            for script in scripts[: scripts.index(lookup_script)]:
+                connection.executescript(script.read_text(encoding="utf-8"))
+            connection.executescript(
+                """
+                INSERT INTO assets (id, symbol, name, asset_class, sector, price, currency)
+                    VALUES ('A', 'A', 'A', 'equity', 'Tech', 1.0, 'USD'),
+                           ('B', 'B', 'B', 'equity', 'Tech', 1.0, 'USD');
+                INSERT INTO asset_relationships (source_asset_id, target_asset_id, relationship_type, strength,
+                                                 bidirectional)
+                    VALUES ('A', 'B', 'same_sector', 0.7, 1), ('B', 'A', 'correlation', 0.4, 0);
+                INSERT INTO regulatory_events (id, asset_id, event_type, date, description, impact_score)
+                    VALUES ('EV1', 'A', 'earnings_report', '2024-01-15', 'Earnings', 0.5);
+                INSERT INTO regulatory_event_assets (event_id, asset_id) VALUES ('EV1', 'B');
+                """
+            )
+
+            connection.executescript(lookup_script.read_text(encoding="utf-8"))
+
+        engine = create_engine(f"sqlite:///{db_path}")
+        session = create_session_factory(engine)()
+        try:
+            relationships = session.query(AssetRelationshipORM).order_by(AssetRelationshipORM.id).all()
+            event = session.query(RegulatoryEventORM).one()
+            assert [(rel.source_asset_id, rel.relationship_type, rel.strength) for rel in relationships] == [
+                ("A", "same_sector", 0.7),
+                ("B", "correlation", 0.4),
+            ]
+            assert event.event_type == "earnings_report"
+            assert [link.asset_id for link in event.related_assets] == ["B"]
+        finally:
+            session.close()
+            engine.dispose()
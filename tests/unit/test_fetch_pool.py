@@ -0,0 +1,176 @@
+"""Unit tests for the bounded, retrying market data fetch pool."""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from src.data.fetch_pool import FetchPolicy, FetchPool
+
+
+@pytest.fixture
+def make_pool():
+    """Create pools with fast retries and close them after the test."""
+    pools = []
+
+    def make(**kwargs) -> FetchPool:
+        kwargs.setdefault("backoff_base", 0.01)
+        pools.append(FetchPool(FetchPolicy(**kwargs)))
+        return pools[-1]
+
+    yield make
+    for pool in pools:
+        pool.close()
+
+
+class TestFetchPolicy:
+    """Test cases for policy validation and backoff delays."""
+
+    @staticmethod
+    def test_backoff_is_capped_exponential_with_full_jitter():
+        """Test that the delay bound doubles per attempt up to the cap and is scaled by the jitter draw."""
+        policy = FetchPolicy(backoff_base=1.0, backoff_max=3.0)
+
+        assert [policy.backoff(attempt, rng=lambda: 1.0) for attempt in range(4)] == [1.0, 2.0, 3.0, 3.0]
+        assert policy.backoff(2, rng=lambda: 0.5) == 1.5
+        assert policy.backoff(5, rng=lambda: 0.0) == 0.0
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "kwargs", [{"max_workers": 0}, {"per_host_limit": 0}, {"retries": -1}, {"backoff_max": -1}, {"timeout": 0}]
+    )
+    def test_rejects_invalid_settings(kwargs):
+        """Test that invalid limits raise ValueError."""
+        with pytest.raises(ValueError):
+            FetchPolicy(**kwargs)
+
+
+class TestFetchPool:
+    """Test cases for concurrent fetching."""
+
+    @staticmethod
+    def test_results_keep_symbol_order(make_pool):
+        """Test that results follow the symbols although later symbols finish first."""
+        pool = make_pool()
+        delays = {"A": 0.06, "B": 0.04, "C": 0.0, "D": 0.02}
+
+        def fetch(symbol):
+            time.sleep(delays[symbol])
+            return symbol.lower()
+
+        assert pool.map(fetch, delays, host="example.com") == ["a", "b", "c", "d"]
+
+    @staticmethod
+    def test_empty_and_failed_symbols_are_skipped(make_pool, caplog):
+        """Test that None results and symbols that keep failing are left out and failures logged."""
+        pool = make_pool(retries=1)
+
+        def fetch(symbol):
+            if symbol == "BAD":
+                raise ConnectionError("reset by peer")
+            return None if symbol == "EMPTY" else symbol
+
+        with caplog.at_level(logging.WARNING, logger="src.data.fetch_pool"):
+            assert pool.map(fetch, ["A", "BAD", "EMPTY", "B"], host="example.com") == ["A", "B"]
+
+        assert "retry 1 of 1" in caplog.text
+        assert "Failed to fetch data for BAD: reset by peer" in caplog.text
+
+    @staticmethod
+    def test_per_host_limit_bounds_concurrency(make_pool):
+        """Test that no more than per_host_limit requests to one host run at once."""
+        pool = make_pool(max_workers=8, per_host_limit=2, retries=0)
+        lock = threading.Lock()
+        # Every fetch waits for a second one, so the limit is reached, not just respected
+        overlap = threading.Barrier(2, timeout=5)
+        running = []
+        peak = []
+
+        def fetch(symbol):
+            with lock:
+                running.append(symbol)
+                peak.append(len(running))
+            overlap.wait()
+            with lock:
+                running.remove(symbol)
+            return symbol
+
+        symbols = [f"S{i}" for i in range(8)]
+
+        assert pool.map(fetch, symbols, host="example.com") == symbols
+        assert max(peak) <= 2
+
+    @staticmethod
+    def test_transient_failures_are_retried(make_pool):
+        """Test that a symbol succeeds when a retry does."""
+        pool = make_pool(retries=2)
+        attempts = []
+
+        def fetch(symbol):
+            attempts.append(symbol)
+            if len(attempts) < 3:
+                raise TimeoutError("read timed out")
+            return symbol
+
+        assert pool.map(fetch, ["A"], host="example.com") == ["A"]
+        assert attempts == ["A", "A", "A"]
+
+    @staticmethod
+    def test_hung_symbol_times_out(make_pool, caplog):
+        """Test that a symbol exceeding the timeout is given up on without holding up the others."""
+        pool = make_pool(timeout=0.2)
+        release = threading.Event()
+
+        def fetch(symbol):
+            if symbol == "HUNG":
+                release.wait(5)
+            return symbol
+
+        start = time.monotonic()
+        try:
+            with caplog.at_level(logging.ERROR, logger="src.data.fetch_pool"):
+                assert pool.map(fetch, ["A", "HUNG", "B"], host="example.com") == ["A", "B"]
+        finally:
+            release.set()
+
+        assert time.monotonic() - start < 2
+        assert "Timed out fetching data for HUNG" in caplog.text
+
+    @staticmethod
+    def test_queued_symbols_time_out_behind_hung_workers(make_pool):
+        """Test that map() returns when hung fetches keep every worker busy and other symbols never start."""
+        pool = make_pool(max_workers=1, timeout=0.2)
+        release = threading.Event()
+        started = []
+
+        def fetch(symbol):
+            started.append(symbol)
+            release.wait(5)
+            return symbol
+
+        start = time.monotonic()
+        try:
+            assert pool.map(fetch, ["HUNG", "QUEUED"], host="example.com") == []
+        finally:
+            release.set()
+
+        assert time.monotonic() - start < 2
+        assert started == ["HUNG"]
+
+    @staticmethod
+    def test_no_retry_past_the_timeout(make_pool, monkeypatch):
+        """Test that a retry whose backoff would end after the timeout is not attempted."""
+        pool = make_pool(retries=5, backoff_base=10.0, timeout=1.0)
+        monkeypatch.setattr("src.data.fetch_pool.random.random", lambda: 0.5)
+        attempts = []
+
+        def fetch(symbol):
+            attempts.append(symbol)
+            raise ConnectionError("refused")
+
+        start = time.monotonic()
+
+        assert pool.map(fetch, ["A"], host="example.com") == []
+        assert attempts == ["A"]
+        assert time.monotonic() - start < 1
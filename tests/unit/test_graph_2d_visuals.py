@@ -8,9 +8,13 @@ This module contains comprehensive unit tests for the graph_2d_visuals module in
 - Edge cases and error handling
 """
 
+from dataclasses import replace
+
 import plotly.graph_objects as go
 import pytest
 
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.visualizations import graph_2d_visuals
 from src.visualizations.graph_2d_visuals import (
     _create_2d_relationship_traces,
     _create_circular_layout,
@@ -133,6 +137,87 @@ class TestVisualize2DGraph:
             for size in sizes:
                 assert 20 <= size <= 50, "Node sizes should be between 20 and 50"
 
+    def test_visualize_2d_graph_webgl_render_mode(self, populated_graph):
+        """Test that WebGL render mode switches edges and nodes to Scattergl."""
+        fig = visualize_2d_graph(populated_graph, render_mode="webgl", show_all_relationships=True)
+
+        assert fig.data
+        assert all(isinstance(trace, go.Scattergl) for trace in fig.data)
+
+    def test_visualize_2d_graph_auto_render_mode_small_graph_uses_svg(self, populated_graph):
+        """Test that small graphs keep SVG rendering in auto mode."""
+        fig = visualize_2d_graph(populated_graph)
+
+        assert all(isinstance(trace, go.Scatter) for trace in fig.data)
+
+    def test_visualize_2d_graph_invalid_render_mode(self, populated_graph):
+        """Test that an unknown render mode is rejected."""
+        with pytest.raises(ValueError, match="Invalid render_mode"):
+            visualize_2d_graph(populated_graph, render_mode="canvas")
+
+    def test_visualize_2d_graph_auto_overview_for_large_node_counts(self, populated_graph):
+        """Test that auto level of detail collapses sectors above the node budget."""
+        fig = visualize_2d_graph(populated_graph, max_nodes=2)
+
+        node_trace = fig.data[-1]
+        assert set(node_trace.text) == {asset.sector for asset in populated_graph.assets.values()}
+        assert "Overview" in fig.layout.title.text
+
+    def test_visualize_2d_graph_drops_edges_below_strength_percentile(self, sample_equity):
+        """Test that min_strength_percentile drops weak edges through the public API."""
+        graph = AssetRelationshipGraph()
+        for asset_id in ("A", "B", "C", "D", "E"):
+            graph.add_asset(replace(sample_equity, id=asset_id, symbol=asset_id))
+        for target_id, strength in (("B", 0.9), ("C", 0.1), ("D", 0.5), ("E", 0.3)):
+            graph.add_relationship("A", target_id, "correlation", strength)
+
+        def edge_count(fig):
+            return sum(len(trace.x) for trace in fig.data if trace.mode == "lines") // 3
+
+        fig = visualize_2d_graph(graph, show_all_relationships=True, min_strength_percentile=50)
+
+        assert edge_count(fig) == 2
+        lines = [trace for trace in fig.data if trace.mode == "lines"]
+        assert sorted(row[1] for trace in lines for row in trace.customdata[::3]) == ["B", "D"]
+        # The percentile is part of the trace cache key
+        assert edge_count(visualize_2d_graph(graph, show_all_relationships=True)) == 4
+        with pytest.raises(ValueError, match="min_strength_percentile"):
+            visualize_2d_graph(graph, min_strength_percentile=-1)
+
+    def test_visualize_2d_graph_spends_edge_budget_on_visible_types(self, sample_equity):
+        """Test that the edge budget only ranks edges of the visible relationship types."""
+        graph = AssetRelationshipGraph()
+        for asset_id in ("A", "B", "C", "D"):
+            graph.add_asset(replace(sample_equity, id=asset_id, symbol=asset_id))
+        for target_id, strength in (("B", 0.9), ("C", 0.8)):
+            graph.add_relationship("A", target_id, "correlation", strength)
+        for target_id, strength in (("B", 0.3), ("C", 0.2), ("D", 0.1)):
+            graph.add_relationship("A", target_id, "same_sector", strength)
+
+        fig = visualize_2d_graph(graph, level_of_detail="reduced", max_edges=2, show_correlation=False)
+
+        lines = [trace for trace in fig.data if trace.mode == "lines"]
+        assert [trace.name for trace in lines] == ["Same Sector"]
+        assert sorted(row[1] for row in lines[0].customdata[::3]) == ["B", "C"]
+
+    def test_visualize_2d_graph_reuses_relationship_traces(self, populated_graph, monkeypatch):
+        """Test that re-rendering an unchanged graph with the same layout reuses its edge traces."""
+        calls = []
+        original = graph_2d_visuals.relationship_columns
+
+        def counting(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(graph_2d_visuals, "relationship_columns", counting)
+
+        visualize_2d_graph(populated_graph, layout_type="circular")
+        visualize_2d_graph(populated_graph, layout_type="circular", show_correlation=False)
+        assert len(calls) == 1
+
+        visualize_2d_graph(populated_graph, layout_type="grid")
+        assert len(calls) == 2
+
     def test_visualize_2d_graph_preserves_graph_state(self, populated_graph):
         """Test that visualization doesn't modify the graph."""
         initial_asset_count = len(populated_graph.assets)
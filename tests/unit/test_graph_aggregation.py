@@ -0,0 +1,125 @@
+"""Unit tests for the meta-graph aggregation stage."""
+
+import pytest
+
+from src.logic.graph_aggregation import aggregate_by_sector, aggregate_graph, relationship_columns
+
+
+@pytest.mark.unit
+class TestRelationshipColumns:
+    """Test suite for flattening relationships into columns."""
+
+    @staticmethod
+    def test_columns_are_parallel(empty_graph):
+        """Test that each relationship contributes one entry to every column."""
+        empty_graph.add_relationship("A", "B", "correlation", 0.5, bidirectional=True)
+        empty_graph.add_relationship("A", "C", "same_sector", 0.7)
+
+        sources, targets, rel_types, strengths = relationship_columns(empty_graph)
+
+        assert sources == ["A", "A", "B"]
+        assert targets == ["B", "C", "A"]
+        assert rel_types == ["correlation", "same_sector", "correlation"]
+        assert strengths == [0.5, 0.7, 0.5]
+
+    @staticmethod
+    def test_columns_restricted_to_sources(empty_graph):
+        """Test that unknown or excluded sources are skipped."""
+        empty_graph.add_relationship("A", "B", "correlation", 0.5, bidirectional=True)
+
+        sources, targets, _, _ = relationship_columns(empty_graph, ["B", "missing"])
+
+        assert sources == ["B"]
+        assert targets == ["A"]
+
+
+@pytest.mark.unit
+class TestAggregateBySector:
+    """Test suite for sector aggregation."""
+
+    @staticmethod
+    def test_sector_flows_and_internal_edges(populated_graph):
+        """Test that relationships are counted per ordered sector pair."""
+        meta = aggregate_by_sector(populated_graph)
+        sectors = {asset.sector for asset in populated_graph.assets.values()}
+
+        assert meta.group_by == "sector"
+        assert set(meta.nodes) == sectors
+        assert int(meta.node_sizes.sum()) == len(populated_graph.assets)
+        assert int(meta.edge_counts.sum()) == sum(
+            1
+            for source_id, rels in populated_graph.relationships.items()
+            for target_id, _, _ in rels
+            if source_id in populated_graph.assets and target_id in populated_graph.assets
+        )
+
+    @staticmethod
+    def test_mean_strength(empty_graph, sample_equity, sample_bond):
+        """Test that meta-edge strength is the mean of the collapsed edges."""
+        empty_graph.add_asset(sample_equity)
+        empty_graph.add_asset(sample_bond)
+        empty_graph.add_relationship(sample_equity.id, sample_bond.id, "correlation", 0.2)
+        empty_graph.add_relationship(sample_bond.id, sample_equity.id, "same_sector", 0.6)
+
+        meta = aggregate_by_sector(empty_graph)
+
+        assert meta.nodes == ["Technology"]
+        assert meta.edge_counts.tolist() == [2]
+        assert meta.mean_strength.tolist() == pytest.approx([0.4])
+
+    @staticmethod
+    def test_empty_graph(empty_graph):
+        """Test that an empty graph aggregates to an empty meta-graph."""
+        meta = aggregate_by_sector(empty_graph)
+
+        assert meta.nodes == []
+        assert len(meta.sources) == 0
+
+
+@pytest.mark.unit
+class TestAggregateGraph:
+    """Test suite for the asset class and community groupings."""
+
+    @staticmethod
+    def test_asset_class_grouping(populated_graph):
+        """Test that assets are grouped by their asset class value."""
+        meta = aggregate_graph(populated_graph, "asset_class")
+        classes = sorted({asset.asset_class.value for asset in populated_graph.assets.values()})
+
+        assert meta.group_by == "asset_class"
+        assert meta.nodes == classes
+        assert int(meta.node_sizes.sum()) == len(populated_graph.assets)
+
+    @staticmethod
+    def test_community_grouping_separates_clusters(
+        empty_graph, sample_equity, sample_bond, sample_commodity, sample_currency
+    ):
+        """Test that two disconnected pairs form two communities."""
+        for asset in (sample_equity, sample_bond, sample_commodity, sample_currency):
+            empty_graph.add_asset(asset)
+        empty_graph.add_relationship(sample_equity.id, sample_bond.id, "corporate_link", 0.9, bidirectional=True)
+        empty_graph.add_relationship(sample_commodity.id, sample_currency.id, "correlation", 0.4)
+
+        meta = aggregate_graph(empty_graph, "community")
+
+        assert meta.nodes == ["Community 1", "Community 2"]
+        assert meta.node_sizes.tolist() == [2, 2]
+        assert meta.sources.tolist() == meta.targets.tolist()
+        assert int(meta.edge_counts.sum()) == 3
+
+    @staticmethod
+    def test_community_grouping_of_isolated_assets(empty_graph, sample_equity, sample_bond):
+        """Test that assets without relationships form singleton communities."""
+        empty_graph.add_asset(sample_equity)
+        empty_graph.add_asset(sample_bond)
+
+        meta = aggregate_graph(empty_graph, "community")
+
+        assert meta.node_sizes.tolist() == [1, 1]
+        assert len(meta.sources) == 0
+
+    @staticmethod
+    def test_invalid_grouping(empty_graph):
+        """Test that an unknown grouping raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid group_by"):
+            aggregate_graph(empty_graph, "country")
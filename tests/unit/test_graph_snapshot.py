@@ -0,0 +1,229 @@
+"""Unit tests for binary graph snapshots."""
+
+import json
+import struct
+from unittest.mock import patch
+
+import pytest
+
+from src.data.graph_snapshot import (
+    SNAPSHOT_MAGIC,
+    SNAPSHOT_SUFFIX,
+    load_snapshot,
+    open_shared_snapshot,
+    save_snapshot,
+)
+from src.data.real_data_fetcher import RealDataFetcher, _load_from_cache, _save_to_cache
+from src.data.sample_data import create_sample_database
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import AssetClass, Bond, Equity
+from src.visualizations.graph_visuals import visualize_3d_graph, visualize_3d_graph_with_filters
+
+
+@pytest.fixture(scope="module")
+def sample_graph():
+    """Create the bundled sample graph once for the module."""
+    return create_sample_database()
+
+
+def _equity(asset_id: str, **kwargs) -> Equity:
+    return Equity(
+        id=asset_id,
+        symbol=asset_id,
+        name=f"{asset_id} Corp",
+        asset_class=AssetClass.EQUITY,
+        sector="Technology",
+        price=10.0,
+        **kwargs,
+    )
+
+
+class TestGraphSnapshot:
+    """Test cases for writing and reading snapshots."""
+
+    @staticmethod
+    def test_round_trip(sample_graph, tmp_path):
+        """Test that assets, relationships and events survive in their original order."""
+        path = tmp_path / f"graph{SNAPSHOT_SUFFIX}"
+        save_snapshot(sample_graph, path)
+
+        with patch.object(AssetRelationshipGraph, "add_relationship", side_effect=AssertionError):
+            loaded = load_snapshot(path)
+
+        assert list(loaded.assets.items()) == list(sample_graph.assets.items())
+        assert list(loaded.relationships.items()) == list(sample_graph.relationships.items())
+        assert loaded.regulatory_events == sample_graph.regulatory_events
+
+    @staticmethod
+    def test_optional_fields_and_subclasses(tmp_path):
+        """Test that None values, enums and subclass-only fields are kept."""
+        graph = AssetRelationshipGraph()
+        graph.add_asset(_equity("A", pe_ratio=12.5))
+        graph.add_asset(
+            Bond(
+                id="B",
+                symbol="B",
+                name="B Bond",
+                asset_class=AssetClass.FIXED_INCOME,
+                sector="Technology",
+                price=99.0,
+                coupon_rate=0.04,
+                issuer_id="A",
+            )
+        )
+        graph.add_relationship("B", "A", "corporate_link", 0.9)
+        path = tmp_path / f"graph{SNAPSHOT_SUFFIX}"
+        save_snapshot(graph, path)
+
+        loaded = load_snapshot(path)
+
+        assert loaded.assets == graph.assets
+        assert loaded.assets["A"].dividend_yield is None
+        assert isinstance(loaded.assets["B"], Bond)
+        assert loaded.assets["B"].asset_class is AssetClass.FIXED_INCOME
+        assert loaded.relationships == {"B": [("A", "corporate_link", 0.9)]}
+
+    @staticmethod
+    def test_empty_graph(tmp_path):
+        """Test that a graph without data round trips."""
+        path = tmp_path / f"graph{SNAPSHOT_SUFFIX}"
+        save_snapshot(AssetRelationshipGraph(), path)
+
+        loaded = load_snapshot(path)
+
+        assert (loaded.assets, loaded.relationships, loaded.regulatory_events) == ({}, {}, [])
+
+    @staticmethod
+    def test_rejects_other_files(tmp_path):
+        """Test that non-snapshot files and unknown versions raise ValueError."""
+        path = tmp_path / f"graph{SNAPSHOT_SUFFIX}"
+        path.write_text(json.dumps({"assets": []}))
+        with pytest.raises(ValueError, match="not a graph snapshot"):
+            load_snapshot(path)
+
+        path.write_bytes(struct.pack("<8sII", SNAPSHOT_MAGIC, 99, 0))
+        with pytest.raises(ValueError, match="unsupported graph snapshot version"):
+            load_snapshot(path)
+
+    @staticmethod
+    def test_rejects_nul_in_strings(tmp_path):
+        """Test that strings that cannot be stored are reported."""
+        graph = AssetRelationshipGraph()
+        graph.assets["A"] = _equity("A\0")
+
+        with pytest.raises(ValueError, match="NUL"):
+            save_snapshot(graph, tmp_path / f"graph{SNAPSHOT_SUFFIX}")
+
+
+class TestSharedSnapshot:
+    """Test cases for graphs served from a memory-mapped snapshot."""
+
+    @staticmethod
+    @pytest.fixture
+    def shared_graph(sample_graph, tmp_path):
+        """Write the sample graph and map it read-only."""
+        path = tmp_path / f"graph{SNAPSHOT_SUFFIX}"
+        save_snapshot(sample_graph, path)
+        return open_shared_snapshot(path)
+
+    @staticmethod
+    def test_matches_loaded_graph(sample_graph, shared_graph):
+        """Test that the mapped graph holds the same data in the same order."""
+        assert list(shared_graph.assets.items()) == list(sample_graph.assets.items())
+        assert list(shared_graph.relationships.items()) == list(sample_graph.relationships.items())
+        assert list(shared_graph.relationships.values()) == list(sample_graph.relationships.values())
+        assert shared_graph.regulatory_events == sample_graph.regulatory_events
+        assert shared_graph.calculate_metrics() == sample_graph.calculate_metrics()
+
+    @staticmethod
+    def test_lookups(sample_graph, shared_graph):
+        """Test that ids are found by binary search and unknown ids are reported."""
+        for asset_id, asset in sample_graph.assets.items():
+            assert asset_id in shared_graph.assets
+            assert shared_graph.assets[asset_id] == asset
+        for source_id, rels in sample_graph.relationships.items():
+            assert shared_graph.relationships[source_id] == rels
+
+        assert "missing" not in shared_graph.assets
+        assert shared_graph.assets.get("missing") is None
+        with pytest.raises(KeyError):
+            shared_graph.relationships["missing"]
+
+    @staticmethod
+    @pytest.mark.parametrize("visualize", [visualize_3d_graph, visualize_3d_graph_with_filters])
+    def test_renders_like_loaded_graph(sample_graph, shared_graph, visualize):
+        """Test that the 3D views draw the same traces, relationships included, as for the dict graph."""
+        expected = visualize(sample_graph)
+        figure = visualize(shared_graph)
+
+        assert len(figure.data) == len(expected.data) > 1
+        assert figure.to_json() == expected.to_json()
+
+    @staticmethod
+    def test_is_read_only(sample_graph, shared_graph):
+        """Test that the mapped graph rejects every mutation and keeps its version."""
+        source_id = next(iter(sample_graph.relationships))
+        version = shared_graph.version
+        mutations = [
+            lambda: shared_graph.add_asset(_equity("NEW")),
+            lambda: shared_graph.add_relationship("A", "B", "same_sector", 0.5),
+            lambda: shared_graph.add_relationship(source_id, "NEW", "same_sector", 0.5),
+            lambda: shared_graph.add_regulatory_event(sample_graph.regulatory_events[0]),
+            shared_graph.build_relationships,
+        ]
+        for mutate in mutations:
+            with pytest.raises(TypeError, match="read-only"):
+                mutate()
+
+        assert shared_graph.version == version
+        assert shared_graph.relationships[source_id] == sample_graph.relationships[source_id]
+        assert shared_graph.regulatory_events == sample_graph.regulatory_events
+
+
+class TestFetcherCacheFormat:
+    """Test cases for the cache format selection in RealDataFetcher."""
+
+    @staticmethod
+    def test_cache_format_follows_extension(sample_graph, tmp_path):
+        """Test that .graphsnap paths are snapshots and other paths JSON."""
+        snapshot_path = tmp_path / f"graph{SNAPSHOT_SUFFIX}"
+        json_path = tmp_path / "graph.json"
+        _save_to_cache(sample_graph, snapshot_path)
+        _save_to_cache(sample_graph, json_path)
+
+        assert snapshot_path.read_bytes().startswith(SNAPSHOT_MAGIC)
+        assert "assets" in json.loads(json_path.read_text())
+        for path in (snapshot_path, json_path):
+            assert _load_from_cache(path).relationships == sample_graph.relationships
+
+    @staticmethod
+    def test_fetcher_persists_snapshot(tmp_path):
+        """Test that a fetched graph is cached as a snapshot and served from it."""
+        cache_path = tmp_path / f"graph{SNAPSHOT_SUFFIX}"
+        with (
+            patch.object(RealDataFetcher, "_fetch_equity_data", return_value=[_equity("A"), _equity("B")]),
+            patch.object(RealDataFetcher, "_fetch_bond_data", return_value=[]),
+            patch.object(RealDataFetcher, "_fetch_commodity_data", return_value=[]),
+            patch.object(RealDataFetcher, "_fetch_currency_data", return_value=[]),
+            patch.object(RealDataFetcher, "_create_regulatory_events", return_value=[]),
+        ):
+            fetched = RealDataFetcher(cache_path=str(cache_path)).create_real_database()
+
+        assert cache_path.read_bytes().startswith(SNAPSHOT_MAGIC)
+        cached = RealDataFetcher(cache_path=str(cache_path), enable_network=False).create_real_database()
+        assert cached.assets == fetched.assets
+        assert cached.relationships == fetched.relationships
+
+    @staticmethod
+    def test_fetcher_shares_snapshot(sample_graph, tmp_path):
+        """Test that share_snapshot maps snapshot caches and loads other caches."""
+        snapshot_path = tmp_path / f"graph{SNAPSHOT_SUFFIX}"
+        json_path = tmp_path / "graph.json"
+        _save_to_cache(sample_graph, snapshot_path)
+        _save_to_cache(sample_graph, json_path)
+
+        mapped = RealDataFetcher(cache_path=str(snapshot_path), enable_network=False, share_snapshot=True)
+        loaded = RealDataFetcher(cache_path=str(json_path), enable_network=False, share_snapshot=True)
+
+        assert not isinstance(mapped.create_real_database().assets, dict)
+        assert isinstance(loaded.create_real_database().assets, dict)
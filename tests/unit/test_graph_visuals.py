@@ -3,12 +3,18 @@ import plotly.graph_objects as go
 import pytest
 
 from src.logic.asset_graph import AssetRelationshipGraph
+from src.visualizations import graph_visuals
 from src.visualizations.graph_visuals import (
     REL_TYPE_COLORS,
     _build_asset_id_index,
+    _build_edge_coordinates_optimized,
     _build_relationship_index,
+    _collect_and_group_relationships,
     _create_directional_arrows,
     _create_relationship_traces,
+    _select_strongest_edges,
+    visualize_3d_graph,
+    visualize_3d_graph_with_filters,
 )
 
 
@@ -259,3 +265,269 @@ def test_create_directional_arrows_bidirectional_no_arrows():
     asset_ids = ["A", "B"]
     arrows = _create_directional_arrows(graph, positions, asset_ids)
     assert arrows == []
+
+
+def test_build_edge_coordinates_optimized_nan_separators():
+    """Test that edge coordinates are gathered per endpoint with NaN separators."""
+    positions = np.arange(9, dtype=float).reshape(3, 3)
+    xs, ys, zs = _build_edge_coordinates_optimized(np.array([0, 2]), np.array([1, 0]), positions)
+
+    assert xs.shape == ys.shape == zs.shape == (6,)
+    np.testing.assert_array_equal(xs[[0, 1, 3, 4]], [0.0, 3.0, 6.0, 0.0])
+    np.testing.assert_array_equal(zs[[0, 1, 3, 4]], [2.0, 5.0, 8.0, 2.0])
+    assert np.isnan(xs[[2, 5]]).all()
+
+
+def test_collect_and_group_relationships_dedupes_bidirectional_pairs():
+    """Test that reciprocal edges collapse into one bidirectional entry per pair."""
+    graph = DummyGraph(
+        {
+            "A": [("B", "correlation", 0.9), ("C", "same_sector", 0.4)],
+            "B": [("A", "correlation", 0.9)],
+        }
+    )
+    groups = _collect_and_group_relationships(graph, ["A", "B", "C"])
+
+    assert set(groups) == {("correlation", True), ("same_sector", False)}
+    bidirectional = groups[("correlation", True)]
+    assert bidirectional.source_idx.tolist() == [0]
+    assert bidirectional.target_idx.tolist() == [1]
+    assert groups[("same_sector", False)].strength.tolist() == [0.4]
+
+
+def test_create_relationship_traces_hover_data_aligned_with_coordinates():
+    """Test that customdata rows line up with coordinates for client-side hover."""
+    graph = DummyGraph({"A": [("B", "correlation", 0.25)]})
+    positions, asset_ids, _, _ = graph.get_3d_visualization_data_enhanced()
+
+    (trace,) = _create_relationship_traces(graph, positions, asset_ids)
+
+    assert len(trace.customdata) == len(trace.x) == 3
+    assert list(trace.customdata[0]) == ["A", "B", 0.25]
+    assert trace.customdata[2][0] is None
+    assert "%{customdata[2]:.2f}" in trace.hovertemplate
+
+
+def test_create_relationship_traces_reuses_bundles_across_filter_toggles(monkeypatch):
+    """Test that toggling filters selects cached bundles instead of rebuilding edges."""
+    graph = DummyGraph(
+        {
+            "A": [("B", "correlation", 0.9), ("C", "same_sector", 0.4)],
+        }
+    )
+    positions, asset_ids, _, _ = graph.get_3d_visualization_data_enhanced()
+    calls = []
+    original = graph_visuals._collect_and_group_relationships
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(graph_visuals, "_collect_and_group_relationships", counting)
+
+    all_traces = _create_relationship_traces(graph, positions, asset_ids)
+    filtered = _create_relationship_traces(graph, positions, asset_ids, {"same_sector": False})
+
+    assert len(calls) == 1
+    assert {t.legendgroup for t in all_traces} == {"correlation", "same_sector"}
+    assert [t.legendgroup for t in filtered] == ["correlation"]
+
+
+def test_create_relationship_traces_rebuilds_after_graph_mutation():
+    """Test that a graph mutation invalidates the cached trace bundles."""
+    graph = DummyGraph({"A": [("B", "correlation", 0.9)]})
+    positions, asset_ids, _, _ = graph.get_3d_visualization_data_enhanced()
+    _create_relationship_traces(graph, positions, asset_ids)
+
+    graph.add_relationship("B", "A", "same_sector", 0.3)
+    traces = _create_relationship_traces(graph, positions, asset_ids)
+
+    assert {t.legendgroup for t in traces} == {"correlation", "same_sector"}
+
+
+def _count_calls(monkeypatch, name):
+    """Wrap ``graph_visuals.<name>`` so that its calls are recorded."""
+    calls = []
+    original = getattr(graph_visuals, name)
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(graph_visuals, name, counting)
+    return calls
+
+
+def test_visualize_3d_graph_validates_each_graph_version_once(monkeypatch):
+    """Test that repeated renders of an unchanged graph skip input validation."""
+    graph = DummyGraph({"A": [("B", "correlation", 0.9)]})
+    node_checks = _count_calls(monkeypatch, "_validate_visualization_data")
+    relationship_checks = _count_calls(monkeypatch, "_build_relationship_index")
+
+    visualize_3d_graph(graph)
+    visualize_3d_graph(graph)
+    assert len(node_checks) == 1
+    assert len(relationship_checks) == 1
+
+    graph.add_relationship("B", "A", "same_sector", 0.3)
+    visualize_3d_graph(graph)
+    assert len(node_checks) == 2
+    assert len(relationship_checks) == 2
+
+
+class _ScanCountingRelationships(dict):
+    """Relationship dict that counts full scans of its edge lists."""
+
+    scans = 0
+
+    def values(self):
+        self.scans += 1
+        return super().values()
+
+    def items(self):
+        self.scans += 1
+        return super().items()
+
+
+def test_visualize_3d_graph_repeat_render_does_not_scan_relationships():
+    """Test that rendering an unchanged graph again finds its caches without walking the edges."""
+    graph = DummyGraph(_ScanCountingRelationships({"A": [("B", "correlation", 0.9)], "B": [("C", "same_sector", 0.4)]}))
+    visualize_3d_graph(graph)
+    scans = graph.relationships.scans
+
+    visualize_3d_graph(graph)
+    assert graph.relationships.scans == scans
+
+    graph.touch()
+    visualize_3d_graph(graph)
+    assert graph.relationships.scans > scans
+
+
+def test_visualize_3d_graph_strict_validation_runs_every_render(monkeypatch):
+    """Test that strict mode validates on every render, even with cached traces."""
+    graph = DummyGraph({"A": [("B", "correlation", 0.9)]})
+    node_checks = _count_calls(monkeypatch, "_validate_visualization_data")
+    relationship_checks = _count_calls(monkeypatch, "_build_relationship_index")
+
+    visualize_3d_graph(graph, validation="strict")
+    visualize_3d_graph(graph, validation="strict")
+
+    assert len(node_checks) == 2
+    assert len(relationship_checks) >= 2
+
+
+def test_visualize_3d_graph_invalid_validation_mode():
+    """Test that an unknown validation mode is rejected."""
+    with pytest.raises(ValueError, match="Invalid validation mode"):
+        visualize_3d_graph(DummyGraph({}), validation="never")
+
+
+def test_collect_and_group_relationships_unchecked_path_matches_index():
+    """Test that validated graphs group duplicate edges like the relationship index."""
+    graph = DummyGraph({"A": [("B", "correlation", 0.2), ("C", "same_sector", 0.5), ("B", "correlation", 0.8)]})
+    asset_ids = ["A", "B", "C"]
+
+    validated = _collect_and_group_relationships(graph, asset_ids)
+    unchecked = _collect_and_group_relationships(graph, asset_ids)
+
+    assert validated.keys() == unchecked.keys()
+    for key, group in validated.items():
+        for expected, actual in zip(group, unchecked[key]):
+            np.testing.assert_array_equal(expected, actual)
+    assert unchecked[("correlation", False)].strength.tolist() == [0.8]
+
+
+def test_select_strongest_edges_caps_budget_deterministically():
+    """Test that the edge budget keeps the strongest edges in input order."""
+    strength = np.array([0.1, 0.9, 0.5, 0.9, 0.2])
+
+    assert _select_strongest_edges(strength, max_edges=2).tolist() == [1, 3]
+    assert _select_strongest_edges(strength, min_strength_percentile=50).tolist() == [1, 2, 3]
+    assert _select_strongest_edges(strength).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_visualize_3d_graph_reduced_level_of_detail_bounds_edges():
+    """Test that the reduced level of detail renders at most max_edges edges."""
+    graph = DummyGraph({"A": [("B", "correlation", 0.9), ("C", "correlation", 0.1), ("D", "same_sector", 0.5)]})
+
+    fig = visualize_3d_graph(graph, level_of_detail="reduced", max_edges=2)
+
+    edge_traces = [t for t in fig.data if t.mode == "lines"]
+    assert sum(len(t.x) for t in edge_traces) // 3 == 2
+    assert fig.data[-1].mode == "markers"
+
+
+def _rendered_edge_count(fig) -> int:
+    return sum(len(t.x) for t in fig.data if t.mode == "lines") // 3
+
+
+@pytest.mark.parametrize("visualize", [visualize_3d_graph, visualize_3d_graph_with_filters])
+def test_visualize_3d_graph_drops_edges_below_strength_percentile(visualize):
+    """Test that min_strength_percentile drops weak edges and their arrows through the public API."""
+    graph = DummyGraph(
+        {"A": [("B", "correlation", 0.9), ("C", "correlation", 0.1), ("D", "same_sector", 0.5), ("E", "x", 0.3)]}
+    )
+
+    fig = visualize(graph, level_of_detail="full", min_strength_percentile=50)
+
+    assert _rendered_edge_count(fig) == 2
+    arrows = next(t for t in fig.data if t.name == "Direction Arrows")
+    assert sorted(tuple(row[:2]) for row in arrows.customdata) == [("A", "B"), ("A", "D")]
+    # The percentile is part of the trace cache key
+    assert _rendered_edge_count(visualize(graph, level_of_detail="full")) == 4
+    reduced = visualize(graph, level_of_detail="reduced", max_edges=1, min_strength_percentile=50)
+    assert _rendered_edge_count(reduced) == 1
+
+
+def test_visualize_3d_graph_with_filters_spends_edge_budget_on_visible_types():
+    """Test that the edge budget and percentile only rank edges of the visible relationship types."""
+    graph = DummyGraph(
+        {
+            "A": [("B", "correlation", 0.9), ("C", "correlation", 0.8), ("D", "correlation", 0.7)],
+            "E": [("B", "same_sector", 0.3), ("C", "same_sector", 0.2), ("D", "same_sector", 0.1)],
+        }
+    )
+
+    hide_correlation = {"show_all_relationships": False, "show_correlation": False}
+
+    fig = visualize_3d_graph_with_filters(graph, level_of_detail="reduced", max_edges=2, **hide_correlation)
+    assert _rendered_edge_count(fig) == 2
+    assert {t.legendgroup for t in fig.data if t.mode == "lines"} == {"same_sector"}
+    arrows = next(t for t in fig.data if t.name == "Direction Arrows")
+    assert sorted(tuple(row[:2]) for row in arrows.customdata) == [("E", "B"), ("E", "C")]
+
+    fig = visualize_3d_graph_with_filters(graph, level_of_detail="full", min_strength_percentile=50, **hide_correlation)
+    assert _rendered_edge_count(fig) == 2
+
+    # The filters are part of the cache key of selected bundles
+    fig = visualize_3d_graph_with_filters(graph, level_of_detail="reduced", max_edges=2)
+    assert {t.legendgroup for t in fig.data if t.mode == "lines"} == {"correlation"}
+
+
+def test_visualize_3d_graph_invalid_strength_percentile():
+    """Test that percentiles outside 0-100 are rejected."""
+    with pytest.raises(ValueError, match="min_strength_percentile"):
+        visualize_3d_graph(DummyGraph({}), min_strength_percentile=150)
+
+
+def test_visualize_3d_graph_overview_collapses_sectors(populated_graph):
+    """Test that the overview level renders one meta-node per sector."""
+    fig = visualize_3d_graph(populated_graph, level_of_detail="overview")
+
+    node_trace = fig.data[-1]
+    assert set(node_trace.text) == {asset.sector for asset in populated_graph.assets.values()}
+    assert "Overview" in fig.layout.title.text
+
+
+def test_visualize_3d_graph_overview_by_asset_class(populated_graph):
+    """Test that the overview grouping can be switched to asset classes."""
+    fig = visualize_3d_graph(populated_graph, level_of_detail="overview", overview_group_by="asset_class")
+
+    node_trace = fig.data[-1]
+    assert set(node_trace.text) == {asset.asset_class.value for asset in populated_graph.assets.values()}
+
+
+def test_visualize_3d_graph_invalid_level_of_detail():
+    """Test that an unknown level of detail is rejected."""
+    with pytest.raises(ValueError, match="Invalid level_of_detail"):
+        visualize_3d_graph(DummyGraph({}), level_of_detail="tiny")
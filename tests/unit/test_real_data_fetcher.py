@@ -0,0 +1,268 @@
+"""Unit tests for the cache freshness policy and concurrent fetching of RealDataFetcher."""
+
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.data.fetch_pool import FetchPolicy
+from src.data.real_data_fetcher import RealDataFetcher, _save_to_cache
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import AssetClass, Equity
+
+
+def _graph(*asset_ids: str) -> AssetRelationshipGraph:
+    graph = AssetRelationshipGraph()
+    for asset_id in asset_ids:
+        graph.add_asset(
+            Equity(
+                id=asset_id,
+                symbol=asset_id,
+                name=f"{asset_id} Corp",
+                asset_class=AssetClass.EQUITY,
+                sector="Technology",
+                price=10.0,
+            )
+        )
+    return graph
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    """Write a cache holding asset CACHED, last modified an hour ago."""
+    path = tmp_path / "graph.graphsnap"
+    _save_to_cache(_graph("CACHED"), path)
+    an_hour_ago = time.time() - 3600
+    os.utime(path, (an_hour_ago, an_hour_ago))
+    return path
+
+
+def _fetcher(cache_path, **kwargs) -> RealDataFetcher:
+    return RealDataFetcher(cache_path=str(cache_path), fallback_factory=lambda: _graph("FALLBACK"), **kwargs)
+
+
+class TestCacheTTL:
+    """Test cases for synchronous use of the cache TTL."""
+
+    @staticmethod
+    def test_fresh_cache_is_served(cache_path):
+        """Test that a cache younger than the TTL is used without fetching."""
+        fetcher = _fetcher(cache_path, cache_ttl=7200)
+        with patch.object(RealDataFetcher, "_fetch_and_cache", side_effect=AssertionError):
+            graph = fetcher.create_real_database()
+
+        assert list(graph.assets) == ["CACHED"]
+        assert 3590 < fetcher.data_age() < 3700
+        assert not fetcher.is_stale()
+
+    @staticmethod
+    def test_stale_cache_is_refetched(cache_path):
+        """Test that without on_refresh a stale cache is refetched before returning."""
+        fetcher = _fetcher(cache_path, cache_ttl=60)
+        with patch.object(RealDataFetcher, "_fetch_and_cache", return_value=_graph("FRESH")):
+            assert list(fetcher.create_real_database().assets) == ["FRESH"]
+
+    @staticmethod
+    def test_failed_refetch_serves_stale_cache(cache_path):
+        """Test that stale data beats the fallback when the refetch fails."""
+        fetcher = _fetcher(cache_path, cache_ttl=60)
+        with patch.object(RealDataFetcher, "_fetch_and_cache", side_effect=RuntimeError("offline")):
+            assert list(fetcher.create_real_database().assets) == ["CACHED"]
+
+    @staticmethod
+    def test_empty_fetch_does_not_replace_stale_cache(cache_path):
+        """Test that a refetch returning no assets keeps the stale cache."""
+        fetcher = _fetcher(cache_path, cache_ttl=60)
+        with (
+            patch.object(RealDataFetcher, "_fetch_equity_data", return_value=[]),
+            patch.object(RealDataFetcher, "_fetch_bond_data", return_value=[]),
+            patch.object(RealDataFetcher, "_fetch_commodity_data", return_value=[]),
+            patch.object(RealDataFetcher, "_fetch_currency_data", return_value=[]),
+            patch.object(RealDataFetcher, "_fetch_and_cache", wraps=fetcher._fetch_and_cache) as fetch,
+        ):
+            assert list(fetcher.create_real_database().assets) == ["CACHED"]
+
+        fetch.assert_called_once_with(require_assets=True)
+        assert list(_fetcher(cache_path).create_real_database().assets) == ["CACHED"]
+
+    @staticmethod
+    def test_no_ttl_never_goes_stale(cache_path):
+        """Test that caches are used regardless of age without a TTL."""
+        fetcher = _fetcher(cache_path)
+
+        assert list(fetcher.create_real_database().assets) == ["CACHED"]
+        assert not fetcher.is_stale()
+
+
+class TestBackgroundRefresh:
+    """Test cases for stale-while-revalidate refreshes."""
+
+    @staticmethod
+    def test_stale_cache_is_served_while_refreshing(cache_path):
+        """Test that the stale graph is returned at once and the fresh one handed over later."""
+        release = threading.Event()
+        refreshed = []
+
+        def slow_fetch(self, require_assets=False):
+            release.wait(5)
+            self.data_timestamp = time.time()
+            return _graph("FRESH")
+
+        fetcher = _fetcher(cache_path, cache_ttl=60, on_refresh=refreshed.append)
+        with patch.object(RealDataFetcher, "_fetch_and_cache", slow_fetch):
+            graph = fetcher.create_real_database()
+            assert list(graph.assets) == ["CACHED"]
+            assert fetcher.refresh_metrics()["refresh_in_progress"]
+            assert not fetcher.refresh_in_background()
+
+            release.set()
+            fetcher.wait_for_refresh(5)
+
+        assert [list(graph.assets) for graph in refreshed] == [["FRESH"]]
+        metrics = fetcher.refresh_metrics()
+        assert metrics["refresh_count"] == 1
+        assert metrics["last_refresh_duration_seconds"] > 0
+        assert metrics["data_age_seconds"] < 60
+        assert not metrics["stale"]
+
+    @staticmethod
+    def test_missing_cache_serves_fallback(tmp_path):
+        """Test that without any cache the fallback is served while the first fetch runs."""
+        refreshed = []
+        fetcher = _fetcher(tmp_path / "missing.graphsnap", on_refresh=refreshed.append)
+        with patch.object(RealDataFetcher, "_fetch_and_cache", return_value=_graph("FRESH")):
+            assert list(fetcher.create_real_database().assets) == ["FALLBACK"]
+            fetcher.wait_for_refresh(5)
+
+        assert [list(graph.assets) for graph in refreshed] == [["FRESH"]]
+
+    @staticmethod
+    def test_failed_refresh_backs_off(cache_path):
+        """Test that a failed refresh keeps the data and is not retried at once."""
+        refreshed = []
+        fetcher = _fetcher(cache_path, cache_ttl=60, on_refresh=refreshed.append)
+        with patch.object(RealDataFetcher, "_fetch_and_cache", side_effect=RuntimeError("offline")):
+            fetcher.create_real_database()
+            fetcher.wait_for_refresh(5)
+
+            assert not fetcher.refresh_in_background()
+
+        assert refreshed == []
+        assert fetcher.refresh_metrics()["refresh_failures"] == 1
+        assert fetcher.is_stale()
+
+    @staticmethod
+    def test_fallback_is_refreshed_without_ttl(tmp_path):
+        """Test that without a TTL the fallback still counts as stale and failed refreshes are retried."""
+        refreshed = []
+        fetcher = _fetcher(tmp_path / "missing.graphsnap", on_refresh=refreshed.append)
+        with patch.object(RealDataFetcher, "_fetch_and_cache", side_effect=RuntimeError("offline")):
+            assert list(fetcher.create_real_database().assets) == ["FALLBACK"]
+            fetcher.wait_for_refresh(5)
+
+            assert fetcher.is_stale()
+            assert not fetcher.refresh_in_background()
+
+        fetcher._retry_at = 0.0
+        with patch.object(RealDataFetcher, "_fetch_and_cache", return_value=_graph("FRESH")):
+            assert fetcher.refresh_in_background()
+            fetcher.wait_for_refresh(5)
+
+        assert [list(graph.assets) for graph in refreshed] == [["FRESH"]]
+        assert fetcher.refresh_metrics()["refresh_failures"] == 1
+
+    @staticmethod
+    def test_no_refresh_without_network(cache_path):
+        """Test that disabled network access also disables refreshes."""
+        fetcher = _fetcher(cache_path, cache_ttl=60, enable_network=False, on_refresh=lambda graph: None)
+
+        assert list(fetcher.create_real_database().assets) == ["CACHED"]
+        assert not fetcher.refresh_in_background()
+
+
+class _StubTicker:
+    """Local stand-in for yfinance.Ticker that serves fixed prices after a delay."""
+
+    def __init__(self, symbol: str, delay: float = 0.0, failures: int = 0):
+        self.symbol = symbol
+        self.delay = delay
+        self.failures = failures
+        self.info = {"marketCap": 1_000_000}
+
+    def history(self, period: str) -> pd.DataFrame:
+        time.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError(f"{self.symbol} reset by peer")
+        if self.symbol == "XOM":
+            return pd.DataFrame()
+        return pd.DataFrame({"Close": [100.0, 101.0, 103.0]})
+
+
+@pytest.fixture
+def live_fetcher():
+    """Create cache-less fetchers reading stub tickers and close their pools after the test."""
+    fetchers = []
+
+    def make(ticker_factory=_StubTicker, **kwargs) -> RealDataFetcher:
+        fetchers.append(
+            RealDataFetcher(fallback_factory=lambda: _graph("FALLBACK"), ticker_factory=ticker_factory, **kwargs)
+        )
+        return fetchers[-1]
+
+    yield make
+    for fetcher in fetchers:
+        if fetcher.fetch_pool is not None:
+            fetcher.fetch_pool.close()
+
+
+class TestConcurrentFetch:
+    """Test cases for fetching symbols on a FetchPool from a stub data source."""
+
+    @staticmethod
+    def test_concurrent_fetch_matches_sequential(live_fetcher):
+        """Test that both modes build the same assets in the same order."""
+        expected = live_fetcher().create_real_database()
+        graph = live_fetcher(fetch_policy=FetchPolicy(backoff_base=0.01)).create_real_database()
+
+        assert list(graph.assets.items()) == list(expected.assets.items())
+        assert "XOM" not in graph.assets
+        assert len(graph.assets) == 12
+
+    @staticmethod
+    def test_symbols_and_classes_overlap(live_fetcher):
+        """Test that slow symbols of all classes are fetched at the same time."""
+        fetcher = live_fetcher(
+            ticker_factory=lambda symbol: _StubTicker(symbol, delay=0.1),
+            fetch_policy=FetchPolicy(max_workers=16, per_host_limit=16),
+        )
+
+        start = time.monotonic()
+        graph = fetcher.create_real_database()
+
+        # One after another, the 16 history calls would take 1.6 s
+        assert time.monotonic() - start < 0.8
+        assert len(graph.assets) == 12
+
+    @staticmethod
+    def test_transient_failures_are_retried(live_fetcher):
+        """Test that a symbol failing once is retried, while sequential mode skips it."""
+        tickers = {}
+
+        def flaky(symbol):
+            return tickers.setdefault(symbol, _StubTicker(symbol, failures=1 if symbol == "AAPL" else 0))
+
+        assert "AAPL" in live_fetcher(flaky, fetch_policy=FetchPolicy(backoff_base=0.01)).create_real_database().assets
+
+        tickers.clear()
+        assert "AAPL" not in live_fetcher(flaky).create_real_database().assets
+
+    @staticmethod
+    def test_class_failure_falls_back(live_fetcher):
+        """Test that an error escaping an asset class still selects the fallback."""
+        fetcher = live_fetcher(fetch_policy=FetchPolicy())
+        with patch.object(RealDataFetcher, "_fetch_bond_data", side_effect=RuntimeError("boom")):
+            assert list(fetcher.create_real_database().assets) == ["FALLBACK"]
@@ -8,12 +8,16 @@ This module contains comprehensive unit tests for the repository layer including
 - Query operations and filtering
 """
 
+import numpy as np
+import pandas as pd
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy import event as sa_event
 
-from src.data.database import create_session_factory, init_db
+from src.data.database import create_routing_session_factory, create_session_factory, init_db, session_scope
 from src.data.db_models import RegulatoryEventORM
 from src.data.repository import AssetGraphRepository, RelationshipRecord
+from src.logic.asset_graph import AssetRelationshipGraph
 from src.models.financial_models import (
     AssetClass,
     Bond,
@@ -41,6 +45,23 @@ def repository(tmp_path):
     engine.dispose()
 
 
+@pytest.fixture
+def priced_repository(repository):
+    """Create a repository holding assets A and B for price history tests."""
+    repository.upsert_assets(
+        Equity(
+            id=asset_id,
+            symbol=asset_id,
+            name=f"{asset_id} Corp",
+            asset_class=AssetClass.EQUITY,
+            sector="Technology",
+            price=10.0,
+        )
+        for asset_id in ("A", "B")
+    )
+    return repository
+
+
 class TestAssetOperations:
     """Test cases for asset CRUD operations."""
 
@@ -454,6 +475,732 @@ class TestRelationshipOperations:
         assert record.bidirectional is True
 
 
+class TestBulkUpserts:
+    """Test cases for the batched upsert methods."""
+
+    @staticmethod
+    def _equity(asset_id: str, price: float = 100.0) -> Equity:
+        return Equity(
+            id=asset_id,
+            symbol=asset_id,
+            name=f"{asset_id} Corp",
+            asset_class=AssetClass.EQUITY,
+            sector="Technology",
+            price=price,
+            pe_ratio=20.0,
+        )
+
+    def test_upsert_assets_inserts_and_updates(self, repository):
+        """Test that existing assets are updated and new ones inserted."""
+        repository.upsert_asset(self._equity("A", price=1.0))
+        repository.session.commit()
+
+        written = repository.upsert_assets(
+            [
+                self._equity("A", price=2.0),
+                Bond(
+                    id="B",
+                    symbol="B",
+                    name="Bond",
+                    asset_class=AssetClass.FIXED_INCOME,
+                    sector="Finance",
+                    price=99.0,
+                    coupon_rate=0.05,
+                ),
+            ]
+        )
+        repository.session.commit()
+
+        assets = repository.get_assets_map()
+        assert written == 2
+        assert assets["A"].price == 2.0
+        assert isinstance(assets["B"], Bond)
+        assert assets["B"].coupon_rate == 0.05
+
+    def test_upsert_assets_clears_stale_columns(self, repository):
+        """Test that optional columns absent from the new asset become NULL."""
+        repository.upsert_assets([self._equity("A")])
+        repository.session.commit()
+
+        repository.upsert_assets(
+            [
+                Equity(
+                    id="A",
+                    symbol="A",
+                    name="A Corp",
+                    asset_class=AssetClass.EQUITY,
+                    sector="Technology",
+                    price=100.0,
+                )
+            ]
+        )
+        repository.session.commit()
+
+        assert repository.get_assets_map()["A"].pe_ratio is None
+
+    def test_upsert_assets_in_batches(self, repository):
+        """Test that batching writes every asset and the last duplicate wins."""
+        assets = [self._equity(f"A{i:02d}", price=float(i)) for i in range(10)]
+        assets.append(self._equity("A00", price=42.0))
+
+        written = repository.upsert_assets(assets, batch_size=3)
+        repository.session.commit()
+
+        stored = repository.get_assets_map()
+        assert written == 11
+        assert len(stored) == 10
+        assert stored["A00"].price == 42.0
+
+    def test_upsert_relationships_inserts_and_updates(self, repository):
+        """Test that relationships conflict on source, target and type."""
+        repository.upsert_assets([self._equity("A"), self._equity("B")])
+        repository.add_or_update_relationship("A", "B", "correlation", 0.1, bidirectional=False)
+        repository.session.commit()
+
+        written = repository.upsert_relationships(
+            [
+                RelationshipRecord("A", "B", "correlation", 0.9, True),
+                RelationshipRecord("A", "B", "same_sector", 0.5, False),
+                RelationshipRecord("B", "A", "correlation", 0.3, False),
+            ],
+            batch_size=2,
+        )
+        repository.session.commit()
+
+        assert written == 3
+        assert len(repository.list_relationships()) == 3
+        updated = repository.get_relationship("A", "B", "correlation")
+        assert updated.strength == 0.9
+        assert updated.bidirectional is True
+
+    def test_upsert_refreshes_loaded_rows(self, repository):
+        """Test that rows already loaded in the session see bulk-written values."""
+        repository.upsert_assets([self._equity("A"), self._equity("B")])
+        repository.add_or_update_relationship("A", "B", "correlation", 0.1, bidirectional=False)
+        repository.session.commit()
+        assert repository.get_relationship("A", "B", "correlation").strength == 0.1
+
+        repository.upsert_relationships([RelationshipRecord("A", "B", "correlation", 0.7, False)])
+
+        assert repository.get_relationship("A", "B", "correlation").strength == 0.7
+
+    @staticmethod
+    def test_invalid_batch_size(repository):
+        """Test that a non-positive batch size is rejected."""
+        with pytest.raises(ValueError, match="batch_size"):
+            repository.upsert_assets([], batch_size=0)
+
+
+class TestLoadGraph:
+    """Test cases for hydrating an AssetRelationshipGraph from the database."""
+
+    @staticmethod
+    def _seed(repository):
+        repository.upsert_assets(
+            [
+                Equity(
+                    id=asset_id,
+                    symbol=asset_id,
+                    name=f"{asset_id} Corp",
+                    asset_class=AssetClass.EQUITY,
+                    sector="Technology",
+                    price=10.0,
+                )
+                for asset_id in ("A", "B", "C")
+            ]
+        )
+        repository.upsert_relationships(
+            [
+                RelationshipRecord("A", "B", "same_sector", 0.7, True),
+                RelationshipRecord("B", "A", "same_sector", 0.7, False),
+                RelationshipRecord("A", "C", "correlation", 0.4, False),
+            ]
+        )
+        repository.upsert_regulatory_event(
+            RegulatoryEvent(
+                id="EV1",
+                asset_id="A",
+                event_type=RegulatoryActivity.EARNINGS_REPORT,
+                date="2024-01-15",
+                description="Quarterly earnings",
+                impact_score=0.5,
+                related_assets=["B", "C"],
+            )
+        )
+        repository.session.commit()
+
+    def test_load_graph_matches_add_methods(self, repository):
+        """Test that the loaded graph equals one built through the graph API."""
+        self._seed(repository)
+
+        graph = repository.load_graph()
+
+        expected = AssetRelationshipGraph()
+        for asset in repository.list_assets():
+            expected.add_asset(asset)
+        for record in repository.list_relationships():
+            expected.add_relationship(
+                record.source_id,
+                record.target_id,
+                record.relationship_type,
+                record.strength,
+                bidirectional=record.bidirectional,
+            )
+        assert graph.assets == expected.assets
+        assert graph.relationships == expected.relationships
+        assert graph.regulatory_events == repository.list_regulatory_events()
+        assert graph.regulatory_events[0].related_assets == ["B", "C"]
+
+    def test_load_graph_uses_one_query_per_table(self, repository):
+        """Test that hydration does not lazy load per event."""
+        self._seed(repository)
+        statements = []
+        engine = repository.session.get_bind()
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        sa_event.listen(engine, "before_cursor_execute", listener)
+        try:
+            repository.load_graph()
+        finally:
+            sa_event.remove(engine, "before_cursor_execute", listener)
+
+        assert len(statements) == 4
+
+    @staticmethod
+    def test_load_empty_graph(repository):
+        """Test that an empty database yields an empty graph."""
+        graph = repository.load_graph()
+
+        assert graph.assets == {}
+        assert graph.relationships == {}
+        assert graph.regulatory_events == []
+
+
+class TestStreamingAndPagination:
+    """Test cases for streamed reads and keyset pagination."""
+
+    @staticmethod
+    def _seed(repository, num_assets=7):
+        ids = [f"A{i}" for i in range(num_assets)]
+        repository.upsert_assets(
+            Equity(
+                id=asset_id,
+                symbol=asset_id,
+                name=f"{asset_id} Corp",
+                asset_class=AssetClass.EQUITY,
+                sector="Technology",
+                price=10.0,
+            )
+            for asset_id in ids
+        )
+        repository.upsert_relationships(
+            RelationshipRecord(source, target, "correlation", 0.5, False)
+            for source in reversed(ids)
+            for target in ids
+            if source != target
+        )
+        for i in range(3):
+            repository.upsert_regulatory_event(
+                RegulatoryEvent(
+                    id=f"EV{i}",
+                    asset_id=ids[i],
+                    event_type=RegulatoryActivity.SEC_FILING,
+                    date="2024-01-15",
+                    description="Filing",
+                    impact_score=0.1,
+                    related_assets=ids[i + 1 : i + 3],
+                )
+            )
+        repository.session.commit()
+
+    def test_iterators_match_lists(self, repository):
+        """Test that streamed reads return the same records as the list methods."""
+        self._seed(repository)
+
+        assert list(repository.iter_assets(batch_size=2)) == repository.list_assets()
+        assert list(repository.iter_relationships(batch_size=5)) == repository.list_relationships()
+        assert list(repository.iter_regulatory_events(batch_size=1)) == repository.list_regulatory_events()
+
+    def test_page_assets_walks_table(self, repository):
+        """Test that following the cursor visits every asset once, in id order."""
+        self._seed(repository)
+        seen, cursor = [], None
+        while True:
+            page = repository.page_assets(after=cursor, limit=3)
+            seen.extend(asset.id for asset in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert seen == sorted(asset.id for asset in repository.list_assets())
+
+    def test_page_relationships_groups_by_source(self, repository):
+        """Test that relationship pages follow (source, id) order without gaps or repeats."""
+        self._seed(repository)
+        seen, cursor = [], None
+        while True:
+            page = repository.page_relationships(after=cursor, limit=4)
+            seen.extend((record.source_id, record.target_id) for record in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert len(seen) == len(set(seen)) == len(repository.list_relationships())
+        assert [source for source, _ in seen] == sorted(source for source, _ in seen)
+
+    def test_page_regulatory_events_include_related_assets(self, repository):
+        """Test that paged events carry their related assets."""
+        self._seed(repository)
+
+        first = repository.page_regulatory_events(limit=2)
+        second = repository.page_regulatory_events(after=first.next_cursor, limit=2)
+
+        assert [event.id for event in first.items + second.items] == ["EV0", "EV1", "EV2"]
+        assert first.items[0].related_assets == ["A1", "A2"]
+        assert second.next_cursor is None
+
+    @staticmethod
+    def test_invalid_sizes(repository):
+        """Test that non-positive batch sizes and limits are rejected."""
+        with pytest.raises(ValueError, match="batch_size"):
+            list(repository.iter_assets(batch_size=0))
+        with pytest.raises(ValueError, match="limit"):
+            repository.page_assets(limit=0)
+
+
+class TestNeighbourhood:
+    """Test cases for the recursive neighbourhood traversal."""
+
+    @staticmethod
+    def _seed(repository):
+        repository.upsert_assets(
+            Equity(
+                id=asset_id,
+                symbol=asset_id,
+                name=f"{asset_id} Corp",
+                asset_class=AssetClass.EQUITY,
+                sector="Technology",
+                price=10.0,
+            )
+            for asset_id in "ABCDEF"
+        )
+        repository.upsert_relationships(
+            [
+                # A -> B -> C -> A is a cycle
+                RelationshipRecord("A", "B", "correlation", 0.9, False),
+                RelationshipRecord("B", "C", "correlation", 0.8, False),
+                RelationshipRecord("C", "A", "correlation", 0.7, False),
+                # Reached from C only because it is bidirectional
+                RelationshipRecord("D", "C", "same_sector", 0.5, True),
+                RelationshipRecord("D", "E", "correlation", 0.1, False),
+                # Points into the neighbourhood but is never followed
+                RelationshipRecord("F", "A", "correlation", 0.6, False),
+            ]
+        )
+        repository.session.commit()
+
+    @staticmethod
+    def _edges(records):
+        return [(record.source_id, record.target_id) for record in records]
+
+    @pytest.mark.parametrize(
+        "depth, expected",
+        [
+            (0, []),
+            (1, [("A", "B")]),
+            (2, [("A", "B"), ("B", "C")]),
+            (3, [("A", "B"), ("B", "C"), ("C", "A"), ("D", "C")]),
+            (4, [("A", "B"), ("B", "C"), ("C", "A"), ("D", "C"), ("D", "E")]),
+            (10, [("A", "B"), ("B", "C"), ("C", "A"), ("D", "C"), ("D", "E")]),
+        ],
+    )
+    def test_depth_limits_the_traversal(self, repository, depth, expected):
+        """Test that each hop adds the edges leaving the newly reached assets."""
+        self._seed(repository)
+
+        assert self._edges(repository.neighbourhood("A", depth)) == expected
+
+    def test_filters(self, repository):
+        """Test that relationship type and strength filters prune the traversal."""
+        self._seed(repository)
+
+        assert self._edges(repository.neighbourhood("A", 5, rel_types=["correlation"])) == [
+            ("A", "B"),
+            ("B", "C"),
+            ("C", "A"),
+        ]
+        assert self._edges(repository.neighbourhood("A", 5, min_strength=0.75)) == [("A", "B"), ("B", "C")]
+
+    def test_returns_full_records(self, repository):
+        """Test that the subgraph rows carry all relationship fields."""
+        self._seed(repository)
+
+        records = repository.neighbourhood("C", 1)
+
+        assert records == [
+            RelationshipRecord("C", "A", "correlation", 0.7, False),
+            RelationshipRecord("D", "C", "same_sector", 0.5, True),
+        ]
+
+    @staticmethod
+    def test_unknown_asset_and_negative_depth(repository):
+        """Test that unknown assets have no neighbourhood and negative depths are rejected."""
+        assert repository.neighbourhood("MISSING", 3) == []
+        with pytest.raises(ValueError):
+            repository.neighbourhood("A", -1)
+
+
+class TestMetrics:
+    """Test cases for the SQL-side graph metrics."""
+
+    @staticmethod
+    def _seed(repository):
+        repository.upsert_assets(
+            Equity(
+                id=asset_id,
+                symbol=asset_id,
+                name=f"{asset_id} Corp",
+                asset_class=AssetClass.EQUITY,
+                sector="Technology",
+                price=10.0,
+            )
+            for asset_id in "ABCDE"
+        )
+        repository.upsert_asset(
+            Bond(
+                id="F",
+                symbol="F",
+                name="F Bond",
+                asset_class=AssetClass.FIXED_INCOME,
+                sector="Technology",
+                price=99.0,
+            )
+        )
+        repository.upsert_relationships(
+            [
+                # Reverse B->A is added before the explicit B->A row, which is then ignored
+                RelationshipRecord("A", "B", "correlation", 0.9, True),
+                RelationshipRecord("B", "A", "correlation", 0.3, False),
+                # Reverse C->D collides with the earlier explicit C->D row
+                RelationshipRecord("C", "D", "same_sector", 0.5, False),
+                RelationshipRecord("D", "C", "same_sector", 0.6, True),
+                # Bidirectional self-loop adds a single edge
+                RelationshipRecord("E", "E", "self", 0.4, True),
+                RelationshipRecord("A", "C", "event_impact", 0.8, False),
+                RelationshipRecord("F", "A", "corporate_link", 0.95, False),
+            ]
+        )
+        repository.upsert_regulatory_event(
+            RegulatoryEvent(
+                id="EV1",
+                asset_id="A",
+                event_type=RegulatoryActivity.EARNINGS_REPORT,
+                date="2024-01-15",
+                description="Quarterly earnings",
+                impact_score=0.5,
+                related_assets=["B"],
+            )
+        )
+        repository.session.commit()
+
+    def test_metrics_match_hydrated_graph(self, repository):
+        """Test that SQL metrics equal calculate_metrics on the loaded graph."""
+        self._seed(repository)
+
+        metrics = repository.calculate_metrics()
+        expected = repository.load_graph().calculate_metrics()
+
+        assert metrics.pop("average_relationship_strength") == pytest.approx(
+            expected.pop("average_relationship_strength")
+        )
+        assert metrics == expected
+        assert metrics["total_relationships"] == 7
+        assert metrics["asset_class_distribution"] == {"Equity": 5, "Fixed Income": 1}
+
+    def test_top_edges_limit_skips_duplicate_edges(self, repository):
+        """Test that the top edges are cut after the duplicates are removed in SQL."""
+        self._seed(repository)
+        graph = repository.load_graph()
+        expected = sorted(
+            (
+                (source_id, target_id, rel_type, strength)
+                for source_id, rels in graph.relationships.items()
+                for target_id, rel_type, strength in rels
+            ),
+            key=lambda edge: (-edge[3], edge[0], edge[1], edge[2]),
+        )
+        connection = repository.session.connection()
+        edges = AssetGraphRepository._graph_edges().subquery("edges")
+
+        for limit in range(1, len(expected) + 2):
+            assert AssetGraphRepository._top_edges(connection, edges, limit) == expected[:limit]
+
+    def test_degree_statistics_match_api(self, repository):
+        """Test that degree statistics follow the /api/metrics definition."""
+        self._seed(repository)
+        graph = repository.load_graph()
+        degrees = {}
+        for source_id, rels in graph.relationships.items():
+            degrees[source_id] = degrees.get(source_id, 0) + len(rels)
+            for target_id, _, _ in rels:
+                degrees[target_id] = degrees.get(target_id, 0) + 1
+
+        stats = repository.degree_statistics()
+
+        assert stats["avg_degree"] == pytest.approx(sum(degrees.values()) / len(graph.assets))
+        assert stats["max_degree"] == max(degrees.values())
+
+    @staticmethod
+    def test_empty_database(repository):
+        """Test that an empty database reports zero metrics."""
+        assert repository.calculate_metrics() == AssetRelationshipGraph().calculate_metrics()
+        assert repository.degree_statistics() == {"avg_degree": 0.0, "max_degree": 0}
+
+
+class TestChangeJournal:
+    """Test cases for the change-data-capture journal."""
+
+    @staticmethod
+    @pytest.fixture
+    def repository(repository):
+        """Enable the change journal, which is off by default."""
+        repository.journal_changes = True
+        return repository
+
+    @staticmethod
+    def _equity(asset_id, price=10.0):
+        return Equity(
+            id=asset_id,
+            symbol=asset_id,
+            name=f"{asset_id} Corp",
+            asset_class=AssetClass.EQUITY,
+            sector="Technology",
+            price=price,
+        )
+
+    def test_mutations_are_journalled_in_order(self, repository):
+        """Test that every write appends an entry with its key and row."""
+        repository.upsert_asset(self._equity("A"))
+        repository.upsert_assets([self._equity("B"), self._equity("B", price=12.0)])
+        repository.add_or_update_relationship("A", "B", "same_sector", 0.7, bidirectional=True)
+        repository.upsert_relationships([RelationshipRecord("B", "A", "correlation", 0.4, False)])
+        repository.upsert_regulatory_event(
+            RegulatoryEvent(
+                id="EV1",
+                asset_id="A",
+                event_type=RegulatoryActivity.EARNINGS_REPORT,
+                date="2024-01-15",
+                description="Quarterly earnings",
+                impact_score=0.5,
+                related_assets=["B"],
+            )
+        )
+        repository.session.commit()
+        repository.delete_relationship("A", "B", "same_sector")
+        repository.delete_regulatory_event("EV1")
+        repository.delete_asset("B")
+        repository.delete_asset("MISSING")
+        repository.session.commit()
+
+        changes = repository.changes_since()
+
+        assert [change.seq for change in changes] == sorted({change.seq for change in changes})
+        assert [(change.entity, change.operation, change.key) for change in changes] == [
+            ("asset", "upsert", ["A"]),
+            ("asset", "upsert", ["B"]),
+            ("relationship", "upsert", ["A", "B", "same_sector"]),
+            ("relationship", "upsert", ["B", "A", "correlation"]),
+            ("regulatory_event", "upsert", ["EV1"]),
+            ("relationship", "delete", ["A", "B", "same_sector"]),
+            ("regulatory_event", "delete", ["EV1"]),
+            ("asset", "delete", ["B"]),
+        ]
+        assert changes[1].data["price"] == 12.0
+        assert changes[3].data == {
+            "source_asset_id": "B",
+            "target_asset_id": "A",
+            "relationship_type": "correlation",
+            "strength": 0.4,
+            "bidirectional": False,
+        }
+        assert changes[4].data["related_assets"] == ["B"]
+        assert changes[-1].data is None
+        assert repository.latest_change_seq() == changes[-1].seq
+
+    def test_changes_since_returns_only_the_delta(self, repository):
+        """Test that consumers can tail the journal from their last sequence number."""
+        repository.upsert_assets(self._equity(f"A{i}") for i in range(5))
+        repository.session.commit()
+        last_seq = repository.latest_change_seq()
+        repository.upsert_asset(self._equity("A1", price=20.0))
+        repository.session.commit()
+
+        delta = repository.changes_since(last_seq)
+        first_page = repository.changes_since(0, limit=2)
+
+        assert [(change.key, change.data["price"]) for change in delta] == [(["A1"], 20.0)]
+        assert [change.key for change in first_page] == [["A0"], ["A1"]]
+        assert [change.key for change in repository.changes_since(first_page[-1].seq, limit=2)] == [["A2"], ["A3"]]
+        with pytest.raises(ValueError):
+            repository.changes_since(0, limit=0)
+
+    def test_journal_is_opt_in(self, tmp_path):
+        """Test that a default repository writes no journal entries."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'plain.db'}")
+        init_db(engine)
+        with session_scope(create_session_factory(engine)) as session:
+            repository = AssetGraphRepository(session)
+            repository.upsert_assets([self._equity("A"), self._equity("B")])
+            repository.delete_asset("A")
+
+            assert repository.changes_since() == []
+        engine.dispose()
+
+    def test_rollback_discards_journal_entries(self, repository):
+        """Test that entries share the transaction of the write they describe."""
+        repository.upsert_asset(self._equity("A"))
+        repository.session.rollback()
+
+        assert repository.changes_since() == []
+        assert repository.latest_change_seq() == 0
+
+
+class TestPriceHistory:
+    """Test cases for the price history table."""
+
+    @staticmethod
+    def test_arrays_round_trip(priced_repository):
+        """Test that NumPy bars come back as per-asset arrays in date order."""
+        dates = np.array(["2024-01-03", "2024-01-01", "2024-01-02"], dtype="datetime64[D]")
+        written = priced_repository.upsert_price_history(
+            "A", dates, close=np.array([3.0, 1.0, 2.0]), volume=np.array([30.0, np.nan, 20.0])
+        )
+        priced_repository.upsert_price_history("B", ["2024-01-01"], close=[5.0])
+        priced_repository.session.commit()
+
+        history = priced_repository.price_history(fields=("close", "volume"))
+
+        assert written == 3
+        assert sorted(history) == ["A", "B"]
+        np.testing.assert_array_equal(history["A"].dates, np.sort(dates))
+        np.testing.assert_array_equal(history["A"].values["close"], [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(history["A"].values["volume"], [np.nan, 20.0, 30.0])
+        assert history["A"].values["close"].dtype == np.float64
+
+    @staticmethod
+    def test_frame_ingestion_and_range_reads(priced_repository):
+        """Test that a long-format DataFrame is stored and read back by asset and date range."""
+        days = pd.bdate_range("2024-01-01", periods=10)
+        frame = pd.DataFrame(
+            {
+                "asset_id": np.repeat(["A", "B"], len(days)),
+                "date": np.tile(days, 2),
+                "close": np.arange(20, dtype=float),
+            }
+        )
+
+        assert priced_repository.upsert_price_frame(frame, batch_size=3) == 20
+        history = priced_repository.price_history(["B", "MISSING"], start=days[2].date(), end="2024-01-08")
+
+        assert list(history) == ["B"]
+        np.testing.assert_array_equal(history["B"].dates, days[2:6].values.astype("datetime64[D]"))
+        np.testing.assert_array_equal(history["B"].values["close"], [12.0, 13.0, 14.0, 15.0])
+
+    @staticmethod
+    def test_upsert_keeps_fields_not_passed(priced_repository):
+        """Test that re-ingesting a bar replaces only the fields passed."""
+        priced_repository.upsert_price_history("A", ["2024-01-01"], close=[1.0], open=[0.5])
+        priced_repository.upsert_price_history("A", ["2024-01-01", "2024-01-01"], close=[2.0, 3.0])
+
+        series = priced_repository.price_history(["A"], fields=("open", "close"))["A"]
+
+        assert len(series.dates) == 1
+        assert series.values["open"].tolist() == [0.5]
+        assert series.values["close"].tolist() == [3.0]
+
+    @staticmethod
+    def test_delete_asset_removes_its_history(priced_repository):
+        """Test that deleting an asset also deletes its bars."""
+        priced_repository.upsert_price_history(["A", "B"], ["2024-01-01", "2024-01-01"], close=[1.0, 2.0])
+        priced_repository.session.commit()
+
+        priced_repository.delete_asset("A")
+        priced_repository.session.commit()
+
+        assert list(priced_repository.price_history()) == ["B"]
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"dates": ["2024-01-01", "2024-01-02"], "close": [1.0]},
+            {"dates": ["2024-01-01"], "close": [np.nan]},
+            {"dates": [None], "close": [1.0]},
+        ],
+    )
+    def test_invalid_bars_are_rejected(priced_repository, kwargs):
+        """Test that misaligned arrays, NaN closes and missing dates raise ValueError."""
+        with pytest.raises(ValueError):
+            priced_repository.upsert_price_history("A", **kwargs)
+
+    @staticmethod
+    def test_unknown_field_is_rejected(repository):
+        """Test that reading an unknown bar field raises ValueError."""
+        with pytest.raises(ValueError):
+            repository.price_history(fields=("adjusted_close",))
+
+
+class TestReplicaRouting:
+    """Test cases for repositories on read/write routing sessions."""
+
+    @staticmethod
+    @pytest.fixture
+    def routing_factory(tmp_path):
+        """Create a routing session factory whose primary and replica hold different assets."""
+        engines = []
+        for name in ("primary", "replica"):
+            engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+            init_db(engine)
+            with session_scope(create_session_factory(engine)) as session:
+                AssetGraphRepository(session).upsert_asset(
+                    Equity(
+                        id=name,
+                        symbol=name,
+                        name=name,
+                        asset_class=AssetClass.EQUITY,
+                        sector="Technology",
+                        price=1.0,
+                    )
+                )
+            engines.append(engine)
+        yield create_routing_session_factory(engines[0], engines[1:])
+        for engine in engines:
+            engine.dispose()
+
+    @staticmethod
+    def test_reads_use_the_replica(routing_factory):
+        """Test that ORM and Core reads are served by the replica."""
+        with session_scope(routing_factory) as session:
+            repository = AssetGraphRepository(session)
+
+            assert [asset.id for asset in repository.list_assets()] == ["replica"]
+            assert list(repository.load_graph().assets) == ["replica"]
+            assert repository.calculate_metrics()["total_assets"] == 1
+
+    @staticmethod
+    def test_writes_go_to_the_primary_and_stay_visible(routing_factory):
+        """Test that a write and the reads after it use the primary."""
+        with session_scope(routing_factory) as session:
+            repository = AssetGraphRepository(session)
+            repository.add_or_update_relationship("primary", "primary", "self", 1.0, bidirectional=False)
+            session.flush()
+
+            assert [asset.id for asset in repository.iter_assets()] == ["primary"]
+            assert len(repository.list_relationships()) == 1
+
+
 class TestRegulatoryEventOperations:
     """Test cases for regulatory event handling."""
 
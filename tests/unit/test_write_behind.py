@@ -0,0 +1,290 @@
+"""Unit tests for the write-behind persistence of graph mutations."""
+
+import logging
+import time
+
+import pytest
+from sqlalchemy import create_engine
+
+from src.data.database import create_engine_from_url, create_session_factory, init_db, session_scope
+from src.data.repository import AssetGraphRepository, RelationshipRecord
+from src.data.write_behind import WriteBehindWriter
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import AssetClass, Equity, RegulatoryActivity, RegulatoryEvent
+
+
+def _equity(asset_id: str, price: float = 10.0, sector: str = "Technology") -> Equity:
+    return Equity(
+        id=asset_id,
+        symbol=asset_id,
+        name=f"{asset_id} Corp",
+        asset_class=AssetClass.EQUITY,
+        sector=sector,
+        price=price,
+    )
+
+
+def _event(event_id: str, asset_id: str, related_assets) -> RegulatoryEvent:
+    return RegulatoryEvent(
+        id=event_id,
+        asset_id=asset_id,
+        event_type=RegulatoryActivity.EARNINGS_REPORT,
+        date="2024-01-15",
+        description="Earnings",
+        impact_score=0.5,
+        related_assets=list(related_assets),
+    )
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """Create a session factory on a fresh SQLite database that enforces foreign keys."""
+    engine = create_engine_from_url(f"sqlite:///{tmp_path / 'write_behind.db'}")
+    init_db(engine)
+    yield create_session_factory(engine)
+    engine.dispose()
+
+
+def _asset_ids(session_factory):
+    with session_scope(session_factory) as session:
+        return [asset.id for asset in AssetGraphRepository(session).list_assets()]
+
+
+class TestWriteBehindWriter:
+    """Test cases for the journal and its flush triggers."""
+
+    @staticmethod
+    def test_size_trigger_flushes_in_background(session_factory):
+        """Test that reaching batch_size wakes the background thread."""
+        with WriteBehindWriter(session_factory, batch_size=3, flush_interval=60) as writer:
+            writer.record_asset(_equity("A"))
+            writer.record_asset(_equity("B"))
+            time.sleep(0.05)
+            assert _asset_ids(session_factory) == []
+
+            writer.record_asset(_equity("C"))
+            assert _wait_for(lambda: _asset_ids(session_factory) == ["A", "B", "C"])
+            assert len(writer) == 0
+
+    @staticmethod
+    def test_time_trigger_flushes_in_background(session_factory):
+        """Test that pending entries are written once flush_interval has passed."""
+        with WriteBehindWriter(session_factory, batch_size=1_000, flush_interval=0.05) as writer:
+            writer.record_asset(_equity("A"))
+
+            assert _wait_for(lambda: _asset_ids(session_factory) == ["A"])
+
+    @staticmethod
+    def test_close_flushes_and_rejects_new_entries(session_factory):
+        """Test that close() writes the remaining journal and closes it."""
+        writer = WriteBehindWriter(session_factory, flush_interval=60)
+        writer.record_asset(_equity("A"))
+        writer.record_asset(_equity("B"))
+        writer.record_relationship("A", "B", "same_sector", 0.7, True)
+        writer.record_regulatory_event(
+            RegulatoryEvent(
+                id="EV1",
+                asset_id="A",
+                event_type=RegulatoryActivity.EARNINGS_REPORT,
+                date="2024-01-15",
+                description="Quarterly earnings",
+                impact_score=0.5,
+                related_assets=["B"],
+            )
+        )
+
+        writer.close()
+        writer.close()
+
+        with session_scope(session_factory) as session:
+            repository = AssetGraphRepository(session)
+            assert [asset.id for asset in repository.list_assets()] == ["A", "B"]
+            assert repository.list_relationships() == [RelationshipRecord("A", "B", "same_sector", 0.7, True)]
+            assert repository.list_regulatory_events()[0].related_assets == ["B"]
+        with pytest.raises(RuntimeError):
+            writer.record_asset(_equity("C"))
+
+    @staticmethod
+    def test_repeated_writes_collapse(session_factory):
+        """Test that only the latest version of an entry is written."""
+        with WriteBehindWriter(session_factory, flush_interval=60) as writer:
+            writer.record_asset(_equity("A", price=1.0))
+            writer.record_asset(_equity("A", price=2.0))
+
+            assert len(writer) == 1
+            assert writer.flush() == 1
+
+        with session_scope(session_factory) as session:
+            assert AssetGraphRepository(session).list_assets()[0].price == 2.0
+
+    @staticmethod
+    def test_failed_flush_keeps_entries(session_factory):
+        """Test that entries survive a failed flush without overriding newer ones."""
+        calls = []
+
+        def flaky_factory():
+            calls.append(None)
+            if len(calls) == 1:
+                raise RuntimeError("database unavailable")
+            return session_factory()
+
+        with WriteBehindWriter(flaky_factory, flush_interval=60) as writer:
+            writer.record_asset(_equity("A", price=1.0))
+            writer.record_asset(_equity("B"))
+            with pytest.raises(RuntimeError):
+                writer.flush()
+            assert len(writer) == 2
+
+            writer.record_asset(_equity("A", price=3.0))
+            writer.flush()
+
+        with session_scope(session_factory) as session:
+            assert [(asset.id, asset.price) for asset in AssetGraphRepository(session).list_assets()] == [
+                ("A", 3.0),
+                ("B", 10.0),
+            ]
+
+    @staticmethod
+    def test_orphaned_entries_are_dropped(session_factory, caplog):
+        """Test that entries referencing unknown assets are dropped instead of failing the batch."""
+        with WriteBehindWriter(session_factory, flush_interval=60) as writer:
+            writer.record_asset(_equity("A"))
+            writer.flush()
+
+            writer.record_asset(_equity("B"))
+            writer.record_relationship("A", "B", "same_sector", 0.7, True)
+            writer.record_relationship("A", "ZZZ", "same_sector", 0.5, False)
+            writer.record_regulatory_event(_event("E1", "A", ["B"]))
+            writer.record_regulatory_event(_event("E2", "A", ["ZZZ"]))
+            with caplog.at_level(logging.WARNING, logger="src.data.write_behind"):
+                assert writer.flush() == 3
+
+            assert len(writer) == 0
+
+        assert "A -> ZZZ" in caplog.text
+        assert "Dropping regulatory event E2" in caplog.text
+        with session_scope(session_factory) as session:
+            persisted = AssetGraphRepository(session).load_graph()
+        assert sorted(persisted.assets) == ["A", "B"]
+        assert persisted.relationships == {"A": [("B", "same_sector", 0.7)], "B": [("A", "same_sector", 0.7)]}
+        assert [event.id for event in persisted.regulatory_events] == ["E1"]
+
+    @staticmethod
+    def test_exit_hook_logs_failed_flush(session_factory, caplog):
+        """Test that the interpreter exit hook logs a failing final flush instead of raising."""
+
+        def broken_factory():
+            raise RuntimeError("database unavailable")
+
+        writer = WriteBehindWriter(broken_factory, flush_interval=60)
+        writer.record_asset(_equity("A"))
+        with caplog.at_level(logging.ERROR, logger="src.data.write_behind"):
+            writer._close_at_exit()
+
+        assert "1 entries were not persisted" in caplog.text
+
+    @staticmethod
+    def test_rejects_invalid_settings(session_factory):
+        """Test that batch_size and flush_interval are validated."""
+        with pytest.raises(ValueError):
+            WriteBehindWriter(session_factory, batch_size=0)
+        with pytest.raises(ValueError):
+            WriteBehindWriter(session_factory, flush_interval=0)
+
+
+class TestGraphWriteBehind:
+    """Test cases for graphs persisting through a write-behind writer."""
+
+    @staticmethod
+    def test_graph_mutations_reach_the_database(tmp_path):
+        """Test that a graph with a write-behind writer persists what is added to it."""
+        database_url = f"sqlite:///{tmp_path / 'graph.db'}"
+        graph = AssetRelationshipGraph(database_url, write_behind=WriteBehindWriter.from_url(database_url))
+        graph.add_asset(_equity("A"))
+        graph.add_asset(_equity("B"))
+        graph.build_relationships()
+        graph.write_behind.close()
+
+        engine = create_engine(database_url)
+        with session_scope(create_session_factory(engine)) as session:
+            persisted = AssetGraphRepository(session).load_graph()
+        engine.dispose()
+
+        assert sorted(persisted.assets) == ["A", "B"]
+        assert persisted.relationships == graph.relationships
+
+    @staticmethod
+    def test_duplicate_relationships_are_not_journalled(tmp_path):
+        """Test that re-adding a relationship the graph skipped leaves the stored strength alone."""
+        database_url = f"sqlite:///{tmp_path / 'graph.db'}"
+        graph = AssetRelationshipGraph(database_url, write_behind=WriteBehindWriter.from_url(database_url))
+        for asset_id in ("A", "B", "C"):
+            graph.add_asset(_equity(asset_id))
+        graph.add_relationship("A", "B", "correlation", 0.5)
+        graph.add_relationship("A", "B", "correlation", 0.9)
+        graph.add_relationship("A", "B", "correlation", 0.8, bidirectional=True)
+        graph.add_relationship("A", "C", "correlation", 0.3, bidirectional=True)
+        graph.add_relationship("C", "A", "correlation", 0.6, bidirectional=True)
+        graph.write_behind.close()
+
+        engine = create_engine(database_url)
+        with session_scope(create_session_factory(engine)) as session:
+            persisted = AssetGraphRepository(session).load_graph()
+        engine.dispose()
+
+        assert persisted.relationships == {
+            "A": [("B", "correlation", 0.5), ("C", "correlation", 0.3)],
+            "B": [("A", "correlation", 0.8)],
+            "C": [("A", "correlation", 0.3)],
+        }
+        assert {source_id: sorted(rels) for source_id, rels in persisted.relationships.items()} == {
+            source_id: sorted(rels) for source_id, rels in graph.relationships.items()
+        }
+
+    @staticmethod
+    def test_rebuild_deletes_dropped_relationships(tmp_path):
+        """Test that rebuilding after removing an asset or a sector match leaves no stale rows."""
+        database_url = f"sqlite:///{tmp_path / 'graph.db'}"
+        graph = AssetRelationshipGraph(
+            database_url, write_behind=WriteBehindWriter.from_url(database_url, journal_changes=True)
+        )
+        for asset_id in ("A", "B", "C"):
+            graph.add_asset(_equity(asset_id))
+        graph.add_regulatory_event(_event("E1", "A", ["C"]))
+        graph.build_relationships()
+        graph.write_behind.flush()
+
+        del graph.assets["C"]
+        graph.add_asset(_equity("B", sector="Energy"))
+        graph.build_relationships()
+        graph.write_behind.close()
+
+        engine = create_engine(database_url)
+        with session_scope(create_session_factory(engine)) as session:
+            persisted = AssetGraphRepository(session).load_graph()
+            changes = AssetGraphRepository(session).changes_since()
+        engine.dispose()
+
+        assert graph.relationships == {}
+        assert persisted.relationships == graph.relationships
+        assert {tuple(change.key) for change in changes if change.operation == "delete"} == {
+            ("A", "B", "same_sector"),
+            ("A", "C", "same_sector"),
+            ("B", "C", "same_sector"),
+            ("A", "C", "event_impact"),
+        }
+
+    @staticmethod
+    def test_database_url_alone_does_not_start_a_writer(tmp_path):
+        """Test that write-behind persistence is opt-in."""
+        assert AssetRelationshipGraph().write_behind is None
+        assert AssetRelationshipGraph(database_url=f"sqlite:///{tmp_path / 'graph.db'}").write_behind is None